@@ -31,6 +31,9 @@ from src.config import get_settings
 from src.database import ArticleRepository
 from src.models import ArticleSource, SourceCategory
 from src.rss.feed_service import FeedService, FeedServiceV2
+from src.scrapers.base import close_http_cache, close_shared_client
+from src.scrapers.driver_pool import shutdown_driver_pool
+from src.scrapers.html import shutdown_parse_pool
 from src.services.scheduler import NewsScheduler
 from src.utils.logging import RequestIdMiddleware, configure_structlog, get_logger
 from src.utils.metrics import auto_init_metrics, get_metrics_text
@@ -110,6 +113,10 @@ async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
 
     # Cleanup
     scheduler.stop()
+    shutdown_parse_pool()
+    await shutdown_driver_pool()
+    await close_shared_client()
+    await close_http_cache()
     await repository.close()
     logger.info("Server shutdown complete")
 
@@ -7,6 +7,8 @@ official League of Legends Next.js API endpoints.
 
 import logging
 import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 
@@ -28,16 +30,43 @@ class LoLNewsAPIClient:
     including build ID discovery and article parsing.
     """
 
-    def __init__(self, base_url: str | None = None, cache: TTLCache | None = None) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        cache: TTLCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         """
         Initialize the API client.
 
         Args:
             base_url: Base URL for LoL website (defaults to settings)
             cache: Optional TTLCache instance for caching build IDs
+            http_client: Optional long-lived HTTP client to reuse keep-alive
+                connections across requests (a one-off client is opened per
+                request otherwise)
         """
         self.base_url = base_url or settings.lol_news_base_url
         self.cache = cache or TTLCache(default_ttl_seconds=settings.build_id_cache_seconds)
+        self.http_client = http_client
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Get the HTTP client for a request.
+
+        Yields the injected client while it is open; otherwise opens a
+        one-off client that is closed afterwards.
+
+        Yields:
+            httpx.AsyncClient to send requests with
+        """
+        if self.http_client is not None and not self.http_client.is_closed:
+            yield self.http_client
+            return
+
+        async with httpx.AsyncClient(timeout=settings.http_timeout_seconds) as client:
+            yield client
 
     async def get_build_id(self, locale: str = "en-us") -> str:
         """
@@ -63,10 +92,12 @@ class LoLNewsAPIClient:
             return str(cached)
 
         # Fetch HTML page
-        async with httpx.AsyncClient(timeout=settings.http_timeout_seconds) as client:
+        async with self._client() as client:
             url = f"{self.base_url}/{locale}/news/"
             logger.info(f"Fetching buildId from: {url}")
-            response = await client.get(url, follow_redirects=True)
+            response = await client.get(
+                url, follow_redirects=True, timeout=settings.http_timeout_seconds
+            )
             response.raise_for_status()
 
         # Extract buildId using regex
@@ -105,9 +136,11 @@ class LoLNewsAPIClient:
             api_url = f"{self.base_url}/_next/data/{build_id}/{locale}/news.json"
 
             # Fetch JSON data
-            async with httpx.AsyncClient(timeout=settings.http_timeout_seconds) as client:
+            async with self._client() as client:
                 logger.info(f"Fetching news from: {api_url}")
-                response = await client.get(api_url, follow_redirects=True)
+                response = await client.get(
+                    api_url, follow_redirects=True, timeout=settings.http_timeout_seconds
+                )
 
                 # If 404, buildID might be stale - invalidate cache and retry once
                 if response.status_code == 404:
@@ -119,7 +152,9 @@ class LoLNewsAPIClient:
                     build_id = await self.get_build_id(locale)
                     api_url = f"{self.base_url}/_next/data/{build_id}/{locale}/news.json"
                     logger.info(f"Retrying with fresh buildId: {api_url}")
-                    response = await client.get(api_url, follow_redirects=True)
+                    response = await client.get(
+                        api_url, follow_redirects=True, timeout=settings.http_timeout_seconds
+                    )
 
                 response.raise_for_status()
                 data = response.json()
@@ -204,6 +204,32 @@ class Settings(BaseSettings):
             raise ValueError(f"cache_backend must be one of {valid_backends}, got '{v}'")
         return v
 
+    redis_serializer: str = Field(
+        default="json",
+        description="Encoding of Redis cache values: 'json' or 'msgpack' (needs the "
+        "'serialization' extra). Change redis key prefixes when switching.",
+    )
+
+    @field_validator("redis_serializer")
+    @classmethod
+    def validate_redis_serializer(cls, v: str) -> str:
+        """Validate redis_serializer value."""
+        valid_serializers = {"json", "msgpack"}
+        if v not in valid_serializers:
+            raise ValueError(f"redis_serializer must be one of {valid_serializers}, got '{v}'")
+        return v
+
+    redis_max_connections: int = Field(
+        default=20,
+        ge=1,
+        description="Maximum open connections in the Redis connection pool",
+    )
+    redis_pool_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds to wait for a free Redis connection when the pool is exhausted",
+    )
+
     # RSS feed configuration
     rss_feed_title: str = "League of Legends News"
     rss_feed_description: str = "Latest League of Legends news and updates"
@@ -7,6 +7,7 @@ and database migrations for multi-source, multi-locale support.
 """
 
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -34,6 +35,28 @@ class ArticleRepository:
     # Current database schema version
     SCHEMA_VERSION = 2
 
+    # Columns written when inserting an article (keys of Article.to_dict())
+    INSERT_COLUMNS = (
+        "guid",
+        "title",
+        "url",
+        "pub_date",
+        "description",
+        "content",
+        "image_url",
+        "author",
+        "categories",
+        "source",
+        "created_at",
+        "locale",
+        "source_category",
+        "canonical_url",
+    )
+
+    # Rows per multi-row INSERT in save_many and GUIDs per lookup in
+    # filter_existing (keeps well under SQLite's 32766 variable limit)
+    SAVE_BATCH_SIZE = 500
+
     def __init__(self, db_path: str = "data/articles.db") -> None:
         """
         Initialize the article repository.
@@ -227,18 +250,68 @@ class ArticleRepository:
         """
         Save multiple articles to the database.
 
+        Articles are written with multi-row INSERT ... ON CONFLICT DO NOTHING
+        statements in a single transaction, so duplicates (same guid or url)
+        are skipped without one round-trip and commit per article.
+
         Args:
             articles: List of Article instances to save
 
         Returns:
             Count of new articles saved (excludes duplicates)
         """
+        if not articles:
+            return 0
+
+        columns = ", ".join(self.INSERT_COLUMNS)
+        row = f"({', '.join('?' * len(self.INSERT_COLUMNS))})"
         count = 0
-        for article in articles:
-            if await self.save(article):
-                count += 1
+
+        async with aiosqlite.connect(self.db_path) as db:
+            for start in range(0, len(articles), self.SAVE_BATCH_SIZE):
+                batch = articles[start : start + self.SAVE_BATCH_SIZE]
+                params = [
+                    data[column]
+                    for data in (article.to_dict() for article in batch)
+                    for column in self.INSERT_COLUMNS
+                ]
+                cursor = await db.execute(
+                    f"INSERT INTO articles ({columns}) VALUES {', '.join([row] * len(batch))} "
+                    "ON CONFLICT DO NOTHING RETURNING guid",
+                    params,
+                )
+                count += len(list(await cursor.fetchall()))
+            await db.commit()
+
+        logger.info(f"Saved {count} new articles ({len(articles) - count} duplicates skipped)")
         return count
 
+    async def filter_existing(self, guids: Iterable[str]) -> set[str]:
+        """
+        Find which of the given GUIDs are already stored.
+
+        Args:
+            guids: Article GUIDs to look up
+
+        Returns:
+            Subset of guids present in the database
+        """
+        pending = list(guids)
+        existing: set[str] = set()
+        if not pending:
+            return existing
+
+        async with aiosqlite.connect(self.db_path) as db:
+            for start in range(0, len(pending), self.SAVE_BATCH_SIZE):
+                batch = pending[start : start + self.SAVE_BATCH_SIZE]
+                cursor = await db.execute(
+                    f"SELECT guid FROM articles WHERE guid IN ({', '.join('?' * len(batch))})",
+                    batch,
+                )
+                existing.update(row[0] for row in await cursor.fetchall())
+
+        return existing
+
     async def get_latest(
         self, limit: int = 50, source: str | None = None, locale: str | None = None
     ) -> list[Article]:
@@ -19,7 +19,10 @@ from src.scrapers.base import (
 from src.scrapers.registry import (
     ALL_SCRAPER_SOURCES,
     SCRAPER_CONFIGS,
+    fetch_all,
+    fetch_matrix,
     get_scraper,
+    warmup_scrapers,
 )
 from src.scrapers.robots_txt import (
     RobotsParser,
@@ -33,6 +36,9 @@ __all__ = [
     "ScrapingConfig",
     "ScrapingDifficulty",
     "get_scraper",
+    "fetch_all",
+    "fetch_matrix",
+    "warmup_scrapers",
     "SCRAPER_CONFIGS",
     "ALL_SCRAPER_SOURCES",
     "RobotsParser",
@@ -0,0 +1,372 @@
+"""
+Pool of warm headless Chrome WebDrivers shared by Selenium scrapers.
+
+Starting Chrome and handshaking with chromedriver takes one to three seconds,
+so instead of launching a browser per fetch, SeleniumScraper borrows an idle
+driver from this pool and hands it back afterwards. Drivers are recycled
+after MAX_USES_PER_DRIVER fetches or as soon as their session breaks.
+
+When a driver breaks, driver.quit() often leaves Chrome running, so the
+chromedriver and Chrome processes of a broken driver are killed explicitly.
+
+Note: Selenium requires Chrome/Chromium to be installed on the system.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from importlib.util import find_spec
+from typing import Any, Final
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of Chrome instances alive (and fetching) at once
+POOL_SIZE: Final[int] = 4
+
+# Fetches served by one Chrome instance before it is replaced
+MAX_USES_PER_DRIVER: Final[int] = 50
+
+# Chrome switches that stop background services scrapes never need
+# (component updates, sync, translation, crash reporting, safe browsing)
+BACKGROUND_SERVICE_FLAGS: Final[tuple[str, ...]] = (
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-breakpad",
+    "--disable-client-side-phishing-detection",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--safebrowsing-disable-auto-update",
+)
+
+# Content settings: 2 = block. Headless Chrome ignores --disable-images,
+# only the profile preference reliably stops image downloads.
+CHROME_PREFS: Final[dict[str, int]] = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+# psutil finds the Chrome processes started by chromedriver; without it
+# only the chromedriver process itself can be killed
+PSUTIL_AVAILABLE: Final[bool] = find_spec("psutil") is not None
+
+# Whether the missing-psutil warning has been logged
+_psutil_warning_logged = False
+
+# Global driver pool (lazy initialization)
+_driver_pool: "ChromeDriverPool | None" = None
+
+
+def build_chrome_options() -> ChromeOptions:
+    """
+    Build the Chrome options shared by every pooled driver.
+
+    Per-scraper settings (user agent, Accept-Language) are not baked into
+    the launch flags; they are applied to each lease over CDP so one pool
+    can serve every source and locale.
+
+    Returns:
+        Configured ChromeOptions for a headless server browser
+    """
+    options = ChromeOptions()
+
+    # Headless mode
+    options.add_argument("--headless=new")
+
+    # Stability options
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-software-rasterizer")
+
+    # Performance options
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-javascript")  # If site allows
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", dict(CHROME_PREFS))
+    for flag in BACKGROUND_SERVICE_FLAGS:
+        options.add_argument(flag)
+
+    # Window size (some sites require minimum size)
+    options.add_argument("--window-size=1920,1080")
+
+    return options
+
+
+def create_chrome_driver() -> webdriver.Chrome:
+    """
+    Launch a new headless Chrome WebDriver.
+
+    This is blocking (it starts chromedriver and Chrome); the pool calls it
+    in a worker thread.
+
+    Returns:
+        New Chrome WebDriver
+
+    Raises:
+        WebDriverException: If Chrome/chromedriver cannot be started
+    """
+    logger.debug("Initializing Selenium WebDriver")
+    try:
+        driver = webdriver.Chrome(options=build_chrome_options())
+    except WebDriverException as e:
+        logger.error(f"Failed to initialize Chrome driver: {e}")
+        raise WebDriverException(
+            "Selenium requires Chrome/Chromium to be installed. "
+            "For Docker, install chromium and chromium-driver."
+        ) from e
+    logger.debug("Selenium WebDriver initialized successfully")
+    return driver
+
+
+def _snapshot_processes(driver: webdriver.Chrome) -> list[Any]:
+    """
+    Record the chromedriver process of a driver and its Chrome descendants.
+
+    Args:
+        driver: Newly started driver
+
+    Returns:
+        psutil.Process objects (empty if psutil is unavailable)
+    """
+    process = getattr(driver.service, "process", None)
+    if process is None or not PSUTIL_AVAILABLE:
+        return []
+
+    import psutil
+
+    try:
+        root = psutil.Process(process.pid)
+        return [root, *root.children(recursive=True)]
+    except psutil.Error:
+        return []
+
+
+def _kill_processes(driver: webdriver.Chrome, processes: list[Any]) -> None:
+    """
+    Hard-kill whatever is left of a driver's chromedriver and Chrome processes.
+
+    Descendants are looked up again so renderers started after the snapshot
+    are included. psutil refuses to kill a process whose PID was reused.
+
+    Args:
+        driver: Driver being discarded
+        processes: Snapshot taken by _snapshot_processes()
+    """
+    if not processes:
+        process = getattr(driver.service, "process", None)
+        if process is not None and process.poll() is None:
+            process.kill()
+        return
+
+    import psutil
+
+    targets = {proc.pid: proc for proc in processes}
+    for proc in processes:
+        try:
+            for child in proc.children(recursive=True):
+                targets.setdefault(child.pid, child)
+        except psutil.Error:
+            continue
+
+    killed = 0
+    for proc in targets.values():
+        try:
+            proc.kill()
+            killed += 1
+        except psutil.Error:
+            continue
+    if killed:
+        logger.warning(f"Killed {killed} leftover Chrome/chromedriver processes")
+
+
+class ChromeDriverPool:
+    """
+    Bounded pool of reusable Chrome WebDrivers.
+
+    At most size drivers exist at once; acquire() waits when all of them
+    are lent out. Idle drivers are reused in LIFO order so the warmest
+    browser is picked first. On release the page load is stopped and
+    cookies are cleared; a driver that is broken, has lost its session or
+    has served max_uses fetches is quit instead of being returned. The
+    processes of a broken driver are killed after quit().
+
+    Attributes:
+        size: Maximum number of live drivers
+        max_uses: Fetches served by a driver before it is replaced
+    """
+
+    def __init__(
+        self,
+        size: int = POOL_SIZE,
+        max_uses: int = MAX_USES_PER_DRIVER,
+        factory: Callable[[], webdriver.Chrome] = create_chrome_driver,
+    ) -> None:
+        """
+        Initialize the pool. No browser is started until the first acquire().
+
+        Args:
+            size: Maximum number of live drivers
+            max_uses: Fetches served by a driver before it is replaced
+            factory: Blocking callable creating a new driver
+
+        Raises:
+            ValueError: If size or max_uses is less than 1
+        """
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        if max_uses < 1:
+            raise ValueError(f"max_uses must be >= 1, got {max_uses}")
+
+        global _psutil_warning_logged
+        if not PSUTIL_AVAILABLE and not _psutil_warning_logged:
+            _psutil_warning_logged = True
+            logger.warning(
+                "psutil is not installed: broken WebDrivers will only have their "
+                "chromedriver process killed, leaving Chrome processes behind"
+            )
+
+        self.size = size
+        self.max_uses = max_uses
+        self._factory = factory
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[webdriver.Chrome] = []
+        self._uses: dict[webdriver.Chrome, int] = {}
+        self._processes: dict[webdriver.Chrome, list[Any]] = {}
+        self._closed = False
+
+    async def acquire(self) -> webdriver.Chrome:
+        """
+        Borrow a driver, starting a new one if none is idle.
+
+        Returns:
+            Chrome WebDriver reserved for the caller until release()
+
+        Raises:
+            WebDriverException: If a new driver cannot be started
+        """
+        await self._slots.acquire()
+        try:
+            if self._idle:
+                driver = self._idle.pop()
+            else:
+                driver, processes = await asyncio.to_thread(self._launch)
+                self._uses[driver] = 0
+                self._processes[driver] = processes
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._uses[driver] += 1
+        return driver
+
+    async def release(self, driver: webdriver.Chrome, broken: bool = False) -> None:
+        """
+        Return a borrowed driver to the pool.
+
+        Args:
+            driver: Driver obtained from acquire()
+            broken: Whether the caller hit a WebDriver error with it
+        """
+        try:
+            broken = broken or driver.session_id is None
+            recycle = broken or self._closed or self._uses.get(driver, 0) >= self.max_uses
+            if not recycle:
+                try:
+                    await asyncio.to_thread(self._reset, driver)
+                except WebDriverException as e:
+                    logger.debug(f"Resetting WebDriver failed, recycling it: {e}")
+                    recycle = broken = True
+
+            if recycle:
+                await self._discard(driver, kill=broken)
+            else:
+                self._idle.append(driver)
+        finally:
+            self._slots.release()
+
+    async def close(self) -> None:
+        """Quit every idle driver. Drivers still lent out are quit on release."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for driver in idle:
+            await self._discard(driver)
+
+    def _launch(self) -> tuple[webdriver.Chrome, list[Any]]:
+        """
+        Start a driver and snapshot its processes (blocking).
+
+        Returns:
+            Tuple of (new driver, its processes)
+        """
+        driver = self._factory()
+        return driver, _snapshot_processes(driver)
+
+    @staticmethod
+    def _reset(driver: webdriver.Chrome) -> None:
+        """
+        Stop any pending page load and clear cookies before reuse.
+
+        Args:
+            driver: Driver to reset
+        """
+        driver.execute_script("window.stop();")
+        driver.delete_all_cookies()
+
+    async def _discard(self, driver: webdriver.Chrome, kill: bool = False) -> None:
+        """
+        Quit a driver and forget it.
+
+        Args:
+            driver: Driver to quit
+            kill: Also kill its processes after quit(); implied if quit() fails
+        """
+        self._uses.pop(driver, None)
+        processes = self._processes.pop(driver, [])
+        try:
+            await asyncio.to_thread(driver.quit)
+            logger.debug("WebDriver closed")
+        except Exception as e:
+            logger.warning(f"Error closing WebDriver: {e}")
+            kill = True
+
+        if kill:
+            try:
+                await asyncio.to_thread(_kill_processes, driver, processes)
+            except Exception as e:
+                logger.warning(f"Error killing WebDriver processes: {e}")
+
+    def __repr__(self) -> str:
+        """Developer-friendly representation."""
+        return (
+            f"ChromeDriverPool(size={self.size!r}, max_uses={self.max_uses!r}, "
+            f"idle={len(self._idle)})"
+        )
+
+
+def get_driver_pool() -> ChromeDriverPool:
+    """
+    Get the global Chrome driver pool.
+
+    Returns:
+        Global ChromeDriverPool instance
+    """
+    global _driver_pool
+    if _driver_pool is None:
+        _driver_pool = ChromeDriverPool()
+    return _driver_pool
+
+
+async def shutdown_driver_pool() -> None:
+    """Quit all idle pooled drivers and drop the global pool."""
+    global _driver_pool
+    if _driver_pool is not None:
+        await _driver_pool.close()
+        _driver_pool = None
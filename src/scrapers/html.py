@@ -2,25 +2,44 @@
 HTML scraper for sites with structured HTML content.
 
 This module implements a scraper for sites that provide structured HTML
-but no RSS feed. It uses BeautifulSoup for HTML parsing and CSS selectors
-for article extraction. HTML scrapers are classified as "MEDIUM" difficulty.
+but no RSS feed. It uses BeautifulSoup backed by the C-based lxml parser
+and CSS selectors for article extraction. HTML scrapers are classified as
+"MEDIUM" difficulty.
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import multiprocessing
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 import httpx
 from bs4 import BeautifulSoup, Tag
+from soupsieve import SoupSieve
 
 from src.models import Article
-from src.scrapers.base import BaseScraper
+from src.scrapers.base import (
+    ABSOLUTE_URL_PREFIXES,
+    BG_URL_RE,
+    BaseScraper,
+    NotModifiedError,
+    ScrapingConfig,
+    SelectorMixin,
+    join_url,
+)
 
 logger = logging.getLogger(__name__)
 
+# Process pool for CPU-bound HTML parsing (lazy initialization)
+_parse_pool: ProcessPoolExecutor | None = None
 
-class HTMLScraper(BaseScraper):
+
+class HTMLScraper(SelectorMixin, BaseScraper):
     """
     Scraper for sites with structured HTML content.
 
@@ -191,12 +210,28 @@ class HTMLScraper(BaseScraper):
         },
     }
 
+    def __init__(self, config: ScrapingConfig, locale: str = "en-us") -> None:
+        """
+        Initialize the HTML scraper.
+
+        Args:
+            config: Scraping configuration for this source
+            locale: Locale code for articles (e.g., "en-us", "ko-kr")
+        """
+        super().__init__(config, locale)
+
+        # Compiled selectors for this source, or defaults if not configured
+        self._selectors: Mapping[str, SoupSieve] = self._compiled_selectors_for(config.source_id)
+
     async def fetch_articles(self) -> list[Article]:
         """
         Fetch and parse articles from structured HTML.
 
-        Downloads the HTML page, parses it with BeautifulSoup, and extracts
-        articles using CSS selectors configured for the source.
+        Downloads the raw HTML page, parses it with BeautifulSoup using the lxml
+        parser in the shared parse process pool, and extracts articles using
+        CSS selectors configured for the source. If the page is unchanged
+        since the last fetch (304 Not Modified), the cached articles are
+        returned without downloading or parsing.
 
         Returns:
             List of Article objects parsed from the HTML
@@ -206,58 +241,59 @@ class HTMLScraper(BaseScraper):
             Exception: If HTML parsing fails
         """
         url = self.config.get_feed_url(self.locale)
-        logger.info(f"[{self.config.source_id}:{self.locale}] Fetching HTML from {url}")
+        logger.info("[%s:%s] Fetching HTML from %s", self.config.source_id, self.locale, url)
 
         try:
-            html = await self._fetch_html(url)
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Get selectors for this source
-            selectors = self._get_selectors()
+            try:
+                body, encoding = await self._fetch_bytes(url)
+            except NotModifiedError:
+                cached = await self._get_cached_articles(url)
+                if cached is not None:
+                    logger.info(
+                        "[%s:%s] Page not modified, reusing %d cached articles",
+                        self.config.source_id,
+                        self.locale,
+                        len(cached),
+                    )
+                    return cached
+                body, encoding = await self._fetch_bytes(url, conditional=False)
 
-            # Find all article elements
-            article_selector = selectors["article"]
-            article_elements = soup.select(article_selector)
+            # Parse off the event loop so large pages don't stall other scrapers
+            loop = asyncio.get_running_loop()
+            raw_articles = await loop.run_in_executor(
+                get_parse_pool(), _parse_html_worker, body, self.config, self.locale, encoding
+            )
 
-            if not article_elements:
-                logger.warning(
-                    f"[{self.config.source_id}:{self.locale}] No article elements found "
-                    f"with selector '{article_selector}'"
-                )
-                return []
-
-            # Parse each article element
-            articles = []
-            max_articles = 50  # Limit to avoid overwhelming
-
-            for element in article_elements[:max_articles]:
-                try:
-                    article = await self.parse_article(element)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    logger.warning(
-                        f"[{self.config.source_id}:{self.locale}] Failed to parse article element: {e}"
-                    )
-                    continue
+            # One timestamp for every undated article in this batch
+            self._batch_now = datetime.now(timezone.utc)
+            articles = [self._create_article(**fields) for fields in raw_articles]
+            await self._cache_articles(url, articles)
 
-            logger.info(f"[{self.config.source_id}:{self.locale}] Fetched {len(articles)} articles")
+            logger.info(
+                "[%s:%s] Fetched %d articles", self.config.source_id, self.locale, len(articles)
+            )
             return articles
 
         except httpx.HTTPStatusError as e:
             logger.error(
-                f"[{self.config.source_id}:{self.locale}] HTTP error "
-                f"{e.response.status_code} fetching HTML: {e}"
+                "[%s:%s] HTTP error %d fetching HTML: %s",
+                self.config.source_id,
+                self.locale,
+                e.response.status_code,
+                e,
             )
             raise
         except Exception as e:
             logger.error(
-                f"[{self.config.source_id}:{self.locale}] Error fetching articles: {e}",
+                "[%s:%s] Error fetching articles: %s",
+                self.config.source_id,
+                self.locale,
+                e,
                 exc_info=True,
             )
             raise
 
-    async def parse_article(self, element: Any) -> Article | None:
+    def parse_article(self, element: Any) -> Article | None:
         """
         Parse a single HTML element into an Article object.
 
@@ -269,95 +305,140 @@ class HTMLScraper(BaseScraper):
         Returns:
             Article object if parsing succeeds, None if required fields missing
         """
-        if not element or not isinstance(element, Tag):
+        fields = self._extract_fields(element)
+        if fields is None:
             return None
 
-        selectors = self._get_selectors()
+        return self._create_article(**fields)
 
-        # Extract required fields
-        title = self._extract_title(element, selectors["title"])
-        url = self._extract_url(element, selectors["url"])
+    def _parse_html(self, html: bytes | str, encoding: str | None = None) -> list[dict[str, Any]]:
+        """
+        Parse an HTML listing page into raw article field dictionaries.
 
-        if not title or not url:
-            logger.debug("Skipping element: missing title or URL")
-            return None
+        This is the CPU-bound half of fetch_articles and runs inside the
+        parse process pool, so it only returns plain picklable data.
 
-        # Make URL absolute
-        url = self._make_absolute(url)
+        Args:
+            html: Raw HTML body (bytes) or already decoded HTML
+            encoding: Charset declared by the server for a bytes body
 
-        # Extract optional fields
-        description = self._extract_description(element, selectors.get("description"))
-        pub_date = self._extract_date(element, selectors.get("date"))
-        image_url = self._extract_image(element, selectors.get("image"))
+        Returns:
+            List of keyword-argument dictionaries for _create_article()
+        """
+        # Bytes are decoded once by the parser, using the declared charset if any
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
+
+        # Resolve the page base once; relative links are joined against it
+        base_url = self.config.base_url
+        base_tag = soup.find("base", href=True)
+        if isinstance(base_tag, Tag):
+            base_url = urljoin(base_url, str(base_tag["href"]))
+
+        # Get selectors for this source
+        selectors = self._selectors
+
+        # Find article elements, stopping the match after MAX_ARTICLES
+        article_selector = selectors["article"]
+        article_elements = article_selector.select(soup, limit=self.MAX_ARTICLES)
+
+        if not article_elements:
+            logger.warning(
+                "[%s:%s] No article elements found with selector '%s'",
+                self.config.source_id,
+                self.locale,
+                article_selector.pattern,
+            )
+            return []
 
-        if image_url:
-            image_url = self._make_absolute(image_url)
+        # Parse each article element
+        raw_articles = []
 
-        # Create and return Article
-        return self._create_article(
-            title=title,
-            url=url,
-            pub_date=pub_date,
-            description=description,
-            image_url=image_url,
-        )
+        for element in article_elements:
+            try:
+                fields = self._extract_fields(element, base_url)
+                if fields:
+                    raw_articles.append(fields)
+            except Exception as e:
+                logger.warning(
+                    "[%s:%s] Failed to parse article element: %s",
+                    self.config.source_id,
+                    self.locale,
+                    e,
+                )
+                continue
 
-    def _get_selectors(self) -> dict[str, str]:
+        return raw_articles
+
+    def _extract_fields(self, element: Any, base_url: str | None = None) -> dict[str, Any] | None:
         """
-        Get CSS selectors for the current source.
+        Extract article fields from a single HTML element.
 
-        Returns configured selectors for the source, or defaults if not found.
+        Args:
+            element: BeautifulSoup Tag element
+            base_url: Base URL for relative links (defaults to the source base URL)
 
         Returns:
-            Dictionary mapping field names to CSS selectors
+            Keyword-argument dictionary for _create_article(), or None if
+            required fields are missing
         """
-        # Get source-specific selectors
-        if self.config.source_id in self.SELECTORS:
-            return self.SELECTORS[self.config.source_id]
+        if not element or not isinstance(element, Tag):
+            return None
 
-        # Return default selectors
-        return {
-            "article": "article, .post, .news-item",
-            "title": "h2 a, h3 a, h2, h3",
-            "url": "a[href]",
-            "description": ".excerpt, .summary, p",
-            "image": "img",
-            "date": "time, .date, .time",
-        }
+        fields = self._extract_all(element, self._selectors)
+
+        if not fields["title"] or not fields["url"]:
+            logger.debug("Skipping element: missing title or URL")
+            return None
+
+        # Make URLs absolute
+        fields["url"] = self._make_absolute(fields["url"], base_url)
+        if fields["image_url"]:
+            fields["image_url"] = self._make_absolute(fields["image_url"], base_url)
 
-    def _extract_title(self, element: Tag, selector: str) -> str:
+        return fields
+
+    def _extract_all(self, element: Tag, selectors: Mapping[str, SoupSieve]) -> dict[str, Any]:
         """
-        Extract title from element using CSS selector.
+        Extract all article fields from an element in a single tree walk.
+
+        The field elements are located by _match_fields().
 
         Args:
             element: BeautifulSoup Tag element
-            selector: CSS selector for title
+            selectors: Compiled CSS selectors for the source
 
         Returns:
-            Title string or empty string if not found
+            Dictionary with title, url, pub_date, description and image_url;
+            title/url/description are empty strings when not found
         """
-        title_elem = element.select_one(selector)
-        if title_elem:
-            # Prefer text content, then href text for links
-            if title_elem.name == "a":
-                return title_elem.get_text(strip=True)
-            return title_elem.get_text(strip=True)
+        matches, first_link = self._match_fields(element, selectors)
+        title_elem = matches.get("title")
+        desc_elem = matches.get("description")
+        date_elem = matches.get("date")
+        img_elem = matches.get("image")
 
-        return ""
+        return {
+            "title": title_elem.get_text(strip=True) if title_elem else "",
+            "url": self._url_from_tags(element, matches.get("url"), first_link),
+            "pub_date": self._date_from_tag(date_elem) if date_elem else None,
+            "description": desc_elem.get_text(strip=True) if desc_elem else "",
+            "image_url": self._image_from_tag(img_elem) if img_elem else None,
+        }
 
-    def _extract_url(self, element: Tag, selector: str) -> str:
+    @staticmethod
+    def _url_from_tags(element: Tag, link_elem: Tag | None, first_link: Tag | None) -> str:
         """
-        Extract URL from element using CSS selector.
+        Get the article URL from the matched link elements.
 
         Args:
-            element: BeautifulSoup Tag element
-            selector: CSS selector for URL
+            element: BeautifulSoup Tag element of the article
+            link_elem: First element matching the URL selector
+            first_link: First <a> element within the article
 
         Returns:
             URL string or empty string if not found
         """
-        # Try to find link element
-        link_elem = element.select_one(selector)
+        # Try the element matched by the URL selector
         if link_elem and link_elem.get("href"):
             return str(link_elem["href"])
 
@@ -365,59 +446,26 @@ class HTMLScraper(BaseScraper):
         if element.name == "a" and element.get("href"):
             return str(element["href"])
 
-        # Try to find first link within element
-        link_elem = element.find("a")
-        if link_elem and link_elem.get("href"):
-            return str(link_elem["href"])
-
-        return ""
-
-    def _extract_description(self, element: Tag, selector: str | None) -> str:
-        """
-        Extract description from element using CSS selector.
-
-        Args:
-            element: BeautifulSoup Tag element
-            selector: CSS selector for description
-
-        Returns:
-            Description string or empty string if not found
-        """
-        if not selector:
-            return ""
-
-        desc_elem = element.select_one(selector)
-        if desc_elem:
-            return str(desc_elem.get_text(strip=True))
+        # Try first link within element
+        if first_link and first_link.get("href"):
+            return str(first_link["href"])
 
         return ""
 
-    def _extract_date(self, element: Tag, selector: str | None) -> datetime | None:
+    def _date_from_tag(self, date_elem: Tag) -> datetime | None:
         """
-        Extract publication date from element using CSS selector.
+        Get the publication date from a matched date element.
 
         Args:
-            element: BeautifulSoup Tag element
-            selector: CSS selector for date
+            date_elem: Element matching the date selector
 
         Returns:
             Datetime object or None if date cannot be parsed
         """
-        if not selector:
-            return None
-
-        date_elem = element.select_one(selector)
-        if not date_elem:
-            return None
-
         # Try datetime attribute
         if date_elem.get("datetime"):
             return self._parse_date(str(date_elem["datetime"]))
 
-        # Try time datetime
-        if date_elem.name == "time" and date_elem.get("datetime"):
-            return self._parse_date(str(date_elem["datetime"]))
-
         # Try text content
         date_text = date_elem.get_text(strip=True)
         if date_text:
@@ -425,24 +473,17 @@ class HTMLScraper(BaseScraper):
 
         return None
 
-    def _extract_image(self, element: Tag, selector: str | None) -> str | None:
+    @staticmethod
+    def _image_from_tag(img_elem: Tag) -> str | None:
         """
-        Extract image URL from element using CSS selector.
+        Get the image URL from a matched image element.
 
         Args:
-            element: BeautifulSoup Tag element
-            selector: CSS selector for image
+            img_elem: Element matching the image selector
 
         Returns:
             Image URL string or None if not found
         """
-        if not selector:
-            return None
-
-        img_elem = element.select_one(selector)
-        if not img_elem:
-            return None
-
         # Try src attribute
         if img_elem.get("src"):
             return str(img_elem["src"])
@@ -454,20 +495,22 @@ class HTMLScraper(BaseScraper):
         # Try background-image style
         style = img_elem.get("style", "")
         if isinstance(style, str) and "background-image" in style:
-            import re
-
-            match = re.search(r'url\(["\']?(.*?)["\']?\)', style)
+            match = BG_URL_RE.search(style)
             if match:
                 return match.group(1)
 
         return None
 
-    def _make_absolute(self, url: str) -> str:
+    def _make_absolute(self, url: str, base_url: str | None = None) -> str:
         """
         Convert relative URL to absolute URL.
 
+        Absolute http(s) URLs are detected with a prefix check, so only
+        relative links go through the cached join_url.
+
         Args:
             url: Relative or absolute URL
+            base_url: Base URL to join against (defaults to the source base URL)
 
         Returns:
             Absolute URL string
@@ -476,11 +519,11 @@ class HTMLScraper(BaseScraper):
             return ""
 
         # Already absolute
-        if urlparse(url).scheme in ("http", "https"):
+        if url.startswith(ABSOLUTE_URL_PREFIXES):
             return url
 
         # Make absolute using base URL
-        return urljoin(self.config.base_url, url)
+        return join_url(base_url or self.config.base_url, url)
 
     @staticmethod
     def _clean_text(text: str) -> str:
@@ -496,3 +539,72 @@ class HTMLScraper(BaseScraper):
         if not text:
             return ""
         return " ".join(text.split())
+
+
+HTMLScraper._compile_selectors()
+
+
+@lru_cache(maxsize=512)
+def _worker_parser(config: ScrapingConfig, locale: str) -> HTMLScraper:
+    """
+    Get the HTMLScraper used to parse pages of a source in this process.
+
+    Each parse pool worker builds one parser per (config, locale) and keeps
+    it, instead of a full scraper (rate limiter, circuit breaker, robots
+    parser lookups) for every page it parses.
+
+    Args:
+        config: Scraping configuration of the source
+        locale: Locale code for articles
+
+    Returns:
+        HTMLScraper bound to the source's compiled selectors
+    """
+    return HTMLScraper(config, locale)
+
+
+def _parse_html_worker(
+    html: bytes | str, config: ScrapingConfig, locale: str, encoding: str | None = None
+) -> list[dict[str, Any]]:
+    """
+    Parse an HTML listing page inside a parse pool worker process.
+
+    Top-level so it can be pickled by ProcessPoolExecutor.
+
+    Args:
+        html: Raw HTML body (bytes) or already decoded HTML
+        config: Scraping configuration of the source
+        locale: Locale code for articles
+        encoding: Charset declared by the server for a bytes body
+
+    Returns:
+        List of raw article field dictionaries
+    """
+    return _worker_parser(config, locale)._parse_html(html, encoding)
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Get the global process pool used for HTML parsing.
+
+    The pool is created on first use with one worker per CPU. The spawn
+    start method is used on every platform to match Windows deployments.
+
+    Returns:
+        Global ProcessPoolExecutor instance
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Shut down the global HTML parse process pool."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=True)
+        _parse_pool = None
@@ -9,17 +9,30 @@ Sources are organized by category (community hub, analytics, regional, etc.)
 and difficulty level (EASY for RSS, MEDIUM for HTML, HARD for Selenium).
 """
 
+import asyncio
 import logging
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import Final
-
-from src.models import SourceCategory
-from src.scrapers.base import BaseScraper, ScrapingConfig, ScrapingDifficulty
+from urllib.parse import urlparse
+
+from src.models import Article, SourceCategory
+from src.scrapers.base import (
+    BaseScraper,
+    ScrapingConfig,
+    ScrapingDifficulty,
+    get_host_circuit_breaker,
+    get_host_rate_limiter,
+)
 from src.scrapers.html import HTMLScraper
 from src.scrapers.rss import RSSScraper
 from src.scrapers.selenium import SeleniumScraper
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of scrapers fetching at the same time in fetch_all()
+MAX_CONCURRENT_FETCHES: Final[int] = 8
+
 # =============================================================================
 # Source Configurations
 # =============================================================================
@@ -211,14 +224,23 @@ _ESPORTS_CONFIGS: Final[dict[str, ScrapingConfig]] = {
 # Combined Registry
 # =============================================================================
 
-SCRAPER_CONFIGS: Final[dict[str, ScrapingConfig]] = {
-    **_COMMUNITY_HUB_CONFIGS,
-    **_ANALYTICS_CONFIGS,
-    **_REGIONAL_CONFIGS,
-    **_TFT_CONFIGS,
-    **_SOCIAL_CONFIGS,
-    **_ESPORTS_CONFIGS,
-}
+_all_configs: dict[str, ScrapingConfig] = {}
+_all_configs.update(_COMMUNITY_HUB_CONFIGS)
+_all_configs.update(_ANALYTICS_CONFIGS)
+_all_configs.update(_REGIONAL_CONFIGS)
+_all_configs.update(_TFT_CONFIGS)
+_all_configs.update(_SOCIAL_CONFIGS)
+_all_configs.update(_ESPORTS_CONFIGS)
+
+# Read-only view; the registry is fixed at import time
+SCRAPER_CONFIGS: Final[Mapping[str, ScrapingConfig]] = MappingProxyType(_all_configs)
+
+# Pre-build circuit breakers and host rate limiters so scraper construction
+# only reads cached handles, before any update tasks are fanned out
+for _config in SCRAPER_CONFIGS.values():
+    get_host_circuit_breaker(_config.source_id, _config.base_url)
+    get_host_rate_limiter(_config.base_url, _config.rate_limit_seconds)
+    get_host_rate_limiter(_config.get_feed_url(), _config.rate_limit_seconds)
 
 # =============================================================================
 # Scraper Class Mapping
@@ -230,46 +252,53 @@ SCRAPER_CLASSES: Final[dict[ScrapingDifficulty, type[BaseScraper]]] = {
     ScrapingDifficulty.HARD: SeleniumScraper,
 }
 
+# Scraper class for each source, resolved once from its difficulty
+_CLS_FOR_ID: Final[dict[str, type[BaseScraper]]] = {
+    source_id: SCRAPER_CLASSES[config.difficulty] for source_id, config in SCRAPER_CONFIGS.items()
+}
+
 # =============================================================================
 # Source Categories Mapping
 # =============================================================================
 
-SOURCE_CATEGORY_MAP: Final[dict[str, SourceCategory]] = {
-    # Community hubs
-    "dexerto": SourceCategory.COMMUNITY_HUB,
-    "dotesports": SourceCategory.COMMUNITY_HUB,
-    "esportsgg": SourceCategory.COMMUNITY_HUB,
-    "ggrecon": SourceCategory.COMMUNITY_HUB,
-    # REMOVED: nme, thegamer, upcomer - broken RSS feeds (404) with no viable alternatives
-    # See Bug #6 investigation in tmp/ directory for verification details
-    "pcgamesn": SourceCategory.COMMUNITY_HUB,
-    # Analytics
-    "mobalytics": SourceCategory.ANALYTICS,
-    "u-gg": SourceCategory.ANALYTICS,
-    "blitz-gg": SourceCategory.ANALYTICS,
-    "porofessor": SourceCategory.ANALYTICS,
-    # Regional
-    "inven": SourceCategory.REGIONAL,
-    "opgg": SourceCategory.REGIONAL,
-    "3djuegos": SourceCategory.REGIONAL,
-    "earlygame": SourceCategory.REGIONAL,
-    # TFT
-    "bunnymuffins": SourceCategory.TFT,
-    "tftactics": SourceCategory.TFT,
-    # Social
-    "twitter": SourceCategory.SOCIAL,
-    "reddit": SourceCategory.SOCIAL,
-    "youtube": SourceCategory.SOCIAL,
-    # Esports
-    "lolesports": SourceCategory.ESPORTS,
-    "dexerto-esports": SourceCategory.ESPORTS,
-}
+SOURCE_CATEGORY_MAP: Final[Mapping[str, SourceCategory]] = MappingProxyType(
+    {
+        # Community hubs
+        "dexerto": SourceCategory.COMMUNITY_HUB,
+        "dotesports": SourceCategory.COMMUNITY_HUB,
+        "esportsgg": SourceCategory.COMMUNITY_HUB,
+        "ggrecon": SourceCategory.COMMUNITY_HUB,
+        # REMOVED: nme, thegamer, upcomer - broken RSS feeds (404) with no viable alternatives
+        # See Bug #6 investigation in tmp/ directory for verification details
+        "pcgamesn": SourceCategory.COMMUNITY_HUB,
+        # Analytics
+        "mobalytics": SourceCategory.ANALYTICS,
+        "u-gg": SourceCategory.ANALYTICS,
+        "blitz-gg": SourceCategory.ANALYTICS,
+        "porofessor": SourceCategory.ANALYTICS,
+        # Regional
+        "inven": SourceCategory.REGIONAL,
+        "opgg": SourceCategory.REGIONAL,
+        "3djuegos": SourceCategory.REGIONAL,
+        "earlygame": SourceCategory.REGIONAL,
+        # TFT
+        "bunnymuffins": SourceCategory.TFT,
+        "tftactics": SourceCategory.TFT,
+        # Social
+        "twitter": SourceCategory.SOCIAL,
+        "reddit": SourceCategory.SOCIAL,
+        "youtube": SourceCategory.SOCIAL,
+        # Esports
+        "lolesports": SourceCategory.ESPORTS,
+        "dexerto-esports": SourceCategory.ESPORTS,
+    }
+)
 
 # =============================================================================
 # Lists for Easy Access
 # =============================================================================
 
-ALL_SCRAPER_SOURCES: Final[list[str]] = list(SCRAPER_CONFIGS.keys())
+ALL_SCRAPER_SOURCES: Final[tuple[str, ...]] = tuple(_all_configs)
 
 COMMUNITY_HUB_SOURCES: Final[list[str]] = list(_COMMUNITY_HUB_CONFIGS.keys())
 
@@ -283,6 +312,21 @@ SOCIAL_SOURCES: Final[list[str]] = list(_SOCIAL_CONFIGS.keys())
 
 ESPORTS_SOURCES: Final[list[str]] = list(_ESPORTS_CONFIGS.keys())
 
+# Source IDs grouped by category and by difficulty, in registry order
+_by_category: dict[SourceCategory, list[str]] = {}
+for _source_id, _category in SOURCE_CATEGORY_MAP.items():
+    _by_category.setdefault(_category, []).append(_source_id)
+_BY_CATEGORY: Final[dict[SourceCategory, tuple[str, ...]]] = {
+    category: tuple(source_ids) for category, source_ids in _by_category.items()
+}
+
+_by_difficulty: dict[ScrapingDifficulty, list[str]] = {}
+for _source_id, _config in SCRAPER_CONFIGS.items():
+    _by_difficulty.setdefault(_config.difficulty, []).append(_source_id)
+_BY_DIFFICULTY: Final[dict[ScrapingDifficulty, tuple[str, ...]]] = {
+    difficulty: tuple(source_ids) for difficulty, source_ids in _by_difficulty.items()
+}
+
 
 # =============================================================================
 # Factory Function
@@ -293,8 +337,8 @@ def get_scraper(source_id: str, locale: str = "en-us") -> BaseScraper:
     """
     Factory function to create a scraper instance for a given source.
 
-    This function looks up the source configuration, determines the
-    appropriate scraper class based on difficulty, and returns an
+    This function looks up the source configuration and the scraper class
+    bound to the source's difficulty at import time, and returns an
     instantiated scraper ready for use.
 
     Args:
@@ -317,19 +361,135 @@ def get_scraper(source_id: str, locale: str = "en-us") -> BaseScraper:
         >>> scraper = get_scraper("twitter", "en-us")
         >>> articles = await scraper.fetch_articles()
     """
-    if source_id not in SCRAPER_CONFIGS:
+    scraper_class = _CLS_FOR_ID.get(source_id)
+    if scraper_class is None:
         available = ", ".join(ALL_SCRAPER_SOURCES)
         raise ValueError(f"Unknown scraper source: {source_id}. " f"Available sources: {available}")
 
-    config = SCRAPER_CONFIGS[source_id]
-    scraper_class = SCRAPER_CLASSES[config.difficulty]
+    logger.info("Creating %s for %s (locale: %s)", scraper_class.__name__, source_id, locale)
+
+    return scraper_class(SCRAPER_CONFIGS[source_id], locale)
+
+
+async def warmup_scrapers(scrapers: Iterable[BaseScraper]) -> None:
+    """
+    Warm up DNS and TLS for every source host before a fetch fan-out.
+
+    Sends one HEAD preflight per distinct host concurrently, so the first
+    real fetches skip the DNS lookup and handshake. Errors are ignored.
+
+    Args:
+        scrapers: Scrapers about to be run
+
+    Examples:
+        >>> scrapers = [get_scraper(source_id) for source_id in COMMUNITY_HUB_SOURCES]
+        >>> await warmup_scrapers(scrapers)
+    """
+    by_host: dict[str, BaseScraper] = {}
+    for scraper in scrapers:
+        by_host.setdefault(urlparse(scraper.config.base_url).netloc.lower(), scraper)
+
+    logger.info("Warming up connections to %d hosts", len(by_host))
+    await asyncio.gather(
+        *(scraper.warmup() for scraper in by_host.values()), return_exceptions=True
+    )
+
+
+async def fetch_all(
+    source_ids: list[str], locale: str = "en-us"
+) -> dict[str, list[Article] | BaseException]:
+    """
+    Fetch articles from several sources concurrently.
+
+    Builds a scraper per source, warms up connections to their hosts and
+    runs all fetches together, with at most MAX_CONCURRENT_FETCHES in
+    flight. Total time is roughly that of the slowest source instead of
+    the sum of all of them. A failing source does not abort the batch;
+    its exception is returned in place of its articles.
+
+    Args:
+        source_ids: Source identifiers to fetch
+        locale: Locale code for articles
+
+    Returns:
+        Dictionary mapping each source ID to its articles, or to the
+        exception raised while fetching it
 
-    logger.info(f"Creating {scraper_class.__name__} for {source_id} (locale: {locale})")
+    Raises:
+        ValueError: If a source_id is not found in SCRAPER_CONFIGS
 
-    return scraper_class(config, locale)
+    Examples:
+        >>> results = await fetch_all(COMMUNITY_HUB_SOURCES, "en-us")
+        >>> articles = [a for r in results.values() if isinstance(r, list) for a in r]
+    """
+    results = await fetch_matrix(source_ids, (locale,))
+    return {source_id: results[(source_id, locale)] for source_id in source_ids}
 
 
-def get_sources_by_category(category: SourceCategory) -> list[str]:
+async def fetch_matrix(
+    source_ids: Iterable[str], locales: Iterable[str]
+) -> dict[tuple[str, str], list[Article] | Exception]:
+    """
+    Fetch articles for every (source, locale) pair concurrently.
+
+    All pairs run in one asyncio.TaskGroup, with at most
+    MAX_CONCURRENT_FETCHES in flight. Politeness is kept by the per-host
+    rate limiters shared by all scrapers, so locales of the same source
+    are spaced out while unrelated hosts proceed in parallel, and the
+    wall time is bound by the slowest host rather than the sum of all
+    pairs. A failing pair does not cancel the others; its exception is
+    returned in place of its articles. If the caller is cancelled, the
+    task group cancels every outstanding fetch.
+
+    Args:
+        source_ids: Source identifiers to fetch
+        locales: Locale codes to fetch each source in
+
+    Returns:
+        Dictionary mapping each (source ID, locale) pair to its articles,
+        or to the exception raised while fetching it
+
+    Raises:
+        ValueError: If a source_id is not found in SCRAPER_CONFIGS
+
+    Examples:
+        >>> results = await fetch_matrix(["dexerto", "inven"], ["en-us", "ko-kr"])
+        >>> results[("inven", "ko-kr")]
+    """
+    locales = tuple(locales)
+    scrapers = {
+        (source_id, locale): get_scraper(source_id, locale)
+        for source_id in source_ids
+        for locale in locales
+    }
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def fetch(scraper: BaseScraper) -> list[Article] | Exception:
+        """Fetch one pair while holding a concurrency slot."""
+        async with semaphore:
+            try:
+                return await scraper.fetch_articles()
+            except Exception as e:
+                return e
+
+    try:
+        await warmup_scrapers(scrapers.values())
+        async with asyncio.TaskGroup() as tg:
+            tasks = {key: tg.create_task(fetch(scraper)) for key, scraper in scrapers.items()}
+    finally:
+        await asyncio.gather(
+            *(scraper.close() for scraper in scrapers.values()), return_exceptions=True
+        )
+
+    results = {key: task.result() for key, task in tasks.items()}
+    for (source_id, locale), result in results.items():
+        if isinstance(result, Exception):
+            logger.warning("[%s:%s] Fetch failed: %s", source_id, locale, result)
+
+    return results
+
+
+def get_sources_by_category(category: SourceCategory) -> tuple[str, ...]:
     """
     Get all source IDs belonging to a specific category.
 
@@ -337,19 +497,19 @@ def get_sources_by_category(category: SourceCategory) -> list[str]:
         category: Source category to filter by
 
     Returns:
-        List of source IDs in the specified category
+        Tuple of source IDs in the specified category (precomputed at import)
 
     Examples:
         >>> get_sources_by_category(SourceCategory.COMMUNITY_HUB)
-        ['dexerto', 'dotesports', 'esportsgg', ...]
+        ('dexerto', 'dotesports', 'esportsgg', ...)
 
         >>> get_sources_by_category(SourceCategory.ANALYTICS)
-        ['mobalytics', 'u-gg', 'blitz-gg', 'porofessor']
+        ('mobalytics', 'u-gg', 'blitz-gg', 'porofessor')
     """
-    return [source_id for source_id, cat in SOURCE_CATEGORY_MAP.items() if cat == category]
+    return _BY_CATEGORY.get(category, ())
 
 
-def get_sources_by_difficulty(difficulty: ScrapingDifficulty) -> list[str]:
+def get_sources_by_difficulty(difficulty: ScrapingDifficulty) -> tuple[str, ...]:
     """
     Get all source IDs requiring a specific difficulty level.
 
@@ -357,20 +517,16 @@ def get_sources_by_difficulty(difficulty: ScrapingDifficulty) -> list[str]:
         difficulty: Scraping difficulty level
 
     Returns:
-        List of source IDs with the specified difficulty
+        Tuple of source IDs with the specified difficulty (precomputed at import)
 
     Examples:
         >>> get_sources_by_difficulty(ScrapingDifficulty.EASY)
-        ['dexerto', 'dotesports', 'nme', ...]
+        ('dexerto', 'dotesports', 'pcgamesn', ...)
 
         >>> get_sources_by_difficulty(ScrapingDifficulty.HARD)
-        ['twitter', 'reddit', 'youtube']
+        ('u-gg', 'twitter', 'reddit', 'youtube', 'lolesports')
     """
-    return [
-        source_id
-        for source_id, config in SCRAPER_CONFIGS.items()
-        if config.difficulty == difficulty
-    ]
+    return _BY_DIFFICULTY.get(difficulty, ())
 
 
 def is_selenium_required(source_id: str) -> bool:
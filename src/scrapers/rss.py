@@ -2,28 +2,151 @@
 RSS scraper for sites with structured RSS/Atom feeds.
 
 This module implements a scraper for sites that provide RSS or Atom feeds.
-It uses the feedparser library to parse feeds and extract article information.
-RSS scrapers are classified as "EASY" difficulty sources.
+Feeds are parsed with lxml (libxml2) into feedparser-shaped entry dicts, from
+which article information is extracted. RSS scrapers are classified as "EASY"
+difficulty sources.
 """
 
+import html as html_lib
 import logging
-from datetime import datetime
-from typing import Any
+import re
+import sys
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Final, cast
+from urllib.parse import urlsplit
 
-import feedparser
 import httpx
+from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from src.models import Article
 from src.scrapers.base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# XML namespaces used by feed entries
+_ATOM_NS: Final[str] = "http://www.w3.org/2005/Atom"
+_MEDIA_NS: Final[str] = "http://search.yahoo.com/mrss/"
+
+# Entry elements of RSS 2.0, RSS 1.0 (RDF) and Atom feeds
+_ENTRY_TAGS: Final[tuple[str, ...]] = (
+    "item",
+    "{http://purl.org/rss/1.0/}item",
+    f"{{{_ATOM_NS}}}entry",
+)
+
+# Forgiving feed parser; entities and network access are disabled (no XXE)
+_FEED_PARSER: Final[etree.XMLParser] = etree.XMLParser(
+    recover=True,
+    huge_tree=False,
+    resolve_entities=False,
+    no_network=True,
+)
+
+# Fast-path patterns for stripping tags and finding inline images
+_TAG_RE: Final[re.Pattern[str]] = re.compile(r"<[^>]+>")
+_IMG_SRC_RE: Final[re.Pattern[str]] = re.compile(r"""<img[^>]+src=["']([^"']+)""", re.I)
+
+# Elements dropped (with their content) from entry HTML
+_UNSAFE_TAGS: Final[tuple[str, ...]] = (
+    "script",
+    "style",
+    "iframe",
+    "frame",
+    "object",
+    "embed",
+    "applet",
+    "form",
+    "meta",
+    "link",
+    "base",
+)
+
+# Elements kept in entry HTML; any other element is unwrapped to its content
+_SAFE_TAGS: Final[frozenset[str]] = frozenset(
+    {
+        "a",
+        "abbr",
+        "b",
+        "blockquote",
+        "br",
+        "caption",
+        "cite",
+        "code",
+        "dd",
+        "del",
+        "div",
+        "dl",
+        "dt",
+        "em",
+        "figcaption",
+        "figure",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "hr",
+        "i",
+        "img",
+        "ins",
+        "li",
+        "ol",
+        "p",
+        "pre",
+        "q",
+        "s",
+        "small",
+        "span",
+        "strong",
+        "sub",
+        "sup",
+        "table",
+        "tbody",
+        "td",
+        "tfoot",
+        "th",
+        "thead",
+        "tr",
+        "u",
+        "ul",
+    }
+)
+
+# Attributes kept on entry HTML elements (no style, no event handlers)
+_SAFE_ATTRS: Final[frozenset[str]] = frozenset(
+    {
+        "alt",
+        "cite",
+        "colspan",
+        "datetime",
+        "height",
+        "href",
+        "lang",
+        "rowspan",
+        "src",
+        "title",
+        "width",
+    }
+)
+
+# Attributes holding URLs, and the schemes allowed in them (plus relative URLs)
+_URL_ATTRS: Final[frozenset[str]] = frozenset({"href", "src", "cite"})
+_SAFE_URL_SCHEMES: Final[frozenset[str]] = frozenset({"", "http", "https", "mailto"})
+
+# Control characters and whitespace browsers ignore inside URL schemes
+_URL_IGNORED_RE: Final[re.Pattern[str]] = re.compile(r"[\x00-\x20]")
+
 
 class RSSScraper(BaseScraper):
     """
     Scraper for sites providing RSS or Atom feeds.
 
-    This scraper handles structured RSS/Atom feeds using the feedparser library.
+    This scraper handles structured RSS/Atom feeds, parsed with lxml.
     It extracts article metadata including title, description, publication date,
     author, categories, and images from feed entries.
 
@@ -37,13 +160,19 @@ class RSSScraper(BaseScraper):
         - Various regional sites
     """
 
+    # Maximum number of feed entries parsed per fetch
+    MAX_ENTRIES: int = 100
+
     async def fetch_articles(self) -> list[Article]:
         """
         Fetch and parse articles from an RSS feed.
 
-        Downloads the RSS feed from the configured URL, parses it using
-        feedparser, and converts entries to Article objects.
-        Uses circuit breaker for resilience.
+        Downloads the RSS feed from the configured URL, parses it with lxml,
+        and converts entries to Article objects.
+        Uses circuit breaker for resilience. ETag/Last-Modified validators
+        from the previous fetch are sent, and if the feed is unchanged
+        (304 Not Modified) the cached articles are returned without
+        downloading or parsing.
 
         Returns:
             List of Article objects parsed from the feed
@@ -53,59 +182,91 @@ class RSSScraper(BaseScraper):
             Exception: If feed parsing fails
         """
         feed_url = self.config.get_feed_url(self.locale)
-        logger.info(f"[{self.config.source_id}:{self.locale}] Fetching RSS feed from {feed_url}")
-
-        # Wrap the fetch operation with circuit breaker
-        async def _fetch_feed() -> bytes:
-            await self._respect_rate_limit()
-            response = await self.client.get(feed_url)
-            response.raise_for_status()
-            return response.content
+        logger.info(
+            "[%s:%s] Fetching RSS feed from %s", self.config.source_id, self.locale, feed_url
+        )
 
         try:
             # Fetch feed content with circuit breaker protection
-            response_content = await self._circuit_breaker.call(_fetch_feed)
+            headers = await self._get_conditional_headers(feed_url)
+            response = await self._circuit_breaker.call(self._get, feed_url, headers)
+            if response.status_code == 304:
+                cached = await self._get_cached_articles(feed_url)
+                if cached is not None:
+                    logger.info(
+                        "[%s:%s] Feed not modified, reusing %d cached articles",
+                        self.config.source_id,
+                        self.locale,
+                        len(cached),
+                    )
+                    return cached
+                response = await self._circuit_breaker.call(self._get, feed_url)
 
-            # Parse RSS feed
-            feed = feedparser.parse(response_content)
+            await self._store_validators(feed_url, response)
+            response_content = response.content
 
-            if feed.bozo:
-                logger.warning(
-                    f"Feed parsing warning for {self.config.source_id}: {feed.bozo_exception}"
-                )
+            # Parse RSS/Atom feed
+            try:
+                entries = _parse_feed_lxml(response_content)
+            except etree.XMLSyntaxError as e:
+                logger.warning("Feed parsing warning for %s: %s", self.config.source_id, e)
+                entries = []
 
-            # Extract articles from feed entries
-            articles = []
-            max_entries = 100  # Limit to avoid overwhelming
+            # One timestamp for every undated entry in this batch
+            self._batch_now = datetime.now(timezone.utc)
 
-            for entry in feed.entries[:max_entries]:
-                try:
-                    article = await self.parse_article(entry)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    logger.warning(
-                        f"[{self.config.source_id}:{self.locale}] Failed to parse entry: {e}"
-                    )
-                    continue
+            # Extract articles from feed entries (capped to avoid overwhelming)
+            articles = [
+                article
+                for article in map(self._parse_entry, entries[: self.MAX_ENTRIES])
+                if article is not None
+            ]
 
-            logger.info(f"[{self.config.source_id}:{self.locale}] Fetched {len(articles)} articles")
+            await self._cache_articles(feed_url, articles)
+
+            logger.info(
+                "[%s:%s] Fetched %d articles", self.config.source_id, self.locale, len(articles)
+            )
             return articles
 
         except httpx.HTTPStatusError as e:
             logger.error(
-                f"[{self.config.source_id}:{self.locale}] HTTP error "
-                f"{e.response.status_code} fetching feed: {e}"
+                "[%s:%s] HTTP error %d fetching feed: %s",
+                self.config.source_id,
+                self.locale,
+                e.response.status_code,
+                e,
             )
             raise
         except Exception as e:
             logger.error(
-                f"[{self.config.source_id}:{self.locale}] Error fetching articles: {e}",
+                "[%s:%s] Error fetching articles: %s",
+                self.config.source_id,
+                self.locale,
+                e,
                 exc_info=True,
             )
             raise
 
-    async def parse_article(self, element: Any) -> Article | None:
+    def _parse_entry(self, entry: Any) -> Article | None:
+        """
+        Parse a feed entry, logging and skipping it if parsing fails.
+
+        Args:
+            entry: Feed entry dict
+
+        Returns:
+            Article object, or None if the entry is skipped
+        """
+        try:
+            return self.parse_article(entry)
+        except Exception as e:
+            logger.warning(
+                "[%s:%s] Failed to parse entry: %s", self.config.source_id, self.locale, e
+            )
+            return None
+
+    def parse_article(self, element: Any) -> Article | None:
         """
         Parse a single RSS feed entry into an Article object.
 
@@ -120,7 +281,7 @@ class RSSScraper(BaseScraper):
         - Content (full article HTML)
 
         Args:
-            element: Feedparser entry object
+            element: Feed entry dict (see _parse_feed_lxml)
 
         Returns:
             Article object if parsing succeeds, None if required fields missing
@@ -136,13 +297,15 @@ class RSSScraper(BaseScraper):
             logger.debug("Skipping entry: missing title or URL")
             return None
 
-        # Extract optional fields
-        description = self._extract_description(element)
+        # Extract optional fields; the raw description and content HTML are
+        # read once and reused for both text cleaning and the image search
+        description_html = self._raw_description(element)
+        content = self._extract_content(element)
+        description = self._clean_html(description_html)
         pub_date = self._extract_pub_date(element)
         author = self._extract_author(element)
         categories = self._extract_categories(element)
-        image_url = self._extract_image(element)
-        content = self._extract_content(element)
+        image_url = self._extract_image(element, description_html, content)
 
         # Create and return Article
         return self._create_article(
@@ -161,12 +324,13 @@ class RSSScraper(BaseScraper):
         Extract title from feed entry.
 
         Args:
-            entry: Feedparser entry object
+            entry: Feed entry dict
 
         Returns:
             Title string or empty string if not found
         """
-        return str(entry.get("title", "").strip())
+        title: str = entry.get("title", "")
+        return title.strip()
 
     def _extract_url(self, entry: Any) -> str:
         """
@@ -175,76 +339,83 @@ class RSSScraper(BaseScraper):
         Handles multiple URL field names used by different feed formats.
 
         Args:
-            entry: Feedparser entry object
+            entry: Feed entry dict
 
         Returns:
             URL string or empty string if not found
         """
         # Try standard link field
         if "link" in entry:
-            return str(entry["link"])
+            return cast(str, entry["link"])
 
         # Try id field (sometimes contains URL)
-        if "id" in entry and str(entry["id"]).startswith("http"):
-            return str(entry["id"])
+        url = cast(str, entry.get("id", ""))
+        if url.startswith("http"):
+            return url
 
         # Try links array (Atom format)
-        if "links" in entry:
-            for link in entry["links"]:
-                if link.get("rel") == "alternate" or link.get("type") == "text/html":
-                    return str(link.get("href", ""))
+        for link in entry.get("links", ()):
+            if link.get("rel") == "alternate" or link.get("type") == "text/html":
+                return cast(str, link.get("href", ""))
 
         return ""
 
-    def _extract_description(self, entry: Any) -> str:
+    def _raw_description(self, entry: Any) -> str:
         """
-        Extract description/summary from feed entry.
+        Get the raw (HTML) description/summary from feed entry.
 
         Args:
-            entry: Feedparser entry object
+            entry: Feed entry dict
 
         Returns:
-            Description string, cleaned of HTML tags
+            Description HTML or empty string
         """
-        # Try description field
-        if "description" in entry:
-            return self._clean_html(entry["description"])
+        for field in ("description", "summary", "subtitle"):
+            if field in entry:
+                return cast(str, entry[field])
+        return ""
 
-        # Try summary field
-        if "summary" in entry:
-            return self._clean_html(entry["summary"])
+    def _extract_description(self, entry: Any) -> str:
+        """
+        Extract description/summary from feed entry.
 
-        # Try subtitle
-        if "subtitle" in entry:
-            return self._clean_html(entry["subtitle"])
+        Args:
+            entry: Feed entry dict
 
-        return ""
+        Returns:
+            Description string, cleaned of HTML tags
+        """
+        return self._clean_html(self._raw_description(entry))
 
     def _extract_pub_date(self, entry: Any) -> datetime | None:
         """
         Extract publication date from feed entry.
 
+        Raw strings that look like RFC 822 dates (the RSS 2.0 pubDate
+        format, starting with a weekday or day name) go straight to
+        email.utils.parsedate_to_datetime; everything else, such as Atom's
+        ISO 8601 timestamps, goes through _parse_date.
+
         Args:
-            entry: Feedparser entry object
+            entry: Feed entry dict
 
         Returns:
             Datetime object or None if date cannot be parsed
         """
-        # Try various date field names
-        date_fields = ["published", "updated", "created", "pubDate"]
+        for field in ("published", "updated", "created", "pubDate"):
+            value = entry.get(field)
+            if not value:
+                continue
 
-        for field in date_fields:
-            if field in entry:
-                parsed = self._parse_date(entry[field])
-                if parsed:
-                    return parsed
+            if not value[:1].isdigit():
+                try:
+                    return parsedate_to_datetime(value)
+                except (TypeError, ValueError):
+                    pass
 
-        # Try timestamp_parsed (feedparser's parsed timestamp)
-        if "published_parsed" in entry and entry["published_parsed"]:
-            try:
-                return datetime(*entry["published_parsed"][:6])
-            except (TypeError, ValueError):
-                pass
+            parsed_date = self._parse_date(value)
+            if parsed_date:
+                return parsed_date
 
         return None
 
@@ -253,7 +424,7 @@ class RSSScraper(BaseScraper):
         Extract author from feed entry.
 
         Args:
-            entry: Feedparser entry object
+            entry: Feed entry dict
 
         Returns:
             Author name or empty string
@@ -262,13 +433,13 @@ class RSSScraper(BaseScraper):
         if "author" in entry:
             author = entry["author"]
             if isinstance(author, str):
-                return author
+                return _norm_text(author)
             if isinstance(author, dict) and "name" in author:
-                return author["name"]  # type: ignore
+                return _norm_text(author["name"])
 
         # Try author_detail
         if "author_detail" in entry and entry["author_detail"]:
-            return entry["author_detail"].get("name", "")  # type: ignore
+            return _norm_text(entry["author_detail"].get("name", ""))
 
         return ""
 
@@ -277,7 +448,7 @@ class RSSScraper(BaseScraper):
         Extract categories/tags from feed entry.
 
         Args:
-            entry: Feedparser entry object
+            entry: Feed entry dict
 
         Returns:
             List of category strings
@@ -288,55 +459,51 @@ class RSSScraper(BaseScraper):
         if "tags" in entry:
             for tag in entry["tags"]:
                 if isinstance(tag, str):
-                    categories.append(tag)
+                    categories.append(_norm_text(tag))
                 elif isinstance(tag, dict):
                     term = tag.get("term") or tag.get("label")
                     if term:
-                        categories.append(term)
+                        categories.append(_norm_text(term))
 
         # Try category field
         if "category" in entry:
             category = entry["category"]
             if isinstance(category, str):
-                categories.append(category)
+                categories.append(_norm_text(category))
             elif isinstance(category, list):
-                categories.extend(category)
+                categories.extend(_norm_text(term) for term in category)
 
         return categories
 
-    def _extract_image(self, entry: Any) -> str | None:
+    def _extract_image(self, entry: Any, *html: str) -> str | None:
         """
         Extract featured image URL from feed entry.
 
         Checks for image enclosures, media:content tags, and img tags.
 
         Args:
-            entry: Feedparser entry object
+            entry: Feed entry dict
+            *html: HTML already read from the entry to search for an img tag
+                (defaults to the raw description and content)
 
         Returns:
             Image URL string or None if not found
         """
         # Try enclosures (RSS media enclosures)
-        if "enclosures" in entry:
-            for enclosure in entry["enclosures"]:
-                if str(enclosure.get("type", "")).startswith("image/"):
-                    return str(enclosure.get("href", ""))
+        for enclosure in entry.get("enclosures", ()):
+            if enclosure.get("type", "").startswith("image/"):
+                return cast(str, enclosure.get("href", ""))
 
         # Try media_content (Media RSS extension)
-        if "media_content" in entry:
-            for media in entry["media_content"]:
-                if media.get("medium") == "image":
-                    return str(media.get("url", ""))
-
-        # Try image from content/description
-        description = self._extract_description(entry)
-        if description:
-            from bs4 import BeautifulSoup
+        for media in entry.get("media_content", ()):
+            if media.get("medium") == "image":
+                return cast(str, media.get("url", ""))
 
-            soup = BeautifulSoup(description, "html.parser")
-            img = soup.find("img")
-            if img and img.get("src"):
-                return str(img["src"])
+        # Try first <img> in the raw description/content HTML
+        for fragment in html or (self._raw_description(entry), self._extract_content(entry)):
+            match = _IMG_SRC_RE.search(fragment)
+            if match:
+                return html_lib.unescape(match.group(1))
 
         return None
 
@@ -345,25 +512,20 @@ class RSSScraper(BaseScraper):
         Extract full content from feed entry.
 
         Args:
-            entry: Feedparser entry object
+            entry: Feed entry dict
 
         Returns:
             Full content HTML or empty string
         """
-        # Try content field
-        if "content" in entry:
-            content_list = entry["content"]
-            if content_list and isinstance(content_list, list):
-                # content is often a list of dicts with 'value' key
-                return str(content_list[0].get("value", ""))
+        # Try content field (a list of dicts with a 'value' key)
+        content_list = entry.get("content")
+        if content_list and isinstance(content_list, list):
+            return cast(str, content_list[0].get("value", ""))
 
-        # Try summary if content not available
-        if "summary" in entry:
-            return str(entry["summary"])
-
-        # Try description
-        if "description" in entry:
-            return str(entry["description"])
+        # Try summary if content not available, then description
+        for field in ("summary", "description"):
+            if field in entry:
+                return cast(str, entry[field])
 
         return ""
 
@@ -372,6 +534,10 @@ class RSSScraper(BaseScraper):
         """
         Clean HTML by removing tags but preserving text.
 
+        Tags are stripped with a regex and entities decoded with
+        html.unescape; BeautifulSoup is only used when markup is left over
+        (e.g. an entity-escaped tag such as "&lt;b&gt;").
+
         Args:
             html: HTML string
 
@@ -381,7 +547,215 @@ class RSSScraper(BaseScraper):
         if not html:
             return ""
 
-        from bs4 import BeautifulSoup
+        text = html_lib.unescape(_TAG_RE.sub(" ", html))
+        if "<" not in text:
+            return " ".join(text.split())
 
         soup = BeautifulSoup(html, "html.parser")
         return soup.get_text(separator=" ", strip=True)
+
+
+@lru_cache(maxsize=4096)
+def _norm_text(value: str) -> str:
+    """
+    Normalize a repeated short string such as a category term or author.
+
+    Tags and author names recur across entries and feeds, so the stripped
+    value is interned and cached; every article then shares one str object
+    per distinct value.
+
+    Args:
+        value: Raw category term or author name
+
+    Returns:
+        Stripped, interned string
+    """
+    return sys.intern(value.strip())
+
+
+def _parse_feed_lxml(content: bytes) -> list[dict[str, Any]]:
+    """
+    Parse an RSS/Atom feed into feedparser-shaped entry dictionaries.
+
+    Only the keys read by RSSScraper's _extract_* helpers are produced:
+    title, link, links, id, description, summary, published, updated,
+    author, tags, enclosures, media_content and content. Entry HTML in
+    description, summary and content is sanitized as feedparser did.
+
+    Args:
+        content: Raw feed body
+
+    Returns:
+        List of entry dictionaries in document order
+
+    Raises:
+        etree.XMLSyntaxError: If the content cannot be parsed at all
+    """
+    root = etree.fromstring(content, parser=_FEED_PARSER)
+    if root is None:
+        return []
+    return [_entry_to_dict(element) for element in root.iter(*_ENTRY_TAGS)]
+
+
+def _entry_to_dict(element: etree._Element) -> dict[str, Any]:
+    """
+    Convert a single RSS item or Atom entry element into an entry dict.
+
+    The first occurrence of each single-valued field wins.
+
+    Args:
+        element: <item> or <entry> element
+
+    Returns:
+        Entry dictionary
+    """
+    entry: dict[str, Any] = {}
+    links: list[dict[str, str]] = []
+    tags: list[dict[str, str]] = []
+    enclosures: list[dict[str, str]] = []
+    media_content: list[dict[str, str]] = []
+    content: list[dict[str, str]] = []
+
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue  # Comments and processing instructions
+
+        qname = etree.QName(child)
+        name = qname.localname
+        text = (child.text or "").strip()
+
+        if qname.namespace == _MEDIA_NS:
+            if name == "content":
+                medium = child.get("medium") or (
+                    "image" if child.get("type", "").startswith("image/") else ""
+                )
+                media_content.append({"url": child.get("url", ""), "medium": medium})
+        elif name == "title":
+            entry.setdefault("title", text)
+        elif name == "link":
+            href = child.get("href")
+            if href is None:
+                entry.setdefault("link", text)  # RSS <link>url</link>
+                continue
+            rel = child.get("rel", "alternate")
+            link_type = child.get("type", "")
+            links.append({"rel": rel, "type": link_type, "href": href})
+            if rel == "alternate":
+                entry.setdefault("link", href)
+            elif rel == "enclosure":
+                enclosures.append({"href": href, "type": link_type})
+        elif name in ("guid", "id"):
+            entry.setdefault("id", text)
+        elif name == "description":
+            entry.setdefault("description", _sanitize_html(_inner_markup(child)))
+        elif name == "summary":
+            entry.setdefault("summary", _sanitize_html(_inner_markup(child)))
+        elif name in ("encoded", "content"):
+            content.append({"value": _sanitize_html(_inner_markup(child))})
+        elif name in ("pubDate", "published", "date", "issued"):
+            entry.setdefault("published", text)
+        elif name in ("updated", "modified"):
+            entry.setdefault("updated", text)
+        elif name in ("author", "creator"):
+            author = child.findtext(f"{{{_ATOM_NS}}}name") or text
+            if author:
+                entry.setdefault("author", author.strip())
+        elif name == "category":
+            term = child.get("term") or text
+            if term:
+                tags.append({"term": term})
+        elif name == "enclosure":
+            enclosures.append({"href": child.get("url", ""), "type": child.get("type", "")})
+
+    for key, values in (
+        ("links", links),
+        ("tags", tags),
+        ("enclosures", enclosures),
+        ("media_content", media_content),
+        ("content", content),
+    ):
+        if values:
+            entry[key] = values
+
+    return entry
+
+
+def _inner_markup(element: etree._Element) -> str:
+    """
+    Get the text of an element, including serialized child markup.
+
+    Atom type="xhtml" content is inline XML rather than escaped text.
+
+    Args:
+        element: Element to read
+
+    Returns:
+        Text content with child elements serialized as markup
+    """
+    if len(element) == 0:
+        return (element.text or "").strip()
+
+    parts = [element.text or ""]
+    for child in element:
+        parts.append(etree.tostring(child, encoding="unicode", with_tail=True))
+    return "".join(parts).strip()
+
+
+def _sanitize_html(html: str) -> str:
+    """
+    Reduce entry HTML to an allowlist of tags, attributes and URL schemes.
+
+    Feed HTML is republished in our own feed, so it is sanitized the way
+    feedparser did before handing it out. Scripts and embedded content are
+    dropped with their content, other unknown elements are unwrapped, and
+    only allowlisted attributes with http, https, mailto or relative URLs
+    are kept.
+
+    Args:
+        html: Untrusted HTML fragment
+
+    Returns:
+        Sanitized HTML fragment (unchanged if it contains no markup)
+    """
+    if "<" not in html:
+        return html
+
+    try:
+        fragment = lxml_html.fragment_fromstring(html, create_parent="div")
+    except (etree.ParserError, ValueError):
+        return ""
+
+    etree.strip_elements(
+        fragment, *_UNSAFE_TAGS, etree.Comment, etree.ProcessingInstruction, with_tail=False
+    )
+    for element in list(fragment.iterdescendants()):
+        if element.tag not in _SAFE_TAGS:
+            element.drop_tag()
+            continue
+        for attr in list(element.attrib):
+            if attr not in _SAFE_ATTRS or (
+                attr in _URL_ATTRS and not _is_safe_url(element.attrib[attr])
+            ):
+                del element.attrib[attr]
+
+    parts = [fragment.text or ""]
+    for child in fragment:
+        parts.append(etree.tostring(child, encoding="unicode", method="html", with_tail=True))
+    return "".join(parts)
+
+
+def _is_safe_url(url: str) -> bool:
+    """
+    Check whether a URL attribute uses an allowed scheme.
+
+    Args:
+        url: Attribute value
+
+    Returns:
+        True for relative URLs and http, https or mailto URLs
+    """
+    try:
+        scheme = urlsplit(_URL_IGNORED_RE.sub("", url)).scheme
+    except ValueError:
+        return False
+    return scheme.lower() in _SAFE_URL_SCHEMES
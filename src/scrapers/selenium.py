@@ -8,35 +8,126 @@ heavy client-side rendering. Selenium scrapers are classified as "HARD" difficul
 Note: Selenium requires Chrome/Chromium to be installed on the system.
 """
 
+import asyncio
 import logging
-import time
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
-from urllib.parse import urljoin, urlparse
+from types import MappingProxyType
+from typing import Any, ClassVar, Final
 
-from bs4 import BeautifulSoup, Tag
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from selenium import webdriver
 from selenium.common.exceptions import (
     TimeoutException,
     WebDriverException,
 )
-from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from soupsieve import SoupSieve
 
 from src.models import Article
-from src.scrapers.base import BaseScraper, ScrapingConfig
+from src.scrapers.base import (
+    ABSOLUTE_URL_PREFIXES,
+    BG_URL_RE,
+    BaseScraper,
+    ScrapingConfig,
+    SelectorMixin,
+    join_url,
+)
+from src.scrapers.driver_pool import get_driver_pool
+from src.utils.circuit_breaker import CircuitBreakerOpenError
 
 logger = logging.getLogger(__name__)
 
+# A tag name with at most one class or attribute test, e.g. div.card or
+# article[data-testid="tweet"]
+_SIMPLE_SELECTOR_RE: Final[re.Pattern[str]] = re.compile(
+    r"""(?P<tag>[a-zA-Z][\w-]*)?"""
+    r"""(?:\.(?P<cls>[\w-]+)|\[(?P<attr>[\w-]+)=(?P<q>["']?)(?P<value>[^"'\]]+)(?P=q)\])?"""
+)
+
+
+def _css_to_strainer(selector: str) -> SoupStrainer | None:
+    """
+    Translate an article selector into a SoupStrainer, if it is simple enough.
+
+    Supported are a single simple selector, a list of bare tag names, or a
+    list of selectors sharing one tag and one attribute (e.g. ".a, .b").
+    Anything else (combinators, pseudo-classes, mixed lists) returns None
+    and the page is parsed in full.
+
+    Args:
+        selector: CSS selector for article elements
+
+    Returns:
+        Strainer keeping only candidate article subtrees, or None
+    """
+    shapes: set[tuple[str | None, str | None]] = set()
+    names: list[str] = []
+    values: list[str] = []
+    for part in selector.split(","):
+        match = _SIMPLE_SELECTOR_RE.fullmatch(part.strip())
+        if not match or not (match["tag"] or match["cls"] or match["attr"]):
+            return None
+        attr = "class" if match["cls"] else match["attr"]
+        value = match["cls"] or match["value"]
+        shapes.add((match["tag"] if attr else None, attr))
+        if match["tag"]:
+            names.append(match["tag"])
+        if value:
+            values.append(value)
+
+    if len(shapes) != 1:
+        return None
+    tag, attr = shapes.pop()
+    if attr is None:
+        return SoupStrainer(names)
+    if attr == "class":
+        # The strainer sees the raw class attribute, e.g. "card featured"
+        alternatives = "|".join(re.escape(value) for value in values)
+        return SoupStrainer(tag, {attr: re.compile(rf"(?:^|\s)(?:{alternatives})(?:\s|$)")})
+    return SoupStrainer(tag, {attr: values[0] if len(values) == 1 else values})
+
+
+@dataclass(slots=True)
+class _ParsedFields:
+    """
+    Fields extracted from one article element before the Article is built.
+
+    Attributes:
+        title: Article title
+        url: Absolute article URL
+        pub_date: Publication date, if one was found
+        matches: Field elements found by _match_fields()
+        description: Article summary (filled by _parse_enrichment)
+        image_url: Absolute image URL (filled by _parse_enrichment)
+    """
+
+    title: str
+    url: str
+    pub_date: datetime | None
+    matches: dict[str, Tag]
+    description: str = ""
+    image_url: str | None = None
 
-class SeleniumScraper(BaseScraper):
+
+class SeleniumScraper(SelectorMixin, BaseScraper):
     """
     Scraper for sites requiring JavaScript execution.
 
     This scraper uses Selenium WebDriver to control a headless Chrome browser,
     allowing it to scrape sites that require JavaScript for content rendering.
+    Browsers are borrowed from the shared ChromeDriverPool for each fetch
+    rather than launched and quit every time.
+
+    Many of these pages are actually rendered server-side, so each source is
+    first fetched with plain HTTP. Chrome is only used when that HTML has no
+    article elements, and the source is then remembered as JavaScript-only
+    so later fetches go straight to Selenium.
 
     Selenium scrapers are the most complex because:
     - Require browser driver installation and configuration
@@ -108,6 +199,44 @@ class SeleniumScraper(BaseScraper):
         },
     }
 
+    # Fallback selectors for sources without an entry in SELECTORS
+    DEFAULT_SELECTORS: dict[str, str] = {
+        "article": "article, .post, .news-item, .item",
+        "title": "h2 a, h3 a, h2, h3, .title",
+        "url": "a[href]",
+        "description": ".excerpt, .summary, p",
+        "image": "img",
+        "date": "time, .date, .time",
+    }
+
+    # Strainers limiting page parsing to article subtrees (None: full parse)
+    _ARTICLE_STRAINERS: Mapping[str, SoupStrainer | None] = MappingProxyType({})
+    _DEFAULT_ARTICLE_STRAINER: SoupStrainer | None = None
+
+    # Longest wait for the article count to stop growing, and how often it is polled
+    STABILIZE_TIMEOUT: float = 3.0
+    STABILIZE_POLL: float = 0.2
+
+    # Source IDs whose pages only contain articles after JavaScript runs
+    _requires_js: ClassVar[set[str]] = set()
+
+    @classmethod
+    def _compile_selectors(cls) -> None:
+        """
+        Compile all configured CSS selectors into soupsieve matchers.
+
+        Besides the shared compilation, article selectors are turned into
+        SoupStrainers where possible.
+        """
+        super()._compile_selectors()
+        cls._ARTICLE_STRAINERS = MappingProxyType(
+            {
+                source_id: _css_to_strainer(fields["article"])
+                for source_id, fields in cls.SELECTORS.items()
+            }
+        )
+        cls._DEFAULT_ARTICLE_STRAINER = _css_to_strainer(cls.DEFAULT_SELECTORS["article"])
+
     def __init__(self, config: ScrapingConfig, locale: str = "en-us") -> None:
         """
         Initialize the Selenium scraper.
@@ -118,14 +247,27 @@ class SeleniumScraper(BaseScraper):
         """
         super().__init__(config, locale)
         self._driver: webdriver.Chrome | None = None
-        self._driver_initialized = False
+        self._driver_broken = False
+        self._driver_lock = asyncio.Lock()
+
+        # Compiled selectors for this source, or defaults if not configured
+        self._selectors: Mapping[str, SoupSieve] = self._compiled_selectors_for(config.source_id)
+        self._article_strainer: SoupStrainer | None = self._ARTICLE_STRAINERS.get(
+            config.source_id, self._DEFAULT_ARTICLE_STRAINER
+        )
 
     async def fetch_articles(self) -> list[Article]:
         """
         Fetch and parse articles using Selenium WebDriver.
 
-        Launches a headless browser, navigates to the URL, waits for
-        content to load, and extracts articles using CSS selectors.
+        Unless the source is known to need JavaScript, the page is first
+        fetched over plain HTTP and parsed directly. If that finds no
+        article elements, or only ones without a parsable title and link
+        (placeholders filled in by JavaScript), the source is marked as
+        needing JavaScript and Selenium is used. Otherwise this borrows
+        a headless browser from the driver pool, navigates to the URL, waits
+        for content to load, and extracts articles using CSS selectors. The
+        browser is returned to the pool afterwards.
 
         Returns:
             List of Article objects parsed from the page
@@ -136,69 +278,71 @@ class SeleniumScraper(BaseScraper):
             Exception: For other scraping errors
         """
         url = self.config.get_feed_url(self.locale)
-        logger.info(f"Fetching with Selenium from {url}")
 
-        try:
-            # Initialize driver
-            await self._init_driver()
-            assert self._driver is not None  # Driver initialized
+        if self.config.source_id not in self._requires_js:
+            article_elements = await self._fetch_static_elements(url)
+            if article_elements:
+                parsed = self._parse_core_elements(article_elements)
+                if parsed:
+                    articles = await self._build_articles(parsed)
+                    logger.info(
+                        f"Fetched {len(articles)} articles from {self.config.source_id} "
+                        "without Selenium"
+                    )
+                    return articles
 
-            # Navigate to URL
-            self._driver.get(url)
+                logger.info(
+                    f"{self.config.source_id} serves placeholder article elements, using Selenium"
+                )
+                self._requires_js.add(self.config.source_id)
 
-            # Wait for page to load
-            await self._wait_for_page_load()
+        logger.info(f"Fetching with Selenium from {url}")
 
-            # Get page HTML
-            assert self._driver is not None  # Driver still valid
-            html = self._driver.page_source
-            soup = BeautifulSoup(html, "html.parser")
+        # One Selenium call at a time on this scraper's WebDriver session
+        async with self._driver_lock:
+            try:
+                # Initialize driver
+                await self._init_driver()
+                driver = self._require_driver()
 
-            # Get selectors for this source
-            selectors = self._get_selectors()
+                # Navigate to URL (blocking WebDriver calls run in a worker thread)
+                await asyncio.to_thread(driver.get, url)
 
-            # Find all article elements
-            article_selector = selectors["article"]
-            article_elements = soup.select(article_selector)
+                # Wait for page to load
+                await self._wait_for_page_load()
 
-            if not article_elements:
-                logger.warning(
-                    f"No article elements found with selector '{article_selector}' "
-                    f"for {self.config.source_id}"
-                )
-                return []
+                # Get page HTML
+                html = await asyncio.to_thread(getattr, driver, "page_source")
 
-            # Parse each article element
-            articles = []
-            max_articles = 50  # Limit to avoid overwhelming
+                # Find all article elements
+                article_elements = self._select_articles(html)
 
-            for element in article_elements[:max_articles]:
-                try:
-                    article = await self.parse_article(element)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
+                if not article_elements:
                     logger.warning(
-                        f"Failed to parse article element from {self.config.source_id}: {e}"
+                        "No article elements found with selector "
+                        f"'{self._selectors['article'].pattern}' "
+                        f"for {self.config.source_id}"
                     )
-                    continue
-
-            logger.info(f"Fetched {len(articles)} articles from {self.config.source_id}")
-            return articles
-
-        except TimeoutException as e:
-            logger.error(f"Timeout waiting for page load: {e}")
-            raise
-        except WebDriverException as e:
-            logger.error(f"WebDriver error: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Error fetching articles from {self.config.source_id}: {e}")
-            raise
-        finally:
-            await self._cleanup_driver()
+                    return []
+
+                articles = await self._parse_elements(article_elements)
+                logger.info(f"Fetched {len(articles)} articles from {self.config.source_id}")
+                return articles
+
+            except TimeoutException as e:
+                logger.error(f"Timeout waiting for page load: {e}")
+                raise
+            except WebDriverException as e:
+                logger.error(f"WebDriver error: {e}")
+                self._driver_broken = True
+                raise
+            except Exception as e:
+                logger.error(f"Error fetching articles from {self.config.source_id}: {e}")
+                raise
+            finally:
+                await self._cleanup_driver()
 
-    async def parse_article(self, element: Any) -> Article | None:
+    def parse_article(self, element: Any) -> Article | None:
         """
         Parse a single HTML element into an Article object.
 
@@ -208,139 +352,302 @@ class SeleniumScraper(BaseScraper):
         Returns:
             Article object if parsing succeeds, None if required fields missing
         """
+        fields = self._parse_core(element)
+        if fields is None:
+            return None
+
+        self._parse_enrichment(fields)
+        return self._build_article(fields)
+
+    def _build_article(self, fields: _ParsedFields) -> Article:
+        """
+        Create an Article from extracted fields.
+
+        Args:
+            fields: Fields extracted from an article element
+
+        Returns:
+            Article object
+        """
+        return self._create_article(
+            title=fields.title,
+            url=fields.url,
+            pub_date=fields.pub_date,
+            description=fields.description,
+            image_url=fields.image_url,
+        )
+
+    def _parse_core(self, element: Any) -> _ParsedFields | None:
+        """
+        Extract the fields that identify an article: title, URL and date.
+
+        Args:
+            element: BeautifulSoup Tag element
+
+        Returns:
+            Extracted fields without description and image, or None if the
+            title or URL is missing
+        """
         if not element or not isinstance(element, Tag):
             return None
 
-        selectors = self._get_selectors()
+        # Locate every field's element in one walk of the article subtree
+        matches, first_link = self._match_fields(element, self._selectors)
 
         # Extract required fields
-        title = self._extract_title(element, selectors["title"])
-        url = self._extract_url(element, selectors["url"])
+        title = self._extract_title(matches.get("title"))
+        url = self._extract_url(element, matches.get("url"), first_link)
 
         if not title or not url:
             logger.debug("Skipping element: missing title or URL")
             return None
 
-        # Make URL absolute
-        url = self._make_absolute(url)
+        return _ParsedFields(
+            title=title,
+            url=self._make_absolute(url),
+            pub_date=self._extract_date(matches.get("date")),
+            matches=matches,
+        )
 
-        # Extract optional fields
-        description = self._extract_description(element, selectors.get("description"))
-        pub_date = self._extract_date(element, selectors.get("date"))
-        image_url = self._extract_image(element, selectors.get("image"))
+    def _parse_enrichment(self, fields: _ParsedFields) -> None:
+        """
+        Extract the display-only fields, description and image URL, in place.
 
-        if image_url:
-            image_url = self._make_absolute(image_url)
+        Args:
+            fields: Fields returned by _parse_core()
+        """
+        fields.description = self._extract_description(fields.matches.get("description"))
+        image_url = self._extract_image(fields.matches.get("image"))
+        fields.image_url = self._make_absolute(image_url) if image_url else None
 
-        # Create and return Article
-        return self._create_article(
-            title=title,
-            url=url,
-            pub_date=pub_date,
-            description=description,
-            image_url=image_url,
+    async def _fetch_static_elements(self, url: str) -> list[Tag]:
+        """
+        Fetch the page over plain HTTP and select its article elements.
+
+        When the server-rendered HTML has no article elements, the source is
+        marked as requiring JavaScript so later fetches skip this probe.
+        Network errors return an empty list without marking the source.
+
+        Args:
+            url: Page URL to fetch
+
+        Returns:
+            Article elements found in the static HTML (may be empty)
+        """
+        try:
+            body, encoding = await self._fetch_bytes(url, conditional=False)
+        except (httpx.HTTPError, CircuitBreakerOpenError, PermissionError) as e:
+            logger.debug(
+                f"Plain HTTP fetch failed for {self.config.source_id}, using Selenium: {e}"
+            )
+            return []
+
+        article_elements = self._select_articles(body, encoding)
+
+        if not article_elements:
+            logger.info(f"{self.config.source_id} renders articles with JavaScript, using Selenium")
+            self._requires_js.add(self.config.source_id)
+
+        return article_elements
+
+    def _select_articles(self, markup: str | bytes, encoding: str | None = None) -> list[Tag]:
+        """
+        Parse a page and select its article elements.
+
+        Uses the C-based lxml parser (rendered pages are often several MB)
+        and, when the article selector allows it, a SoupStrainer so that
+        only article subtrees are built.
+
+        Args:
+            markup: Page HTML
+            encoding: Encoding of markup, if it is bytes with a known charset
+
+        Returns:
+            Article elements found on the page
+        """
+        soup = BeautifulSoup(
+            markup, "lxml", parse_only=self._article_strainer, from_encoding=encoding
         )
+        return self._selectors["article"].select(soup)
 
-    async def _init_driver(self) -> None:
+    async def _parse_elements(self, article_elements: list[Tag]) -> list[Article]:
         """
-        Initialize the Selenium WebDriver.
+        Parse article elements into Articles, skipping ones that fail.
 
-        Configures Chrome with headless mode and appropriate options
-        for server environments.
+        Args:
+            article_elements: Article elements selected from the page
 
-        Raises:
-            WebDriverException: If driver initialization fails
+        Returns:
+            Parsed articles (at most MAX_ARTICLES)
         """
-        if self._driver_initialized and self._driver:
-            return
+        return await self._build_articles(self._parse_core_elements(article_elements))
 
-        logger.debug("Initializing Selenium WebDriver")
+    def _parse_core_elements(self, article_elements: list[Tag]) -> list[_ParsedFields]:
+        """
+        Extract title, URL and date from article elements, skipping ones that fail.
 
-        options = ChromeOptions()
+        Args:
+            article_elements: Article elements selected from the page
 
-        # Headless mode
-        options.add_argument("--headless=new")
+        Returns:
+            Core fields of the parsable elements (at most MAX_ARTICLES)
+        """
+        parsed: list[_ParsedFields] = []
+        for element in article_elements[: self.MAX_ARTICLES]:
+            try:
+                fields = self._parse_core(element)
+            except Exception as e:
+                logger.warning(f"Failed to parse article element from {self.config.source_id}: {e}")
+                continue
+            if fields:
+                parsed.append(fields)
+        return parsed
 
-        # Stability options
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-software-rasterizer")
+    async def _build_articles(self, parsed: list[_ParsedFields]) -> list[Article]:
+        """
+        Build Articles from parsed core fields.
 
-        # Performance options
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-images")
-        options.add_argument("--disable-javascript")  # If site allows
-        options.add_argument("--blink-settings=imagesEnabled=false")
+        Articles whose GUID is already stored (see existing_guids) will be
+        dropped as duplicates on save, so their description and image are
+        not extracted.
 
-        # User agent
-        options.add_argument(f"--user-agent={self.config.get_user_agent()}")
+        Args:
+            parsed: Fields returned by _parse_core_elements()
 
-        # Window size (some sites require minimum size)
-        options.add_argument("--window-size=1920,1080")
+        Returns:
+            Articles in page order
+        """
+        known = await self._lookup_existing_guids(
+            {self._generate_guid(fields.url) for fields in parsed}
+        )
+
+        articles = []
+        for fields in parsed:
+            if self._generate_guid(fields.url) not in known:
+                try:
+                    self._parse_enrichment(fields)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to parse article element from {self.config.source_id}: {e}"
+                    )
+                    continue
+            articles.append(self._build_article(fields))
+        return articles
+
+    async def _init_driver(self) -> None:
+        """
+        Borrow a WebDriver from the shared pool for this scraper.
 
-        # Language
-        options.add_argument(f"--lang={self.locale}")
-        options.add_experimental_option("prefs", {"intl.accept_languages": self.locale})
+        The pooled browsers are generic, so the source's user agent and the
+        scraper's locale (Accept-Language) are applied to the lease over CDP.
 
+        Raises:
+            WebDriverException: If no driver can be started or configured
+        """
+        if self._driver:
+            return
+
+        pool = get_driver_pool()
+        driver = await pool.acquire()
         try:
-            # Try to use system Chrome/Chromium
-            self._driver = webdriver.Chrome(options=options)
-            self._driver_initialized = True
-            logger.debug("Selenium WebDriver initialized successfully")
-        except WebDriverException as e:
-            logger.error(f"Failed to initialize Chrome driver: {e}")
-            raise WebDriverException(
-                "Selenium requires Chrome/Chromium to be installed. "
-                "For Docker, install chromium and chromium-driver."
-            ) from e
+            await asyncio.to_thread(
+                driver.execute_cdp_cmd,
+                "Network.setUserAgentOverride",
+                {"userAgent": self.config.get_user_agent(), "acceptLanguage": self.locale},
+            )
+        except WebDriverException:
+            await pool.release(driver, broken=True)
+            raise
+
+        self._driver = driver
+        self._driver_broken = False
+
+    def _require_driver(self) -> webdriver.Chrome:
+        """
+        Get the borrowed WebDriver.
+
+        Returns:
+            WebDriver acquired by _init_driver()
+
+        Raises:
+            WebDriverException: If no driver is currently borrowed
+        """
+        driver = self._driver
+        if driver is None:
+            raise WebDriverException("Driver not initialized")
+        return driver
 
     async def _wait_for_page_load(self, timeout: int = 10) -> None:
         """
         Wait for the page to fully load.
 
         Waits for either body element or configured article elements to
-        be present in the DOM.
+        be present in the DOM. Once articles appear, waits until their count
+        stops growing so lazily rendered items are included.
 
         Args:
             timeout: Maximum time to wait in seconds
 
         Raises:
             TimeoutException: If page doesn't load within timeout
+            WebDriverException: If no driver is currently borrowed
         """
-        if not self._driver:
-            raise WebDriverException("Driver not initialized")
-
+        driver = self._require_driver()
         selectors = self._get_selectors()
-        wait = WebDriverWait(self._driver, timeout)
+        wait = WebDriverWait(driver, timeout)
 
         try:
             # Wait for article elements to appear
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selectors["article"])))
+            await asyncio.to_thread(
+                wait.until, EC.presence_of_element_located((By.CSS_SELECTOR, selectors["article"]))
+            )
             logger.debug("Page loaded: article elements found")
+            await self._wait_for_stable_articles(driver, selectors["article"])
         except TimeoutException:
             # Fall back to waiting for body
             try:
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                await asyncio.to_thread(
+                    wait.until, EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
                 logger.debug("Page loaded: body element found")
             except TimeoutException:
                 logger.warning("Page load timeout, proceeding anyway")
                 # Don't raise - let caller handle empty results
 
-        # Additional wait for dynamic content
-        time.sleep(1)
+    async def _wait_for_stable_articles(
+        self, driver: webdriver.Chrome, article_selector: str
+    ) -> None:
+        """
+        Wait until the number of article elements stops changing.
+
+        Polls every STABILIZE_POLL seconds and returns once two consecutive
+        polls see the same non-zero count, or after STABILIZE_TIMEOUT.
+
+        Args:
+            driver: WebDriver with the page loaded
+            article_selector: CSS selector for article elements
+        """
+        last_count = 0
+
+        def stable(drv: webdriver.Chrome) -> bool:
+            nonlocal last_count
+            count = len(drv.find_elements(By.CSS_SELECTOR, article_selector))
+            if count and count == last_count:
+                return True
+            last_count = count
+            return False
+
+        wait = WebDriverWait(driver, self.STABILIZE_TIMEOUT, poll_frequency=self.STABILIZE_POLL)
+        try:
+            await asyncio.to_thread(wait.until, stable)
+        except TimeoutException:
+            logger.debug(f"Article count still changing after {self.STABILIZE_TIMEOUT}s")
 
     async def _cleanup_driver(self) -> None:
-        """Cleanup and close the WebDriver."""
+        """Return the borrowed WebDriver to the pool, recycling it if it broke."""
         if self._driver:
-            try:
-                self._driver.quit()
-                logger.debug("WebDriver closed")
-            except Exception as e:
-                logger.warning(f"Error closing WebDriver: {e}")
-            finally:
-                self._driver = None
-                self._driver_initialized = False
+            driver, self._driver = self._driver, None
+            await get_driver_pool().release(driver, broken=self._driver_broken)
 
     def _get_selectors(self) -> dict[str, str]:
         """
@@ -351,125 +658,96 @@ class SeleniumScraper(BaseScraper):
         Returns:
             Dictionary mapping field names to CSS selectors
         """
-        # Get source-specific selectors
-        if self.config.source_id in self.SELECTORS:
-            return self.SELECTORS[self.config.source_id]
+        return self.SELECTORS.get(self.config.source_id, self.DEFAULT_SELECTORS)
 
-        # Return default selectors
-        return {
-            "article": "article, .post, .news-item, .item",
-            "title": "h2 a, h3 a, h2, h3, .title",
-            "url": "a[href]",
-            "description": ".excerpt, .summary, p",
-            "image": "img",
-            "date": "time, .date, .time",
-        }
-
-    def _extract_title(self, element: Tag, selector: str) -> str:
+    @staticmethod
+    def _extract_title(title_elem: Tag | None) -> str:
         """
-        Extract title from element using CSS selector.
+        Extract title from the element matched by the title selector.
 
         Args:
-            element: BeautifulSoup Tag element
-            selector: CSS selector for title
+            title_elem: Element matching the title selector, if any
 
         Returns:
             Title string or empty string if not found
         """
-        title_elem = element.select_one(selector)
         if title_elem:
             return title_elem.get_text(strip=True)
         return ""
 
-    def _extract_url(self, element: Tag, selector: str) -> str:
+    @staticmethod
+    def _extract_url(element: Tag, link_elem: Tag | None, first_link: Tag | None) -> str:
         """
-        Extract URL from element using CSS selector.
+        Extract URL from the matched link elements.
 
         Args:
-            element: BeautifulSoup Tag element
-            selector: CSS selector for URL
+            element: BeautifulSoup Tag element of the article
+            link_elem: Element matching the URL selector, if any
+            first_link: First <a> element within the article, if any
 
         Returns:
             URL string or empty string if not found
         """
-        link_elem = element.select_one(selector)
         if link_elem and link_elem.get("href"):
             return str(link_elem["href"])
 
         if element.name == "a" and element.get("href"):
             return str(element["href"])
 
-        link_elem = element.find("a")
-        if link_elem and link_elem.get("href"):
-            return str(link_elem["href"])
+        if first_link and first_link.get("href"):
+            return str(first_link["href"])
 
         return ""
 
-    def _extract_description(self, element: Tag, selector: str | None) -> str:
+    @staticmethod
+    def _extract_description(desc_elem: Tag | None) -> str:
         """
-        Extract description from element using CSS selector.
+        Extract description from the element matched by the description selector.
 
         Args:
-            element: BeautifulSoup Tag element
-            selector: CSS selector for description
+            desc_elem: Element matching the description selector, if any
 
         Returns:
             Description string or empty string if not found
         """
-        if not selector:
-            return ""
-
-        desc_elem = element.select_one(selector)
         if desc_elem:
-            return str(desc_elem.get_text(strip=True))
+            return desc_elem.get_text(strip=True)
 
         return ""
 
-    def _extract_date(self, element: Tag, selector: str | None) -> datetime | None:
+    def _extract_date(self, date_elem: Tag | None) -> datetime | None:
         """
-        Extract publication date from element using CSS selector.
+        Extract publication date from the element matched by the date selector.
 
         Args:
-            element: BeautifulSoup Tag element
-            selector: CSS selector for date
+            date_elem: Element matching the date selector, if any
 
         Returns:
             Datetime object or None if date cannot be parsed
         """
-        if not selector:
-            return None
-
-        date_elem = element.select_one(selector)
         if not date_elem:
             return None
 
         if date_elem.get("datetime"):
             return self._parse_date(str(date_elem["datetime"]))
 
-        if date_elem.name == "time" and date_elem.get("datetime"):
-            return self._parse_date(str(date_elem["datetime"]))
-
         date_text = date_elem.get_text(strip=True)
         if date_text:
-            return self._parse_date(str(date_text))
+            return self._parse_date(date_text)
 
         return None
 
-    def _extract_image(self, element: Tag, selector: str | None) -> str | None:
+    @staticmethod
+    def _extract_image(img_elem: Tag | None) -> str | None:
         """
-        Extract image URL from element using CSS selector.
+        Extract image URL from the element matched by the image selector.
 
         Args:
-            element: BeautifulSoup Tag element
-            selector: CSS selector for image
+            img_elem: Element matching the image selector, if any
 
         Returns:
             Image URL string or None if not found
         """
-        if not selector:
-            return None
-
-        img_elem = element.select_one(selector)
         if not img_elem:
             return None
 
@@ -481,9 +759,7 @@ class SeleniumScraper(BaseScraper):
 
         style = img_elem.get("style", "")
         if isinstance(style, str) and "background-image" in style:
-            import re
-
-            match = re.search(r'url\(["\']?(.*?)["\']?\)', style)
+            match = BG_URL_RE.search(style)
             if match:
                 return match.group(1)
 
@@ -502,17 +778,22 @@ class SeleniumScraper(BaseScraper):
         if not url:
             return ""
 
-        if urlparse(url).scheme in ("http", "https"):
+        if url.startswith(ABSOLUTE_URL_PREFIXES):
             return url
 
-        return urljoin(self.config.base_url, url)
+        return join_url(self.config.base_url, url)
 
     async def __aexit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
         """Async context manager exit - cleanup driver."""
         await super().__aexit__(exc_type, exc_val, exc_tb)
-        await self._cleanup_driver()
+        async with self._driver_lock:
+            await self._cleanup_driver()
 
     async def close(self) -> None:
         """Close resources including WebDriver."""
         await super().close()
-        await self._cleanup_driver()
+        async with self._driver_lock:
+            await self._cleanup_driver()
+
+
+SeleniumScraper._compile_selectors()
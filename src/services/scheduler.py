@@ -5,6 +5,7 @@ This module provides the NewsScheduler class which uses APScheduler
 to trigger news updates at configured intervals.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any
@@ -42,6 +43,9 @@ class NewsScheduler:
         self.update_service = UpdateServiceV2(repository)
         self.scheduler = AsyncIOScheduler()
         self.is_running = False
+        # Strong references keep in-flight GitHub dispatches from being
+        # garbage-collected before they finish
+        self._pending_dispatches: set[asyncio.Task[None]] = set()
 
     def start(self) -> None:
         """Start the scheduler."""
@@ -91,6 +95,9 @@ class NewsScheduler:
         """
         Job function for updates.
 
+        The GitHub Pages dispatch runs in the background, so the job (and its
+        max_instances slot) finishes as soon as the update is done.
+
         Returns:
             Update statistics dictionary
         """
@@ -99,39 +106,56 @@ class NewsScheduler:
 
             # Trigger GitHub Pages update if new articles found
             if settings.enable_github_pages_sync and stats.get("new_articles", 0) > 0:
-                try:
-                    if settings.github_token:
-                        dispatcher = GitHubWorkflowDispatcher(
-                            token=settings.github_token,
-                            repository=settings.github_repository,
-                        )
-                        success = await dispatcher.trigger_workflow(
-                            workflow_file="publish-news.yml",
-                            inputs={
-                                "triggered_by": "windows-app",
-                                "reason": f"new-articles-found-{stats['new_articles']}",
-                            },
-                        )
-                        if success:
-                            logger.info(
-                                "GitHub Pages update triggered",
-                                extra={"new_articles": stats["new_articles"]},
-                            )
-                    else:
-                        logger.warning("GitHub Pages sync enabled but GITHUB_TOKEN not configured")
-                except Exception as e:
-                    # Don't crash scheduler if GitHub API fails
-                    logger.error(
-                        "Failed to trigger GitHub Pages update",
-                        extra={"error": str(e)},
-                        exc_info=True,
+                if settings.github_token:
+                    task = asyncio.create_task(
+                        self._dispatch_safe(settings.github_token, stats["new_articles"])
                     )
+                    self._pending_dispatches.add(task)
+                    task.add_done_callback(self._pending_dispatches.discard)
+                else:
+                    logger.warning("GitHub Pages sync enabled but GITHUB_TOKEN not configured")
 
             return stats
         except Exception as e:
             logger.error(f"Update job failed: {e}")
             return {"error": str(e), "timestamp": datetime.utcnow().isoformat()}
 
+    async def _dispatch_safe(self, token: str, new_articles: int) -> None:
+        """
+        Trigger the GitHub Pages workflow, logging instead of raising.
+
+        The dispatcher is built here too, so a configuration error is logged
+        like any other dispatch failure and never loses the update stats.
+
+        Args:
+            token: GitHub token for the workflow dispatch API
+            new_articles: Number of new articles found by the update
+        """
+        try:
+            dispatcher = GitHubWorkflowDispatcher(
+                token=token,
+                repository=settings.github_repository,
+            )
+            success = await dispatcher.trigger_workflow(
+                workflow_file="publish-news.yml",
+                inputs={
+                    "triggered_by": "windows-app",
+                    "reason": f"new-articles-found-{new_articles}",
+                },
+            )
+            if success:
+                logger.info(
+                    "GitHub Pages update triggered",
+                    extra={"new_articles": new_articles},
+                )
+        except Exception as e:
+            # Don't crash scheduler if GitHub API fails
+            logger.error(
+                "Failed to trigger GitHub Pages update",
+                extra={"error": str(e)},
+                exc_info=True,
+            )
+
     def get_status(self) -> dict[str, Any]:
         """
         Get scheduler status.
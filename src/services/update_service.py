@@ -10,17 +10,26 @@ sources with rate limiting and multi-locale support.
 
 import asyncio
 import logging
-from dataclasses import dataclass
-from datetime import datetime
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
+from itertools import product
+from operator import attrgetter
 from typing import Any
 
 from src.api_client import LoLNewsAPIClient
 from src.config import RIOT_LOCALES, get_settings
 from src.database import ArticleRepository
 from src.models import Article, ArticleSource, SourceCategory
-from src.scrapers import ALL_SCRAPER_SOURCES, get_scraper
-from src.utils.circuit_breaker import CircuitBreakerOpenError, get_circuit_breaker_registry
+from src.scrapers import ALL_SCRAPER_SOURCES, get_scraper, warmup_scrapers
+from src.scrapers.base import get_shared_client
+from src.utils.circuit_breaker import (
+    CircuitBreakerOpenError,
+    CircuitBreakerState,
+    get_circuit_breaker_registry,
+)
 from src.utils.metrics import (
     active_update_tasks,
     articles_fetched_total,
@@ -29,11 +38,45 @@ from src.utils.metrics import (
     update_all_circuit_breaker_metrics,
     update_scraper_last_success,
 )
+from src.utils.rate_limiter import AsyncRateLimiter, ResizableSemaphore
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+async def _save_articles(repository: ArticleRepository, articles: list[Article]) -> int:
+    """
+    Save fetched articles, counting the ones that were new.
+
+    Articles are inserted with one batched save_many() call. If that
+    fails, they are saved one by one so a single bad article does not
+    lose the whole batch.
+
+    Args:
+        repository: Repository to save into
+        articles: Articles to save
+
+    Returns:
+        Number of new articles saved
+    """
+    if not articles:
+        return 0
+
+    try:
+        return await repository.save_many(articles)
+    except Exception as e:
+        logger.warning(f"Batch save of {len(articles)} articles failed, saving singly: {e}")
+
+    new_count = 0
+    for article in articles:
+        try:
+            if await repository.save(article):
+                new_count += 1
+        except Exception as e:
+            logger.error(f"Error saving article {article.guid}: {e}")
+    return new_count
+
+
 class UpdateService:
     """
     Service for updating news articles from LoL API.
@@ -50,9 +93,12 @@ class UpdateService:
             repository: Article repository for database operations
         """
         self.repository = repository
+
+        # Both locales reuse the pooled keep-alive connections of the shared client
+        http_client = get_shared_client()
         self.clients = {
-            "en-us": LoLNewsAPIClient(),
-            "it-it": LoLNewsAPIClient(),
+            "en-us": LoLNewsAPIClient(http_client=http_client),
+            "it-it": LoLNewsAPIClient(http_client=http_client),
         }
         self.last_update: datetime | None = None
         self.update_count: int = 0
@@ -62,15 +108,19 @@ class UpdateService:
         """
         Fetch and save articles from all sources.
 
+        Locales are updated concurrently; a failure in one locale is
+        recorded in the errors list without affecting the others.
+
         Returns:
             Dictionary with update statistics including fetched, new,
             duplicate counts, and any errors encountered
         """
         logger.info("Starting update for all sources...")
-        start_time = datetime.utcnow()
+        t0 = time.monotonic()
+        started_at = datetime.now(timezone.utc)
 
         stats: dict[str, Any] = {
-            "started_at": start_time.isoformat(),
+            "started_at": started_at.isoformat(),
             "sources": {},
             "total_fetched": 0,
             "total_new": 0,
@@ -78,26 +128,31 @@ class UpdateService:
             "errors": [],
         }
 
-        # Update each source
-        for locale, client in self.clients.items():
-            try:
-                source_stats = await self._update_source(locale, client)
-                stats["sources"][locale] = source_stats
-                stats["total_fetched"] += source_stats["fetched"]
-                stats["total_new"] += source_stats["new"]
-                stats["total_duplicates"] += source_stats["duplicates"]
-
-            except Exception as e:
-                error_msg = f"Error updating {locale}: {e}"
+        # Update all locales concurrently; they share no state but the repository
+        results = await asyncio.gather(
+            *(self._update_source(locale, client) for locale, client in self.clients.items()),
+            return_exceptions=True,
+        )
+
+        for locale, result in zip(self.clients, results, strict=True):
+            if isinstance(result, dict):
+                stats["sources"][locale] = result
+                stats["total_fetched"] += result["fetched"]
+                stats["total_new"] += result["new"]
+                stats["total_duplicates"] += result["duplicates"]
+            elif isinstance(result, Exception):
+                error_msg = f"Error updating {locale}: {result}"
                 logger.error(error_msg)
                 stats["errors"].append(error_msg)
                 self.error_count += 1
+            else:
+                raise result
 
         # Update stats
-        self.last_update = datetime.utcnow()
+        elapsed = time.monotonic() - t0
+        self.last_update = datetime.now(timezone.utc)
         self.update_count += 1
 
-        elapsed = (datetime.utcnow() - start_time).total_seconds()
         stats["completed_at"] = self.last_update.isoformat()
         stats["elapsed_seconds"] = round(elapsed, 2)
 
@@ -127,16 +182,9 @@ class UpdateService:
 
         stats = {"fetched": len(articles), "new": 0, "duplicates": 0}
 
-        # Save to database
-        for article in articles:
-            try:
-                saved = await self.repository.save(article)
-                if saved:
-                    stats["new"] += 1
-                else:
-                    stats["duplicates"] += 1
-            except Exception as e:
-                logger.error(f"Error saving article {article.guid}: {e}")
+        # Save to database in one batch, falling back to single saves
+        stats["new"] = await _save_articles(self.repository, articles)
+        stats["duplicates"] = len(articles) - stats["new"]
 
         logger.info(
             f"{locale}: {stats['fetched']} fetched, "
@@ -184,11 +232,16 @@ class UpdatePriority(int, Enum):
     LOW = 4
 
 
-@dataclass(order=True)
+@dataclass(slots=True)
 class UpdateTask:
     """
     A task for updating a specific source-locale combination.
 
+    One task is created per source and locale on every update run, so the
+    class uses slots. Tasks are ordered by sorting on priority explicitly.
+    The hash of (source_id, locale) is computed once at creation; tasks
+    must not be mutated afterwards.
+
     Attributes:
         priority: Update priority (lower = higher priority)
         source_id: Source identifier (e.g., "lol", "dexerto")
@@ -200,10 +253,15 @@ class UpdateTask:
     source_id: str
     locale: str
     category: SourceCategory
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the hash of the task identity."""
+        self._hash = hash((self.source_id, self.locale))
 
     def __hash__(self) -> int:
         """Make UpdateTask hashable for use in sets."""
-        return hash((self.source_id, self.locale))
+        return self._hash
 
 
 class UpdateServiceV2:
@@ -216,7 +274,8 @@ class UpdateServiceV2:
 
     Features:
         - Priority queue for source ordering (Riot sources first)
-        - Concurrent updates with configurable semaphore limit
+        - Concurrent updates with a configurable limit, halved while any
+          circuit breaker is open
         - Per-domain rate limiting to avoid overwhelming sites
         - Multi-locale support for all sources
         - Graceful degradation on individual failures
@@ -225,7 +284,7 @@ class UpdateServiceV2:
         repository: Database repository for article storage
         max_concurrent: Maximum number of concurrent updates
         lol_client: LoL API client for official Riot sources
-        domain_rate_limits: Per-domain semaphores for rate limiting
+        domain_rate_limits: Per-domain token bucket rate limiters
     """
 
     # Priority mapping by source category
@@ -258,6 +317,33 @@ class UpdateServiceV2:
     # Base rate limit for unknown domains
     BASE_RATE_LIMIT: float = 2.0
 
+    # Seconds a fetched article list is reused by later runs, and how many
+    # (source_id, locale) lists are kept
+    CONTENT_CACHE_TTL: float = 60.0
+    CONTENT_CACHE_MAX_ENTRIES: int = 512
+
+    # Requests allowed back-to-back per domain (others: 1)
+    DOMAIN_BURSTS: dict[str, int] = {
+        "leagueoflegends.com": 2,
+        "riotgames.com": 2,
+        "dexerto.com": 2,
+    }
+
+    # Domains of known sources (other sources are rate limited by source ID)
+    SOURCE_DOMAINS: dict[str, str] = {
+        "lol": "leagueoflegends.com",
+        "riot-games": "riotgames.com",
+        "dexerto": "dexerto.com",
+        "dotesports": "dotesports.com",
+        "esportsgg": "esports.gg",
+        "inven": "inven.co.kr",
+        "opgg": "op.gg",
+        "twitter": "twitter.com",
+        "reddit": "reddit.com",
+        "youtube": "youtube.com",
+        "lolesports": "lolesports.com",
+    }
+
     def __init__(self, repository: ArticleRepository, max_concurrent: int = 10) -> None:
         """
         Initialize the update service.
@@ -268,16 +354,43 @@ class UpdateServiceV2:
         """
         self.repository = repository
         self.max_concurrent = max_concurrent
-        self.lol_client = LoLNewsAPIClient()
-        self.domain_rate_limits: dict[str, asyncio.Semaphore] = {}
+        self.lol_client = LoLNewsAPIClient(http_client=get_shared_client())
+        self.domain_rate_limits: dict[str, AsyncRateLimiter] = {}
         self.last_update: datetime | None = None
         self.update_count: int = 0
         self.error_count: int = 0
         self.cb_registry = get_circuit_breaker_registry()
 
-        # Initialize semaphores for known domains
-        for domain in self.DEFAULT_RATE_LIMITS:
-            self.domain_rate_limits[domain] = asyncio.Semaphore(1)
+        # Shared by all runs so the limit can adapt to circuit breaker state
+        self._concurrency = ResizableSemaphore(max_concurrent)
+
+        # Fetches in progress per (source_id, locale), joined by overlapping runs
+        self._inflight_fetches: dict[tuple[str, str], asyncio.Task[list[Article]]] = {}
+
+        # Recently fetched articles per (source_id, locale): (fetched at, articles),
+        # least recently used first
+        self._article_cache: OrderedDict[tuple[str, str], tuple[float, list[Article]]] = (
+            OrderedDict()
+        )
+
+        # Category and default priority of every known source, resolved once
+        # so task creation needs a single lookup per source
+        self._source_meta: dict[str, tuple[SourceCategory, UpdatePriority]] = {}
+        for source_id, source_info in ArticleSource.ALL_SOURCES.items():
+            category = source_info.get("category", SourceCategory.AGGREGATOR)
+            self._source_meta[source_id] = (category, self._get_priority(category))
+
+        # Initialize rate limiters for known domains
+        for domain, interval in self.DEFAULT_RATE_LIMITS.items():
+            self.domain_rate_limits[domain] = AsyncRateLimiter(
+                interval, burst=self.DOMAIN_BURSTS.get(domain, 1)
+            )
+
+        # Domain and rate limiter per source ID, so rate limiting a task is a
+        # single lookup
+        self._rate_info: dict[str, tuple[str, AsyncRateLimiter]] = {}
+        for source_id in ArticleSource.ALL_SOURCES:
+            self._install_rate_info(source_id)
 
     def _get_priority(self, category: SourceCategory) -> UpdatePriority:
         """
@@ -301,44 +414,52 @@ class UpdateServiceV2:
         Returns:
             Domain name for rate limiting (or source_id if unknown)
         """
-        # Map known sources to their domains
-        domain_map: dict[str, str] = {
-            "lol": "leagueoflegends.com",
-            "riot-games": "riotgames.com",
-            "dexerto": "dexerto.com",
-            "dotesports": "dotesports.com",
-            "esportsgg": "esports.gg",
-            "inven": "inven.co.kr",
-            "opgg": "op.gg",
-            "twitter": "twitter.com",
-            "reddit": "reddit.com",
-            "youtube": "youtube.com",
-            "lolesports": "lolesports.com",
-        }
-        return domain_map.get(source_id, source_id)
+        return self.SOURCE_DOMAINS.get(source_id, source_id)
+
+    def _install_rate_info(self, source_id: str) -> tuple[str, AsyncRateLimiter]:
+        """
+        Resolve and store the rate limiter of a source.
+
+        Sources on the same domain share one limiter. Unknown domains are
+        limited to one request per BASE_RATE_LIMIT seconds. There is no await
+        between the lookup and the insert, so concurrent tasks can never
+        create two limiters for one domain.
+
+        Args:
+            source_id: Source identifier
+
+        Returns:
+            Tuple of (domain, domain rate limiter)
+        """
+        domain = self._extract_domain(source_id)
+
+        # Get or create rate limiter for this domain
+        limiter = self.domain_rate_limits.get(domain)
+        if limiter is None:
+            limiter = self.domain_rate_limits[domain] = AsyncRateLimiter(self.BASE_RATE_LIMIT)
+
+        info = (domain, limiter)
+        self._rate_info[source_id] = info
+        return info
 
     async def _respect_rate_limit(self, source_id: str) -> None:
         """
         Apply rate limiting for a specific source domain.
 
-        Uses a semaphore per-domain to ensure only one request to a given
-        domain is active at a time, with additional delay based on config.
+        Waits for a token from the domain's token bucket, so requests to a
+        domain start at most once per configured interval (after an initial
+        burst) while earlier requests may still be in flight.
 
         Args:
             source_id: Source identifier to rate limit
         """
-        domain = self._extract_domain(source_id)
-
-        # Get or create semaphore for this domain
-        if domain not in self.domain_rate_limits:
-            self.domain_rate_limits[domain] = asyncio.Semaphore(1)
+        info = self._rate_info.get(source_id)
+        if info is None:
+            info = self._install_rate_info(source_id)
+        domain, limiter = info
 
-        # Acquire semaphore (wait for any pending requests to this domain)
-        async with self.domain_rate_limits[domain]:
-            # Get rate limit for this domain
-            rate_limit = self.DEFAULT_RATE_LIMITS.get(domain, self.BASE_RATE_LIMIT)
-            logger.debug(f"Rate limiting {domain}: {rate_limit}s delay")
-            await asyncio.sleep(rate_limit)
+        logger.debug(f"Rate limiting {domain}: {limiter.interval}s interval")
+        await limiter.acquire()
 
     async def _fetch_lol_news(self, locale: str) -> list[Article]:
         """
@@ -352,7 +473,106 @@ class UpdateServiceV2:
         """
         return await self.lol_client.fetch_news(locale)
 
-    async def _update_source(self, task: UpdateTask) -> int:
+    async def _fetch_source(self, source_id: str, locale: str) -> list[Article]:
+        """
+        Fetch articles for a source-locale combination, respecting rate limits.
+
+        Args:
+            source_id: Source identifier ("lol" or a scraper source)
+            locale: Locale code
+
+        Returns:
+            List of fetched Article instances
+        """
+        # Respect rate limit before fetching
+        await self._respect_rate_limit(source_id)
+
+        # Track scraping duration
+        with track_scraping_duration(source_id, locale):
+            # Use LoL API client for official Riot sources
+            if source_id == "lol":
+                articles = await self._fetch_lol_news(locale)
+            # Use scraper for other sources
+            else:
+                scraper = get_scraper(source_id, locale)
+                scraper.existing_guids = self.repository.filter_existing
+                articles = await scraper.fetch_articles()
+
+        self._cache_articles((source_id, locale), articles)
+        return articles
+
+    def _cached_articles(self, key: tuple[str, str]) -> list[Article] | None:
+        """
+        Get articles fetched for a source-locale within CONTENT_CACHE_TTL.
+
+        Args:
+            key: (source_id, locale)
+
+        Returns:
+            Copy of the cached articles, or None if missing or expired
+        """
+        entry = self._article_cache.get(key)
+        if entry is None:
+            return None
+
+        fetched_at, articles = entry
+        if time.monotonic() - fetched_at >= self.CONTENT_CACHE_TTL:
+            del self._article_cache[key]
+            return None
+
+        self._article_cache.move_to_end(key)
+        return list(articles)
+
+    def _cache_articles(self, key: tuple[str, str], articles: list[Article]) -> None:
+        """
+        Remember fetched articles, evicting the least recently used entry if full.
+
+        Args:
+            key: (source_id, locale)
+            articles: Articles just fetched
+        """
+        self._article_cache[key] = (time.monotonic(), list(articles))
+        self._article_cache.move_to_end(key)
+        if len(self._article_cache) > self.CONTENT_CACHE_MAX_ENTRIES:
+            self._article_cache.popitem(last=False)
+
+    async def _fetch_once(
+        self, source_id: str, locale: str, force_refresh: bool = False
+    ) -> list[Article]:
+        """
+        Fetch a source-locale combination, joining an identical fetch in progress.
+
+        Articles fetched less than CONTENT_CACHE_TTL seconds ago are reused.
+        When update runs overlap (scheduled and manual), the second caller
+        awaits the first caller's fetch instead of hitting the site again.
+
+        Args:
+            source_id: Source identifier
+            locale: Locale code
+            force_refresh: Ignore recently fetched articles
+
+        Returns:
+            List of fetched Article instances
+        """
+        key = (source_id, locale)
+        if not force_refresh:
+            cached = self._cached_articles(key)
+            if cached is not None:
+                logger.debug(f"Using articles fetched recently for {source_id}:{locale}")
+                return cached
+
+        fetch = self._inflight_fetches.get(key)
+        if fetch is None:
+            fetch = asyncio.create_task(self._fetch_source(source_id, locale))
+            self._inflight_fetches[key] = fetch
+            fetch.add_done_callback(lambda _: self._inflight_fetches.pop(key, None))
+        else:
+            logger.debug(f"Joining in-progress fetch of {source_id}:{locale}")
+
+        # Shielded so one cancelled caller does not cancel the others
+        return await asyncio.shield(fetch)
+
+    async def _update_source(self, task: UpdateTask, force_refresh: bool = False) -> int:
         """
         Update articles for a single source-locale combination.
 
@@ -362,6 +582,7 @@ class UpdateServiceV2:
 
         Args:
             task: Update task containing source_id, locale, and priority
+            force_refresh: Fetch even if articles were fetched recently
 
         Returns:
             Number of new articles saved
@@ -371,27 +592,15 @@ class UpdateServiceV2:
         """
         logger.info(f"Updating {task.source_id}:{task.locale} " f"(priority: {task.priority.name})")
 
-        # Respect rate limit before fetching
-        await self._respect_rate_limit(task.source_id)
-
-        articles: list[Article] = []
+        if task.source_id != "lol" and task.source_id not in ALL_SCRAPER_SOURCES:
+            logger.warning(f"Unknown source: {task.source_id}")
+            scraping_requests_total.labels(
+                source=task.source_id, locale=task.locale, status="unknown_source"
+            ).inc()
+            return 0
 
         try:
-            # Track scraping duration
-            with track_scraping_duration(task.source_id, task.locale):
-                # Use LoL API client for official Riot sources
-                if task.source_id == "lol":
-                    articles = await self._fetch_lol_news(task.locale)
-                # Use scraper for other sources
-                elif task.source_id in ALL_SCRAPER_SOURCES:
-                    scraper = get_scraper(task.source_id, task.locale)
-                    articles = await scraper.fetch_articles()
-                else:
-                    logger.warning(f"Unknown source: {task.source_id}")
-                    scraping_requests_total.labels(
-                        source=task.source_id, locale=task.locale, status="unknown_source"
-                    ).inc()
-                    return 0
+            articles = await self._fetch_once(task.source_id, task.locale, force_refresh)
 
             # Record successful scraping request
             scraping_requests_total.labels(
@@ -406,15 +615,8 @@ class UpdateServiceV2:
             # Update scraper last success timestamp
             update_scraper_last_success(task.source_id, task.locale)
 
-            # Save articles and count new ones
-            new_count = 0
-            for article in articles:
-                try:
-                    saved = await self.repository.save(article)
-                    if saved:
-                        new_count += 1
-                except Exception as e:
-                    logger.error(f"Error saving article {article.guid}: {e}")
+            # Save articles in one batch and count new ones
+            new_count = await _save_articles(self.repository, articles)
 
             logger.info(
                 f"Updated {task.source_id}:{task.locale}: "
@@ -461,75 +663,140 @@ class UpdateServiceV2:
         locales = locales or RIOT_LOCALES
         source_ids = source_ids or list(ArticleSource.ALL_SOURCES.keys())
 
-        tasks: list[UpdateTask] = []
+        source_meta = self._source_meta
 
-        for source_id in source_ids:
-            # Get source category
-            source_info = ArticleSource.ALL_SOURCES.get(source_id)
-            if not source_info:
-                logger.warning(f"Source {source_id} not in ALL_SOURCES, skipping")
-                continue
+        # Drop unknown sources up front, with a single warning
+        unknown = set(source_ids).difference(source_meta)
+        if unknown:
+            logger.warning(f"Sources not in ALL_SOURCES, skipping: {sorted(unknown)}")
+            source_ids = [source_id for source_id in source_ids if source_id not in unknown]
 
-            category = source_info.get("category", SourceCategory.AGGREGATOR)
+        # (source_id, category, priority) per source, resolved once for all locales
+        sources: list[tuple[str, SourceCategory, UpdatePriority]] = [
+            (source_id, *source_meta[source_id]) for source_id in source_ids
+        ]
+        if priority is not None:
+            sources = [(source_id, category, priority) for source_id, category, _ in sources]
 
-            # Determine priority
-            task_priority = priority or self._get_priority(category)
-
-            # Create task for each locale
-            for locale in locales:
-                task = UpdateTask(
-                    priority=task_priority,
-                    source_id=source_id,
-                    locale=locale,
-                    category=category,
-                )
-                tasks.append(task)
+        # Create task for each source and locale
+        tasks = [
+            UpdateTask(task_priority, source_id, locale, category)
+            for (source_id, category, task_priority), locale in product(sources, locales)
+        ]
 
         # Sort by priority (lower first = higher priority)
-        tasks.sort(key=lambda t: t.priority)
+        tasks.sort(key=attrgetter("priority"))
         return tasks
 
-    async def _execute_tasks(self, tasks: list[UpdateTask]) -> dict[str, int]:
+    async def _warmup_hosts(self, tasks: list[UpdateTask]) -> None:
+        """
+        Warm up DNS and TLS for the scraper hosts of the given tasks.
+
+        Warm-up is best effort: failures are logged and the fan-out goes on.
+
+        Args:
+            tasks: Tasks about to be executed
+        """
+        source_ids = sorted({task.source_id for task in tasks}.intersection(ALL_SCRAPER_SOURCES))
+        if not source_ids:
+            return
+        try:
+            await warmup_scrapers(get_scraper(source_id) for source_id in source_ids)
+        except Exception as e:
+            logger.warning(f"Host warm-up failed: {e}")
+
+    async def _execute_tasks(
+        self, tasks: list[UpdateTask], force_refresh: bool = False
+    ) -> dict[str, int]:
         """
         Execute update tasks with concurrency control.
 
+        Tasks are queued by priority (FIFO among equal priorities) and
+        drained by at most max_concurrent worker coroutines, so a free
+        worker always picks the most urgent task left, whatever order the
+        tasks were passed in. Workers only count successes; every task
+        that did not succeed, including those left behind by a worker that
+        crashed, is counted as failed.
+
+        Connections to the scraper hosts are warmed up before the workers
+        start.
+
         Args:
             tasks: List of UpdateTask instances to execute
+            force_refresh: Fetch even if articles were fetched recently
 
         Returns:
             Dictionary with execution statistics
         """
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-        stats = {"success": 0, "failed": 0, "total": len(tasks), "new_articles": 0}
-
-        async def worker(task: UpdateTask) -> int:
-            """Worker coroutine that processes a single task."""
-            async with semaphore:
-                active_update_tasks.inc()
-                try:
-                    new_count = await self._update_source(task)
-                    stats["success"] += 1
-                    stats["new_articles"] += new_count
-                    return new_count
-                except Exception:
-                    stats["failed"] += 1
-                    return 0
-                finally:
-                    active_update_tasks.dec()
+        await self._warmup_hosts(tasks)
+
+        # The index breaks priority ties so tasks themselves are never compared
+        queue: asyncio.PriorityQueue[tuple[UpdatePriority, int, UpdateTask]]
+        queue = asyncio.PriorityQueue()
+        for index, task in enumerate(tasks):
+            queue.put_nowait((task.priority, index, task))
+
+        async def worker() -> tuple[int, int]:
+            """
+            Worker coroutine that processes queued tasks until none are left.
+
+            Returns:
+                Tuple of (successful tasks, new articles)
+            """
+            success = new_articles = 0
+            while not queue.empty():
+                _, _, task = queue.get_nowait()
+                async with self._concurrency:
+                    active_update_tasks.inc()
+                    try:
+                        new_articles += await self._update_source(task, force_refresh)
+                        success += 1
+                    except Exception:
+                        await self._adjust_concurrency()
+                    finally:
+                        active_update_tasks.dec()
+            return success, new_articles
 
         # Update circuit breaker metrics before execution
         update_all_circuit_breaker_metrics(self.cb_registry)
+        await self._adjust_concurrency()
 
-        # Execute all tasks concurrently with semaphore limiting
-        await asyncio.gather(
-            *[worker(task) for task in tasks],
-            return_exceptions=False,
+        # Drain the queue with a bounded pool of workers
+        results = await asyncio.gather(
+            *[worker() for _ in range(min(self.max_concurrent, len(tasks)))],
+            return_exceptions=True,
         )
 
         # Update circuit breaker metrics after execution
         update_all_circuit_breaker_metrics(self.cb_registry)
 
-        return stats
+        success = new_articles = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Update worker crashed: {result!r}")
+                continue
+            success += result[0]
+            new_articles += result[1]
+
+        return {
+            "success": success,
+            "failed": len(tasks) - success,
+            "total": len(tasks),
+            "new_articles": new_articles,
+        }
+
+    async def _adjust_concurrency(self) -> None:
+        """
+        Resize the concurrency limit to the circuit breaker state.
+
+        While any circuit breaker is open, some remote is failing, so only
+        half of max_concurrent tasks run at once to ease the pressure.
+        """
+        any_open = any(cb.is_open() for cb in self.cb_registry.get_all().values())
+        capacity = max(1, self.max_concurrent // 2) if any_open else self.max_concurrent
+        if capacity != self._concurrency.capacity:
+            logger.info(f"Adjusting update concurrency to {capacity}")
+            await self._concurrency.set_capacity(capacity)
 
     async def update_all(self) -> dict[str, Any]:
         """
@@ -542,7 +809,8 @@ class UpdateServiceV2:
             Dictionary with update statistics including success/failed counts
         """
         logger.info("Starting UpdateServiceV2.update_all...")
-        start_time = datetime.utcnow()
+        t0 = time.monotonic()
+        started_at = datetime.now(timezone.utc)
 
         # Create tasks for all sources and locales
         tasks = await self._create_tasks()
@@ -556,21 +824,12 @@ class UpdateServiceV2:
         stats = await self._execute_tasks(tasks)
 
         # Update service state
-        self.last_update = datetime.utcnow()
+        elapsed = time.monotonic() - t0
+        self.last_update = datetime.now(timezone.utc)
         self.update_count += 1
         self.error_count = stats["failed"]
 
-        elapsed = (datetime.utcnow() - start_time).total_seconds()
-
-        result = {
-            "started_at": start_time.isoformat(),
-            "completed_at": self.last_update.isoformat(),
-            "elapsed_seconds": round(elapsed, 2),
-            "total_tasks": stats["total"],
-            "successful_tasks": stats["success"],
-            "failed_tasks": stats["failed"],
-            "new_articles": stats["new_articles"],
-        }
+        result = self._run_result(started_at, elapsed, stats)
 
         logger.info(
             f"UpdateServiceV2.update_all complete: "
@@ -592,7 +851,8 @@ class UpdateServiceV2:
             Dictionary with update statistics
         """
         logger.info(f"Updating locales: {locales}")
-        start_time = datetime.utcnow()
+        t0 = time.monotonic()
+        started_at = datetime.now(timezone.utc)
 
         # Create tasks for specified locales only
         tasks = await self._create_tasks(locales=locales)
@@ -602,19 +862,10 @@ class UpdateServiceV2:
         # Execute tasks
         stats = await self._execute_tasks(tasks)
 
-        self.last_update = datetime.utcnow()
-        elapsed = (datetime.utcnow() - start_time).total_seconds()
+        elapsed = time.monotonic() - t0
+        self.last_update = datetime.now(timezone.utc)
 
-        result = {
-            "started_at": start_time.isoformat(),
-            "completed_at": self.last_update.isoformat(),
-            "elapsed_seconds": round(elapsed, 2),
-            "locales": locales,
-            "total_tasks": stats["total"],
-            "successful_tasks": stats["success"],
-            "failed_tasks": stats["failed"],
-            "new_articles": stats["new_articles"],
-        }
+        result = self._run_result(started_at, elapsed, stats, locales=locales)
 
         logger.info(
             f"Locales update complete: {stats['new_articles']} new articles " f"in {elapsed:.2f}s"
@@ -623,7 +874,7 @@ class UpdateServiceV2:
         return result
 
     async def update_source(
-        self, source_id: str, locales: list[str] | None = None
+        self, source_id: str, locales: list[str] | None = None, force_refresh: bool = False
     ) -> dict[str, Any]:
         """
         Update a specific source for all or specified locales.
@@ -631,12 +882,15 @@ class UpdateServiceV2:
         Args:
             source_id: Source identifier to update
             locales: Optional list of locales (None = all configured locales)
+            force_refresh: Fetch even if articles were fetched in the last
+                CONTENT_CACHE_TTL seconds
 
         Returns:
             Dictionary with update statistics
         """
         logger.info(f"Updating source: {source_id}")
-        start_time = datetime.utcnow()
+        t0 = time.monotonic()
+        started_at = datetime.now(timezone.utc)
 
         locales = locales or RIOT_LOCALES
 
@@ -645,35 +899,20 @@ class UpdateServiceV2:
 
         if not tasks:
             logger.warning(f"No tasks created for source: {source_id}")
-            return {
-                "started_at": start_time.isoformat(),
-                "completed_at": datetime.utcnow().isoformat(),
-                "elapsed_seconds": 0,
-                "source_id": source_id,
-                "total_tasks": 0,
-                "successful_tasks": 0,
-                "failed_tasks": 0,
-                "new_articles": 0,
-            }
+            empty = {"total": 0, "success": 0, "failed": 0, "new_articles": 0}
+            return self._run_result(
+                started_at, 0, empty, datetime.now(timezone.utc), source_id=source_id
+            )
 
         logger.info(f"Created {len(tasks)} update tasks for source {source_id}")
 
         # Execute tasks
-        stats = await self._execute_tasks(tasks)
+        stats = await self._execute_tasks(tasks, force_refresh)
 
-        self.last_update = datetime.utcnow()
-        elapsed = (datetime.utcnow() - start_time).total_seconds()
+        elapsed = time.monotonic() - t0
+        self.last_update = datetime.now(timezone.utc)
 
-        result = {
-            "started_at": start_time.isoformat(),
-            "completed_at": self.last_update.isoformat(),
-            "elapsed_seconds": round(elapsed, 2),
-            "source_id": source_id,
-            "total_tasks": stats["total"],
-            "successful_tasks": stats["success"],
-            "failed_tasks": stats["failed"],
-            "new_articles": stats["new_articles"],
-        }
+        result = self._run_result(started_at, elapsed, stats, source_id=source_id)
 
         logger.info(
             f"Source {source_id} update complete: {stats['new_articles']} new articles "
@@ -682,6 +921,42 @@ class UpdateServiceV2:
 
         return result
 
+    def _run_result(
+        self,
+        started_at: datetime,
+        elapsed: float,
+        stats: dict[str, int],
+        completed_at: datetime | None = None,
+        **scope: Any,
+    ) -> dict[str, Any]:
+        """
+        Build the statistics dict returned by update_all/update_locales/update_source.
+
+        Timestamps are formatted once here, so callers that also log them
+        can reuse the strings from the result.
+
+        Args:
+            started_at: When the run started (UTC)
+            elapsed: Run duration in seconds
+            stats: Counters from _execute_tasks()
+            completed_at: When the run finished (defaults to last_update)
+            **scope: Run-specific keys (locales, source_id) placed before the counters
+
+        Returns:
+            Dictionary with update statistics
+        """
+        completed_at = completed_at or self.last_update or datetime.now(timezone.utc)
+        return {
+            "started_at": started_at.isoformat(),
+            "completed_at": completed_at.isoformat(),
+            "elapsed_seconds": round(elapsed, 2),
+            **scope,
+            "total_tasks": stats["total"],
+            "successful_tasks": stats["success"],
+            "failed_tasks": stats["failed"],
+            "new_articles": stats["new_articles"],
+        }
+
     def get_status(self) -> dict[str, Any]:
         """
         Get current service status.
@@ -689,14 +964,17 @@ class UpdateServiceV2:
         Returns:
             Status dictionary with configuration and statistics
         """
-        # Get circuit breaker status for all sources
-        circuit_breaker_status = {}
-        for source_id, cb in self.cb_registry.get_all().items():
-            circuit_breaker_status[source_id] = {
-                "state": cb.stats.state.value,
-                "failure_count": cb.stats.failure_count,
-                "is_open": cb.is_open(),
+        # Snapshot circuit breaker status for all sources, reading each
+        # breaker's stats once
+        circuit_breaker_status = {
+            source_id: {
+                "state": stats.state.value,
+                "failure_count": stats.failure_count,
+                "is_open": stats.state is CircuitBreakerState.OPEN,
             }
+            for source_id, cb in self.cb_registry.get_all().items()
+            for stats in (cb.stats,)
+        }
 
         return {
             "version": "v2",
@@ -4,23 +4,134 @@ Caching utilities for the application.
 This module provides flexible caching with support for both in-memory (TTLCache)
 and Redis backends. Includes automatic fallback to in-memory cache if Redis
 is unavailable, ensuring cache operations never fail the application.
+
+AsyncCacheBackend mirrors CacheBackend with coroutine methods for callers on
+the event loop; RedisAsyncCacheBackend talks to Redis through redis.asyncio
+so cache round trips do not block other coroutines.
 """
 
+import heapq
 import json
 import logging
+import socket
 import sys
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Callable
+from importlib.util import find_spec
+from typing import Any, Final
 
 import redis as redis_lib
+import redis.asyncio as aioredis
 from redis import Redis
+from redis.asyncio.client import Pipeline as AsyncPipeline
+from redis.client import Pipeline
 from redis.exceptions import ConnectionError, RedisError, TimeoutError
 
 from src.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Default cap on TTLCacheBackend entries before least-recently-used ones
+# are evicted
+DEFAULT_MAX_ENTRIES: Final[int] = 10_000
+
+# Keys requested per SCAN call and keys per UNLINK command when
+# RedisCacheBackend walks its key prefix
+REDIS_SCAN_COUNT: Final[int] = 1000
+REDIS_UNLINK_BATCH: Final[int] = 500
+
+# Key (under key_prefix) of the sorted set indexing RedisCacheBackend's
+# live keys by expiry time
+REDIS_INDEX_KEY: Final[str] = "__index__"
+
+# Seconds RedisCacheBackend keeps Redis hits (and misses) in its
+# process-local cache, and the size of that cache
+REDIS_LOCAL_TTL_SECONDS: Final[int] = 5
+REDIS_LOCAL_MISS_TTL_SECONDS: Final[int] = 1
+REDIS_LOCAL_MAX_ENTRIES: Final[int] = 1024
+
+# Stored in the process-local cache for keys Redis does not have
+_MISS: Final = object()
+
+# TCP keepalive for pooled Redis sockets: probe after 60 s idle, every 30 s,
+# give up after 3 failures. Only the options this platform supports are set.
+REDIS_KEEPALIVE_OPTIONS: Final[dict[int, int]] = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 30), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+# Stale entries tolerated in TTLCacheBackend's expiry heap, on top of two
+# per live key, before it is rebuilt
+HEAP_COMPACT_SLACK: Final[int] = 64
+
+# orjson (optional "serialization" extra) encodes and decodes Redis values
+# several times faster than the json module; fall back to json without it
+ORJSON_AVAILABLE: Final[bool] = find_spec("orjson") is not None
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+    def _dumps(value: Any) -> bytes:
+        """Serialize a cache value to JSON bytes."""
+        data: bytes = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        return data
+
+    def _loads(data: bytes | str) -> Any:
+        """Deserialize a cache value; raises json.JSONDecodeError on bad input."""
+        return orjson.loads(data)
+
+else:
+
+    def _dumps(value: Any) -> bytes:
+        """Serialize a cache value to JSON bytes."""
+        return json.dumps(value).encode()
+
+    def _loads(data: bytes | str) -> Any:
+        """Deserialize a cache value; raises json.JSONDecodeError on bad input."""
+        return json.loads(data)
+
+
+# msgpack (optional "serialization" extra) stores values in a compact binary
+# form, typically half the size of JSON
+MSGPACK_AVAILABLE: Final[bool] = find_spec("msgpack") is not None
+
+if MSGPACK_AVAILABLE:
+    import msgpack
+
+    def _msgpack_dumps(value: Any) -> bytes:
+        """Serialize a cache value to MessagePack bytes."""
+        data: bytes = msgpack.packb(value, use_bin_type=True)
+        return data
+
+    def _msgpack_loads(data: bytes | str) -> Any:
+        """Deserialize a cache value; raises a ValueError subclass on bad input."""
+        return msgpack.unpackb(data, raw=False)
+
+
+def _serializer(name: str) -> tuple[Callable[[Any], bytes], Callable[[bytes | str], Any]]:
+    """
+    Look up the encode and decode functions of a Redis value serializer.
+
+    Args:
+        name: Serializer name ('json' or 'msgpack')
+
+    Returns:
+        Tuple of (dumps, loads)
+
+    Raises:
+        ValueError: If the serializer is unknown or its package is not installed
+    """
+    if name == "json":
+        return _dumps, _loads
+    if name == "msgpack":
+        if not MSGPACK_AVAILABLE:
+            raise ValueError("serializer 'msgpack' requires the msgpack package")
+        return _msgpack_dumps, _msgpack_loads
+    raise ValueError(f"serializer must be 'json' or 'msgpack', got {name!r}")
+
 
 class CacheBackend(ABC):
     """
@@ -68,6 +179,40 @@ class CacheBackend(ABC):
         """
         pass
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Retrieve several values from the cache.
+
+        The default implementation calls get() per key; backends with a
+        network round trip per call override it to batch the lookups.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of the keys found (and not expired) to their values
+        """
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, mapping: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        """
+        Store several values in the cache with the same TTL.
+
+        The default implementation calls set() per key; backends with a
+        network round trip per call override it to batch the writes.
+
+        Args:
+            mapping: Cache keys and the values to store
+            ttl_seconds: Optional custom TTL
+        """
+        for key, value in mapping.items():
+            self.set(key, value, ttl_seconds)
+
     @abstractmethod
     def clear(self) -> None:
         """Clear all cached items."""
@@ -103,6 +248,141 @@ class CacheBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def close(self) -> None:
+        """Release the resources held by the backend."""
+        pass
+
+
+def _queue_index_update(
+    pipe: Pipeline | AsyncPipeline, index_key: str, ttls: dict[str, int]
+) -> None:
+    """
+    Queue expiry index updates for keys being written through a pipeline.
+
+    Expired index members are pruned in the same round trip, so the index
+    never outgrows the live keys by much.
+
+    Args:
+        pipe: Pipeline the keys' SETEX commands are queued on
+        index_key: Prefixed key of the index sorted set
+        ttls: Prefixed Redis keys and their TTLs in seconds
+    """
+    now = time.time()
+    pipe.zadd(index_key, {redis_key: now + ttl for redis_key, ttl in ttls.items()})
+    pipe.zremrangebyscore(index_key, "-inf", now)
+
+
+class AsyncCacheBackend(ABC):
+    """
+    Abstract base class for cache backends used from async code.
+
+    Same contract as CacheBackend, with every operation a coroutine so
+    network-backed implementations can yield to the event loop.
+    """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        """
+        Store a value in the cache with TTL.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Optional custom TTL
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """
+        Retrieve a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """
+        Delete a specific key from the cache.
+
+        Args:
+            key: Cache key to delete
+
+        Returns:
+            True if key was deleted, False if key didn't exist
+        """
+        pass
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Retrieve several values from the cache.
+
+        The default implementation awaits get() per key; backends with a
+        network round trip per call override it to batch the lookups.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of the keys found (and not expired) to their values
+        """
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set_many(self, mapping: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        """
+        Store several values in the cache with the same TTL.
+
+        The default implementation awaits set() per key; backends with a
+        network round trip per call override it to batch the writes.
+
+        Args:
+            mapping: Cache keys and the values to store
+            ttl_seconds: Optional custom TTL
+        """
+        for key, value in mapping.items():
+            await self.set(key, value, ttl_seconds)
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Clear all cached items."""
+        pass
+
+    @abstractmethod
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache metrics
+        """
+        pass
+
+    @abstractmethod
+    async def is_healthy(self) -> bool:
+        """
+        Check if the cache backend is healthy.
+
+        Returns:
+            True if backend is operational, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the resources held by the backend."""
+        pass
+
 
 class TTLCacheBackend(CacheBackend):
     """
@@ -111,33 +391,78 @@ class TTLCacheBackend(CacheBackend):
     This cache stores key-value pairs with automatic expiration
     based on TTL. Useful for caching API responses and build IDs.
     Tracks hit/miss statistics for monitoring.
+
+    Expiries are time.monotonic() deadlines, so an access is a single
+    float comparison and wall clock changes never expire entries early.
+    Entries are kept in least-recently-used order: set() and a hit on
+    get() move the key to the end. Once max_entries is exceeded, the least
+    recently used entry is evicted.
+
+    A min-heap of (expiry, key) lets cleanup_expired() pop only the
+    entries that are due instead of scanning the whole cache. Heap entries
+    are not removed when a key is overwritten or deleted; they are skipped
+    when popped, and the heap is rebuilt once stale entries outnumber the
+    live ones.
+
+    Each entry also records its sys.getsizeof() footprint, which is added to
+    or subtracted from a running total as entries come and go, so
+    get_stats() does not walk the cache.
     """
 
-    def __init__(self, default_ttl_seconds: int = 3600) -> None:
+    def __init__(
+        self, default_ttl_seconds: int = 3600, max_entries: int | None = DEFAULT_MAX_ENTRIES
+    ) -> None:
         """
         Initialize the cache.
 
         Args:
             default_ttl_seconds: Default TTL in seconds (default: 1 hour)
+            max_entries: Maximum number of entries (None = unbounded)
+
+        Raises:
+            ValueError: If max_entries is less than 1
         """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+
         self.default_ttl = default_ttl_seconds
-        self._cache: dict[str, tuple[Any, datetime]] = {}
+        self.max_entries = max_entries
+        self._cache: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self._heap: list[tuple[float, str]] = []
+        self._size_bytes: int = 0
         self._hits: int = 0
         self._misses: int = 0
+        self._evictions: int = 0
 
     def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
         """
         Store a value in the cache with TTL.
 
+        Evicts the least recently used entry if the cache is full.
+
         Args:
             key: Cache key
             value: Value to store
             ttl_seconds: Optional custom TTL (uses default if not provided)
         """
         ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
-        expiry = datetime.utcnow() + timedelta(seconds=ttl)
-        self._cache[key] = (value, expiry)
-        logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+        expiry = time.monotonic() + ttl
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        previous = self._cache.get(key)
+        if previous is not None:
+            self._size_bytes -= previous[2]
+        self._cache[key] = (value, expiry, size)
+        self._size_bytes += size
+        self._cache.move_to_end(key)
+        heapq.heappush(self._heap, (expiry, key))
+        if self.max_entries is not None and len(self._cache) > self.max_entries:
+            evicted, (_, _, evicted_size) = self._cache.popitem(last=False)
+            self._size_bytes -= evicted_size
+            self._evictions += 1
+            logger.debug("Cache evicted: %s", evicted)
+        if len(self._heap) > 2 * len(self._cache) + HEAP_COMPACT_SLACK:
+            self._compact_heap()
+        logger.debug("Cache set: %s (TTL: %ss)", key, ttl)
 
     def get(self, key: str) -> Any | None:
         """
@@ -149,21 +474,24 @@ class TTLCacheBackend(CacheBackend):
         Returns:
             Cached value if found and not expired, None otherwise
         """
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             self._misses += 1
-            logger.debug(f"Cache miss: {key}")
+            logger.debug("Cache miss: %s", key)
             return None
 
-        value, expiry = self._cache[key]
+        value, expiry, size = entry
 
-        if datetime.utcnow() > expiry:
+        if time.monotonic() > expiry:
             self._misses += 1
-            logger.debug(f"Cache expired: {key}")
+            logger.debug("Cache expired: %s", key)
             del self._cache[key]
+            self._size_bytes -= size
             return None
 
+        self._cache.move_to_end(key)
         self._hits += 1
-        logger.debug(f"Cache hit: {key}")
+        logger.debug("Cache hit: %s", key)
         return value
 
     def delete(self, key: str) -> bool:
@@ -176,15 +504,18 @@ class TTLCacheBackend(CacheBackend):
         Returns:
             True if key was deleted, False if key didn't exist
         """
-        if key in self._cache:
-            del self._cache[key]
-            logger.debug(f"Cache key deleted: {key}")
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[2]
+            logger.debug("Cache key deleted: %s", key)
             return True
         return False
 
     def clear(self) -> None:
         """Clear all cached items."""
         self._cache.clear()
+        self._heap.clear()
+        self._size_bytes = 0
         logger.debug("Cache cleared")
 
     def cleanup_expired(self) -> int:
@@ -194,16 +525,28 @@ class TTLCacheBackend(CacheBackend):
         Returns:
             Number of items removed
         """
-        now = datetime.utcnow()
-        expired_keys = [key for key, (_, expiry) in self._cache.items() if now > expiry]
+        now = time.monotonic()
+        heap = self._heap
+        removed = 0
 
-        for key in expired_keys:
-            del self._cache[key]
+        while heap and heap[0][0] < now:
+            expiry, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip heap entries left behind by an overwrite or delete
+            if entry is not None and entry[1] == expiry:
+                del self._cache[key]
+                self._size_bytes -= entry[2]
+                removed += 1
+
+        if removed:
+            logger.debug("Removed %s expired cache items", removed)
 
-        if expired_keys:
-            logger.debug(f"Removed {len(expired_keys)} expired cache items")
+        return removed
 
-        return len(expired_keys)
+    def _compact_heap(self) -> None:
+        """Rebuild the expiry heap from the live entries, dropping stale ones."""
+        self._heap = [(expiry, key) for key, (_, expiry, _) in self._cache.items()]
+        heapq.heapify(self._heap)
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -211,24 +554,21 @@ class TTLCacheBackend(CacheBackend):
 
         Returns:
             Dictionary with cache metrics including entry count,
-            size estimate, TTL, and hit/miss statistics
+            size estimate, TTL, hit/miss and eviction statistics
         """
         total_requests = self._hits + self._misses
         hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
 
-        # Estimate size based on string representation (conservative estimate)
-        size_bytes = 0
-        for key, (value, _) in self._cache.items():
-            size_bytes += sys.getsizeof(key) + sys.getsizeof(value)
-
         return {
             "total_entries": len(self._cache),
-            "size_bytes_estimate": size_bytes,
+            "size_bytes_estimate": self._size_bytes,
             "ttl_seconds": self.default_ttl,
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": round(hit_rate, 4),
             "total_requests": total_requests,
+            "max_entries": self.max_entries,
+            "evictions": self._evictions,
         }
 
     def is_healthy(self) -> bool:
@@ -240,6 +580,10 @@ class TTLCacheBackend(CacheBackend):
         """
         return True
 
+    def close(self) -> None:
+        """Drop all entries; there are no connections to release."""
+        self.clear()
+
 
 class RedisCacheBackend(CacheBackend):
     """
@@ -249,6 +593,32 @@ class RedisCacheBackend(CacheBackend):
     Includes connection pooling, automatic reconnection, and fallback behavior.
     All cache operations are wrapped with error handling to ensure
     cache failures never crash the application.
+
+    Values are stored as JSON (encoded with orjson when it is installed) or,
+    with serializer="msgpack", as MessagePack. The two formats cannot read
+    each other, so change key_prefix when switching. Responses are not
+    decoded by the client: raw bytes go straight to the deserializer.
+
+    Every write also records the key in a sorted set scored by its
+    wall-clock expiry, in the same round trip. get_stats() drops the
+    expired members and counts the rest, so the entry count is exact for
+    this prefix without walking the keyspace; keys written by other
+    applications or before the index existed are not counted. clear()
+    walks the prefix with SCAN rather than KEYS, so it never blocks the
+    Redis server on a large keyspace. The size estimate in get_stats() is
+    the server's used_memory from INFO memory, which covers the whole Redis
+    instance, not just this prefix.
+
+    Connections come from a BlockingConnectionPool capped at
+    max_connections: when all are busy, a command waits up to pool_timeout
+    seconds for one instead of opening another socket.
+
+    get() is fronted by a small process-local TTLCacheBackend holding
+    recent hits for local_ttl_seconds and misses for
+    REDIS_LOCAL_MISS_TTL_SECONDS, so hot keys skip the network round trip.
+    This instance's writes invalidate it immediately; writes from other
+    instances are seen after at most local_ttl_seconds. Values returned
+    from it are shared, so callers must not mutate them.
     """
 
     def __init__(
@@ -256,6 +626,10 @@ class RedisCacheBackend(CacheBackend):
         redis_url: str = "redis://localhost:6379/0",
         default_ttl_seconds: int = 3600,
         key_prefix: str = "lolstonks:",
+        serializer: str = "json",
+        max_connections: int = 20,
+        pool_timeout: float = 5.0,
+        local_ttl_seconds: int = REDIS_LOCAL_TTL_SECONDS,
     ) -> None:
         """
         Initialize Redis cache backend.
@@ -264,39 +638,62 @@ class RedisCacheBackend(CacheBackend):
             redis_url: Redis connection URL
             default_ttl_seconds: Default TTL in seconds (default: 1 hour)
             key_prefix: Prefix for all cache keys to avoid collisions
+            serializer: Value encoding, 'json' or 'msgpack'
+            max_connections: Maximum open connections in the pool
+            pool_timeout: Seconds to wait for a free pooled connection
+            local_ttl_seconds: Seconds hits are served from the process-local
+                cache (0 disables it)
+
+        Raises:
+            ValueError: If the serializer is unknown or not installed
         """
         self.redis_url = redis_url
         self.default_ttl = default_ttl_seconds
         self.key_prefix = key_prefix
+        self.serializer = serializer
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self._dumps, self._loads = _serializer(serializer)
+        self.local_ttl = min(local_ttl_seconds, default_ttl_seconds)
+        self._local = TTLCacheBackend(
+            default_ttl_seconds=self.local_ttl, max_entries=REDIS_LOCAL_MAX_ENTRIES
+        )
         self._connected = False
         self._hits: int = 0
         self._misses: int = 0
+        self._index_key = self._make_key(REDIS_INDEX_KEY)
 
         # Initialize Redis connection
+        self._pool: redis_lib.BlockingConnectionPool | None = None
         self._client: Redis | None = None
         self._init_connection()
 
     def _init_connection(self) -> None:
-        """Initialize Redis connection with connection pooling."""
+        """Initialize Redis connection with a bounded, blocking connection pool."""
         try:
-            self._client = redis_lib.from_url(
+            self._pool = redis_lib.BlockingConnectionPool.from_url(
                 self.redis_url,
-                decode_responses=True,
+                max_connections=self.max_connections,
+                timeout=self.pool_timeout,
                 socket_connect_timeout=5,
                 socket_timeout=5,
+                socket_keepalive=True,
+                socket_keepalive_options=REDIS_KEEPALIVE_OPTIONS,
                 retry_on_timeout=True,
                 health_check_interval=30,
             )
+            self._client = redis_lib.Redis(connection_pool=self._pool)
 
             # Test connection
             self._client.ping()
             self._connected = True
-            logger.info(f"Redis cache connected: {self.redis_url}")
+            logger.info("Redis cache connected: %s", self.redis_url)
 
         except (ConnectionError, TimeoutError, RedisError) as e:
             self._connected = False
             self._client = None
-            logger.warning(f"Redis connection failed, will use in-memory fallback: {e}")
+            self.close()
+            logger.warning("Redis connection failed, will use in-memory fallback: %s", e)
 
     def _make_key(self, key: str) -> str:
         """
@@ -319,6 +716,7 @@ class RedisCacheBackend(CacheBackend):
             value: Value to store (must be JSON-serializable)
             ttl_seconds: Optional custom TTL (uses default if not provided)
         """
+        self._local.delete(key)
         if not self._connected or self._client is None:
             logger.debug("Redis not connected, skipping cache set")
             return
@@ -327,15 +725,18 @@ class RedisCacheBackend(CacheBackend):
             ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
             redis_key = self._make_key(key)
 
-            # Serialize value to JSON
-            serialized = json.dumps(value)
+            # Serialize value
+            serialized = self._dumps(value)
 
-            self._client.setex(redis_key, ttl, serialized)
-            logger.debug(f"Redis cache set: {key} (TTL: {ttl}s)")
+            pipe = self._client.pipeline(transaction=False)
+            pipe.setex(redis_key, ttl, serialized)
+            _queue_index_update(pipe, self._index_key, {redis_key: ttl})
+            pipe.execute()
+            logger.debug("Redis cache set: %s (TTL: %ss)", key, ttl)
 
         except (ConnectionError, TimeoutError, RedisError) as e:
             self._connected = False
-            logger.warning(f"Redis error during set, marking as disconnected: {e}")
+            logger.warning("Redis error during set, marking as disconnected: %s", e)
 
     def get(self, key: str) -> Any | None:
         """
@@ -352,29 +753,42 @@ class RedisCacheBackend(CacheBackend):
             logger.debug("Redis not connected, returning cache miss")
             return None
 
+        if self.local_ttl > 0:
+            local = self._local.get(key)
+            if local is _MISS:
+                self._misses += 1
+                return None
+            if local is not None:
+                self._hits += 1
+                return local
+
         try:
             redis_key = self._make_key(key)
             serialized = self._client.get(redis_key)
 
             if serialized is None:
                 self._misses += 1
-                logger.debug(f"Redis cache miss: {key}")
+                logger.debug("Redis cache miss: %s", key)
+                if self.local_ttl > 0:
+                    self._local.set(key, _MISS, ttl_seconds=REDIS_LOCAL_MISS_TTL_SECONDS)
                 return None
 
-            # Deserialize from JSON
-            value = json.loads(serialized)  # type: ignore[arg-type]
+            # Deserialize value
+            value = self._loads(serialized)
             self._hits += 1
-            logger.debug(f"Redis cache hit: {key}")
+            logger.debug("Redis cache hit: %s", key)
+            if self.local_ttl > 0:
+                self._local.set(key, _MISS if value is None else value)
             return value
 
         except (ConnectionError, TimeoutError, RedisError) as e:
             self._connected = False
             self._misses += 1
-            logger.warning(f"Redis error during get, marking as disconnected: {e}")
+            logger.warning("Redis error during get, marking as disconnected: %s", e)
             return None
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self._misses += 1
-            logger.warning(f"Redis JSON decode error for key {key}: {e}")
+            logger.warning("Redis decode error for key %s: %s", key, e)
             return None
 
     def delete(self, key: str) -> bool:
@@ -387,39 +801,122 @@ class RedisCacheBackend(CacheBackend):
         Returns:
             True if key was deleted, False if key didn't exist or Redis unavailable
         """
+        self._local.delete(key)
         if not self._connected or self._client is None:
             logger.debug("Redis not connected, skipping cache delete")
             return False
 
         try:
             redis_key = self._make_key(key)
-            deleted = self._client.delete(redis_key)
-            logger.debug(f"Redis cache key deleted: {key}")
-            return deleted > 0  # type: ignore[operator]
+            pipe = self._client.pipeline(transaction=False)
+            pipe.delete(redis_key)
+            pipe.zrem(self._index_key, redis_key)
+            deleted, _ = pipe.execute()
+            logger.debug("Redis cache key deleted: %s", key)
+            return bool(deleted > 0)
 
         except (ConnectionError, TimeoutError, RedisError) as e:
             self._connected = False
-            logger.warning(f"Redis error during delete, marking as disconnected: {e}")
+            logger.warning("Redis error during delete, marking as disconnected: %s", e)
             return False
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Retrieve several values from the cache in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of the keys found (and not expired) to their values
+        """
+        if not self._connected or self._client is None:
+            self._misses += len(keys)
+            logger.debug("Redis not connected, returning cache misses")
+            return {}
+
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key in keys:
+                pipe.get(self._make_key(key))
+            raw_values = pipe.execute()
+
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            self._connected = False
+            self._misses += len(keys)
+            logger.warning("Redis error during get_many, marking as disconnected: %s", e)
+            return {}
+
+        found: dict[str, Any] = {}
+        for key, serialized in zip(keys, raw_values, strict=True):
+            if serialized is None:
+                continue
+            try:
+                found[key] = self._loads(serialized)
+            except ValueError as e:
+                logger.warning("Redis decode error for key %s: %s", key, e)
+
+        self._hits += len(found)
+        self._misses += len(keys) - len(found)
+        logger.debug("Redis cache get_many: %s/%s hits", len(found), len(keys))
+        return found
+
+    def set_many(self, mapping: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        """
+        Store several values in the cache with the same TTL in one round trip.
+
+        Args:
+            mapping: Cache keys and the values to store (must be JSON-serializable)
+            ttl_seconds: Optional custom TTL (uses default if not provided)
+        """
+        for key in mapping:
+            self._local.delete(key)
+        if not self._connected or self._client is None:
+            logger.debug("Redis not connected, skipping cache set_many")
+            return
+
+        try:
+            ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
+            pipe = self._client.pipeline(transaction=False)
+            redis_keys = [self._make_key(key) for key in mapping]
+            for redis_key, value in zip(redis_keys, mapping.values(), strict=True):
+                pipe.setex(redis_key, ttl, self._dumps(value))
+            _queue_index_update(pipe, self._index_key, dict.fromkeys(redis_keys, ttl))
+            pipe.execute()
+            logger.debug("Redis cache set_many: %s keys (TTL: %ss)", len(mapping), ttl)
+
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            self._connected = False
+            logger.warning("Redis error during set_many, marking as disconnected: %s", e)
+
     def clear(self) -> None:
         """Clear all cached items with the configured key prefix."""
+        self._local.clear()
         if not self._connected or self._client is None:
             logger.debug("Redis not connected, skipping cache clear")
             return
 
         try:
-            # Find all keys with our prefix
-            pattern = f"{self.key_prefix}*"
-            keys = self._client.keys(pattern)
-
-            if keys:
-                self._client.delete(*keys)  # type: ignore[misc]
-                logger.debug(f"Cleared {len(keys)} Redis cache entries")  # type: ignore[arg-type]
+            # Walk our prefix incrementally and free each batch of keys
+            # asynchronously as soon as it fills, so memory stays bounded
+            batch: list[bytes] = []
+            cleared = 0
+            for key in self._client.scan_iter(match=f"{self.key_prefix}*", count=REDIS_SCAN_COUNT):
+                batch.append(key)
+                if len(batch) >= REDIS_UNLINK_BATCH:
+                    self._client.unlink(*batch)
+                    cleared += len(batch)
+                    batch = []
+            if batch:
+                self._client.unlink(*batch)
+                cleared += len(batch)
+
+            if cleared:
+                logger.debug("Cleared %s Redis cache entries", cleared)
 
         except (ConnectionError, TimeoutError, RedisError) as e:
             self._connected = False
-            logger.warning(f"Redis error during clear, marking as disconnected: {e}")
+            logger.warning("Redis error during clear, marking as disconnected: %s", e)
 
     def cleanup_expired(self) -> int:
         """
@@ -445,17 +942,22 @@ class RedisCacheBackend(CacheBackend):
         hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
 
         total_entries = 0
+        size_bytes = 0
         if self._connected and self._client is not None:
             try:
-                pattern = f"{self.key_prefix}*"
-                keys = self._client.keys(pattern)
-                total_entries = len(keys)  # type: ignore[arg-type]
+                pipe = self._client.pipeline(transaction=False)
+                pipe.zremrangebyscore(self._index_key, "-inf", time.time())
+                pipe.zcard(self._index_key)
+                pipe.info("memory")
+                _, total_entries, memory = pipe.execute()
+                size_bytes = int(memory.get("used_memory", 0))
             except (ConnectionError, TimeoutError, RedisError):
                 self._connected = False
+                total_entries = 0
 
         return {
             "total_entries": total_entries,
-            "size_bytes_estimate": -1,  # Redis memory usage not easily available
+            "size_bytes_estimate": size_bytes,
             "ttl_seconds": self.default_ttl,
             "hits": self._hits,
             "misses": self._misses,
@@ -463,6 +965,7 @@ class RedisCacheBackend(CacheBackend):
             "total_requests": total_requests,
             "redis_connected": self._connected,
             "redis_url": self.redis_url,
+            "serializer": self.serializer,
         }
 
     def is_healthy(self) -> bool:
@@ -482,6 +985,432 @@ class RedisCacheBackend(CacheBackend):
             self._connected = False
             return False
 
+    def close(self) -> None:
+        """Close the client and disconnect every pooled connection."""
+        self._connected = False
+        client, self._client = self._client, None
+        pool, self._pool = self._pool, None
+        try:
+            if client is not None:
+                client.close()
+            if pool is not None:
+                pool.disconnect()
+        except RedisError as e:
+            logger.warning("Error closing Redis connection pool: %s", e)
+
+
+class AsyncTTLCacheBackend(AsyncCacheBackend):
+    """
+    AsyncCacheBackend over an in-memory TTLCacheBackend.
+
+    In-memory operations never block, so each coroutine simply delegates
+    to the wrapped cache. Used when Redis is not configured or unavailable.
+    """
+
+    def __init__(
+        self, default_ttl_seconds: int = 3600, max_entries: int | None = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            default_ttl_seconds: Default TTL in seconds (default: 1 hour)
+            max_entries: Maximum number of entries (None = unbounded)
+        """
+        self.default_ttl = default_ttl_seconds
+        self._cache = TTLCacheBackend(default_ttl_seconds, max_entries)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        """
+        Store a value in the cache with TTL.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Optional custom TTL (uses default if not provided)
+        """
+        self._cache.set(key, value, ttl_seconds)
+
+    async def get(self, key: str) -> Any | None:
+        """
+        Retrieve a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        return self._cache.get(key)
+
+    async def delete(self, key: str) -> bool:
+        """
+        Delete a specific key from the cache.
+
+        Args:
+            key: Cache key to delete
+
+        Returns:
+            True if key was deleted, False if key didn't exist
+        """
+        return self._cache.delete(key)
+
+    async def clear(self) -> None:
+        """Clear all cached items."""
+        self._cache.clear()
+
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with the wrapped TTLCacheBackend's metrics
+        """
+        return self._cache.get_stats()
+
+    async def is_healthy(self) -> bool:
+        """
+        Check if the cache backend is healthy.
+
+        Returns:
+            True (in-memory cache is always healthy)
+        """
+        return True
+
+    async def close(self) -> None:
+        """Drop all entries; there are no connections to release."""
+        self._cache.close()
+
+
+class RedisAsyncCacheBackend(AsyncCacheBackend):
+    """
+    Redis cache backend for async code, built on redis.asyncio.
+
+    Stores values in the same format, under the same keys and expiry index
+    as RedisCacheBackend, so the two can share a key prefix. Batches go
+    through a single non-transactional pipeline. There is no process-local
+    cache in front of get().
+
+    Creating the backend does no I/O; await connect() before use. Until it
+    succeeds, and after any Redis error, operations are skipped and reads
+    are misses, as with RedisCacheBackend.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        default_ttl_seconds: int = 3600,
+        key_prefix: str = "lolstonks:",
+        serializer: str = "json",
+        max_connections: int = 20,
+        pool_timeout: float = 5.0,
+    ) -> None:
+        """
+        Initialize the backend without connecting.
+
+        Args:
+            redis_url: Redis connection URL
+            default_ttl_seconds: Default TTL in seconds (default: 1 hour)
+            key_prefix: Prefix for all cache keys to avoid collisions
+            serializer: Value encoding, 'json' or 'msgpack'
+            max_connections: Maximum open connections in the pool
+            pool_timeout: Seconds to wait for a free pooled connection
+
+        Raises:
+            ValueError: If the serializer is unknown or not installed
+        """
+        self.redis_url = redis_url
+        self.default_ttl = default_ttl_seconds
+        self.key_prefix = key_prefix
+        self.serializer = serializer
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self._dumps, self._loads = _serializer(serializer)
+        self._index_key = self._make_key(REDIS_INDEX_KEY)
+        self._connected = False
+        self._hits: int = 0
+        self._misses: int = 0
+        self._pool: aioredis.BlockingConnectionPool | None = None
+        self._client: aioredis.Redis | None = None
+
+    async def connect(self) -> bool:
+        """
+        Create the connection pool and check that Redis answers.
+
+        Returns:
+            True if Redis is reachable, False otherwise
+        """
+        try:
+            if self._client is None:
+                self._pool = aioredis.BlockingConnectionPool.from_url(
+                    self.redis_url,
+                    max_connections=self.max_connections,
+                    timeout=self.pool_timeout,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                    socket_keepalive=True,
+                    socket_keepalive_options=REDIS_KEEPALIVE_OPTIONS,
+                    retry_on_timeout=True,
+                    health_check_interval=30,
+                )
+                self._client = aioredis.Redis(connection_pool=self._pool)
+
+            await self._client.ping()
+            self._connected = True
+            logger.info("Async Redis cache connected: %s", self.redis_url)
+
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            self._connected = False
+            logger.warning("Async Redis connection failed: %s", e)
+
+        return self._connected
+
+    def _make_key(self, key: str) -> str:
+        """
+        Add prefix to cache key.
+
+        Args:
+            key: Original cache key
+
+        Returns:
+            Prefixed cache key
+        """
+        return f"{self.key_prefix}{key}"
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        """
+        Store a value in the cache with TTL.
+
+        Args:
+            key: Cache key
+            value: Value to store (must be serializable)
+            ttl_seconds: Optional custom TTL (uses default if not provided)
+        """
+        await self.set_many({key: value}, ttl_seconds)
+
+    async def get(self, key: str) -> Any | None:
+        """
+        Retrieve a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        if not self._connected or self._client is None:
+            self._misses += 1
+            return None
+
+        try:
+            serialized = await self._client.get(self._make_key(key))
+            if serialized is None:
+                self._misses += 1
+                logger.debug("Redis cache miss: %s", key)
+                return None
+
+            value = self._loads(serialized)
+            self._hits += 1
+            logger.debug("Redis cache hit: %s", key)
+            return value
+
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            self._connected = False
+            self._misses += 1
+            logger.warning("Redis error during get, marking as disconnected: %s", e)
+            return None
+        except ValueError as e:
+            self._misses += 1
+            logger.warning("Redis decode error for key %s: %s", key, e)
+            return None
+
+    async def delete(self, key: str) -> bool:
+        """
+        Delete a specific key from the cache.
+
+        Args:
+            key: Cache key to delete
+
+        Returns:
+            True if key was deleted, False if key didn't exist or Redis unavailable
+        """
+        if not self._connected or self._client is None:
+            return False
+
+        try:
+            redis_key = self._make_key(key)
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.delete(redis_key)
+                pipe.zrem(self._index_key, redis_key)
+                deleted, _ = await pipe.execute()
+            logger.debug("Redis cache key deleted: %s", key)
+            return bool(deleted > 0)
+
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            self._connected = False
+            logger.warning("Redis error during delete, marking as disconnected: %s", e)
+            return False
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Retrieve several values from the cache in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of the keys found (and not expired) to their values
+        """
+        if not self._connected or self._client is None:
+            self._misses += len(keys)
+            return {}
+
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(self._make_key(key))
+                raw_values = await pipe.execute()
+
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            self._connected = False
+            self._misses += len(keys)
+            logger.warning("Redis error during get_many, marking as disconnected: %s", e)
+            return {}
+
+        found: dict[str, Any] = {}
+        for key, serialized in zip(keys, raw_values, strict=True):
+            if serialized is None:
+                continue
+            try:
+                found[key] = self._loads(serialized)
+            except ValueError as e:
+                logger.warning("Redis decode error for key %s: %s", key, e)
+
+        self._hits += len(found)
+        self._misses += len(keys) - len(found)
+        logger.debug("Redis cache get_many: %s/%s hits", len(found), len(keys))
+        return found
+
+    async def set_many(self, mapping: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        """
+        Store several values in the cache with the same TTL in one round trip.
+
+        Args:
+            mapping: Cache keys and the values to store (must be serializable)
+            ttl_seconds: Optional custom TTL (uses default if not provided)
+        """
+        if not self._connected or self._client is None:
+            return
+
+        try:
+            ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
+            redis_keys = [self._make_key(key) for key in mapping]
+            async with self._client.pipeline(transaction=False) as pipe:
+                for redis_key, value in zip(redis_keys, mapping.values(), strict=True):
+                    pipe.setex(redis_key, ttl, self._dumps(value))
+                _queue_index_update(pipe, self._index_key, dict.fromkeys(redis_keys, ttl))
+                await pipe.execute()
+            logger.debug("Redis cache set_many: %s keys (TTL: %ss)", len(mapping), ttl)
+
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            self._connected = False
+            logger.warning("Redis error during set_many, marking as disconnected: %s", e)
+
+    async def clear(self) -> None:
+        """Clear all cached items with the configured key prefix."""
+        if not self._connected or self._client is None:
+            return
+
+        try:
+            # Each batch is unlinked as soon as it fills, so memory stays bounded
+            batch: list[bytes] = []
+            cleared = 0
+            async for key in self._client.scan_iter(
+                match=f"{self.key_prefix}*", count=REDIS_SCAN_COUNT
+            ):
+                batch.append(key)
+                if len(batch) >= REDIS_UNLINK_BATCH:
+                    await self._client.unlink(*batch)
+                    cleared += len(batch)
+                    batch = []
+            if batch:
+                await self._client.unlink(*batch)
+                cleared += len(batch)
+            if cleared:
+                logger.debug("Cleared %s Redis cache entries", cleared)
+
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            self._connected = False
+            logger.warning("Redis error during clear, marking as disconnected: %s", e)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache metrics including entry count,
+            hit/miss statistics, and connection status
+        """
+        total_requests = self._hits + self._misses
+        hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+
+        total_entries = 0
+        size_bytes = 0
+        if self._connected and self._client is not None:
+            try:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    pipe.zremrangebyscore(self._index_key, "-inf", time.time())
+                    pipe.zcard(self._index_key)
+                    pipe.info("memory")
+                    _, total_entries, memory = await pipe.execute()
+                size_bytes = int(memory.get("used_memory", 0))
+            except (ConnectionError, TimeoutError, RedisError):
+                self._connected = False
+                total_entries = 0
+
+        return {
+            "total_entries": total_entries,
+            "size_bytes_estimate": size_bytes,
+            "ttl_seconds": self.default_ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(hit_rate, 4),
+            "total_requests": total_requests,
+            "redis_connected": self._connected,
+            "redis_url": self.redis_url,
+            "serializer": self.serializer,
+        }
+
+    async def is_healthy(self) -> bool:
+        """
+        Check if Redis is connected and healthy.
+
+        Returns:
+            True if Redis is connected, False otherwise
+        """
+        if not self._connected or self._client is None:
+            return False
+
+        try:
+            await self._client.ping()
+            return True
+        except (ConnectionError, TimeoutError, RedisError):
+            self._connected = False
+            return False
+
+    async def close(self) -> None:
+        """Close the client and disconnect every pooled connection."""
+        self._connected = False
+        client, self._client = self._client, None
+        pool, self._pool = self._pool, None
+        try:
+            if client is not None:
+                await client.aclose()
+            if pool is not None:
+                await pool.disconnect()
+        except RedisError as e:
+            logger.warning("Error closing Redis connection pool: %s", e)
+
 
 # Legacy TTLCache class for backward compatibility
 class TTLCache(TTLCacheBackend):
@@ -500,6 +1429,7 @@ def create_cache_backend(
     backend_type: str | None = None,
     redis_url: str | None = None,
     default_ttl_seconds: int = 3600,
+    serializer: str | None = None,
 ) -> CacheBackend:
     """
     Create a cache backend instance based on configuration.
@@ -514,6 +1444,8 @@ def create_cache_backend(
         redis_url: Redis connection URL (if using Redis backend)
                    If None, reads from settings.redis_url
         default_ttl_seconds: Default TTL in seconds
+        serializer: Redis value encoding ('json' or 'msgpack')
+                    If None, reads from settings.redis_serializer
 
     Returns:
         CacheBackend instance (RedisCacheBackend or TTLCacheBackend)
@@ -527,6 +1459,9 @@ def create_cache_backend(
     if redis_url is None:
         redis_url = settings.redis_url
 
+    if serializer is None:
+        serializer = settings.redis_serializer
+
     # Force memory backend if explicitly requested
     if backend_type == "memory":
         logger.info("Using in-memory cache backend")
@@ -537,11 +1472,14 @@ def create_cache_backend(
         redis_backend = RedisCacheBackend(
             redis_url=redis_url,
             default_ttl_seconds=default_ttl_seconds,
+            serializer=serializer,
+            max_connections=settings.redis_max_connections,
+            pool_timeout=settings.redis_pool_timeout,
         )
 
         # Check if Redis connected successfully
         if redis_backend.is_healthy():
-            logger.info(f"Using Redis cache backend: {redis_url}")
+            logger.info("Using Redis cache backend: %s", redis_url)
             return redis_backend
         else:
             # For 'auto' mode, fall back to memory
@@ -551,9 +1489,69 @@ def create_cache_backend(
             else:
                 # For explicit 'redis' mode, still return the backend
                 # (it will handle errors gracefully)
-                logger.warning(f"Redis backend created but not connected: {redis_url}")
+                logger.warning("Redis backend created but not connected: %s", redis_url)
                 return redis_backend
 
     # Default to in-memory
     logger.info("Using default in-memory cache backend")
     return TTLCacheBackend(default_ttl_seconds=default_ttl_seconds)
+
+
+async def create_async_cache_backend(
+    backend_type: str | None = None,
+    redis_url: str | None = None,
+    default_ttl_seconds: int = 3600,
+    serializer: str | None = None,
+) -> AsyncCacheBackend:
+    """
+    Create and connect an async cache backend based on configuration.
+
+    Async counterpart of create_cache_backend() with the same settings and
+    fallback rules. It is a coroutine because checking the Redis
+    connection needs an awaited PING.
+
+    Args:
+        backend_type: Cache backend type ('redis', 'memory', 'auto')
+                      If None, reads from settings.cache_backend
+        redis_url: Redis connection URL (if using Redis backend)
+                   If None, reads from settings.redis_url
+        default_ttl_seconds: Default TTL in seconds
+        serializer: Redis value encoding ('json' or 'msgpack')
+                    If None, reads from settings.redis_serializer
+
+    Returns:
+        AsyncCacheBackend instance (RedisAsyncCacheBackend or AsyncTTLCacheBackend)
+    """
+    settings = get_settings()
+
+    if backend_type is None:
+        backend_type = settings.cache_backend
+
+    if redis_url is None:
+        redis_url = settings.redis_url
+
+    if serializer is None:
+        serializer = settings.redis_serializer
+
+    if backend_type in ("redis", "auto"):
+        redis_backend = RedisAsyncCacheBackend(
+            redis_url=redis_url,
+            default_ttl_seconds=default_ttl_seconds,
+            serializer=serializer,
+            max_connections=settings.redis_max_connections,
+            pool_timeout=settings.redis_pool_timeout,
+        )
+
+        if await redis_backend.connect():
+            logger.info("Using async Redis cache backend: %s", redis_url)
+            return redis_backend
+        if backend_type == "redis":
+            # Explicit 'redis' mode keeps the backend (it handles errors gracefully)
+            logger.warning("Async Redis backend created but not connected: %s", redis_url)
+            return redis_backend
+
+        logger.warning("Redis unavailable, falling back to in-memory cache")
+        await redis_backend.close()
+
+    logger.info("Using async in-memory cache backend")
+    return AsyncTTLCacheBackend(default_ttl_seconds=default_ttl_seconds)
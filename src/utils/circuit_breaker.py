@@ -1,17 +1,26 @@
 import asyncio
 import logging
 import random
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
-from typing import Any, TypeVar
+from typing import Any, Final, TypeVar
 
 import httpx
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
+NS_PER_SECOND: Final[int] = 1_000_000_000
+
+# Transport failures worth retrying (ConnectionError is an OSError subclass)
+RETRIABLE_ERRORS: Final[tuple[type[Exception], ...]] = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    OSError,
+)
+
 
 class CircuitBreakerState(str, Enum):
     CLOSED = "closed"
@@ -19,7 +28,7 @@ class CircuitBreakerState(str, Enum):
     HALF_OPEN = "half_open"
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerConfig:
     failure_threshold: int = 5
     recovery_timeout: float = 900.0
@@ -30,15 +39,16 @@ class CircuitBreakerConfig:
     retry_jitter: float = 0.1
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerStats:
     state: CircuitBreakerState = CircuitBreakerState.CLOSED
     failure_count: int = 0
     success_count: int = 0
     total_failure_count: int = 0
-    last_failure_time: datetime | None = None
-    last_success_time: datetime | None = None
-    opened_at: datetime | None = None
+    # time.monotonic_ns() readings; only meaningful relative to each other
+    last_failure_time: int | None = None
+    last_success_time: int | None = None
+    opened_at: int | None = None
     total_calls: int = 0
     total_retries: int = 0
 
@@ -50,12 +60,32 @@ class CircuitBreakerOpenError(Exception):
 
 
 class CircuitBreaker:
+    __slots__ = (
+        "source",
+        "config",
+        "stats",
+        "_half_open_calls",
+        "_lock",
+        "_delay_table",
+        "_jitter_spans",
+        "_metrics",
+    )
+
     def __init__(self, source: str, config: "CircuitBreakerConfig | None" = None) -> None:
         self.source = source
         self.config = config or CircuitBreakerConfig()
         self.stats = CircuitBreakerStats()
         self._half_open_calls = 0
         self._lock = asyncio.Lock()
+        # Backoff before each retry and the full width of its +/- jitter band
+        self._delay_table: list[float] = [
+            self.config.retry_base_delay * (2**attempt)
+            for attempt in range(self.config.retry_attempts)
+        ]
+        self._jitter_spans = [delay * self.config.retry_jitter * 2 for delay in self._delay_table]
+        # Cached get_metrics() fields other than the open duration; None once
+        # any counter or the state changes
+        self._metrics: dict[str, Any] | None = None
 
     def is_open(self) -> bool:
         return self.stats.state == CircuitBreakerState.OPEN
@@ -67,25 +97,30 @@ class CircuitBreaker:
         return self.stats.state == CircuitBreakerState.HALF_OPEN
 
     async def call(self, func: "Callable[..., Awaitable[T]]", *args: Any, **kwargs: Any) -> T:
-        async with self._lock:
-            if self.stats.state == CircuitBreakerState.OPEN:
-                if self._should_attempt_reset():
-                    logger.info(f"[CB:{self.source}] Recovery timeout, HALF_OPEN")
-                    self.stats.state = CircuitBreakerState.HALF_OPEN
-                    self._half_open_calls = 0
-                else:
-                    self.stats.total_calls += 1
-                    logger.warning(f"[CB:{self.source}] Circuit OPEN, rejecting")
-                    raise CircuitBreakerOpenError(
-                        self.source, f"Circuit breaker is OPEN for source {self.source!r}"
-                    )
+        # The lock only guards the OPEN -> HALF_OPEN transition; a closed
+        # circuit (the common case) goes straight to the call
+        if self.stats.state is not CircuitBreakerState.CLOSED:
+            async with self._lock:
+                if self.stats.state == CircuitBreakerState.OPEN:
+                    if self._should_attempt_reset():
+                        logger.info("[CB:%s] Recovery timeout, HALF_OPEN", self.source)
+                        self.stats.state = CircuitBreakerState.HALF_OPEN
+                        self._half_open_calls = 0
+                        self._metrics = None
+                    else:
+                        self.stats.total_calls += 1
+                        self._metrics = None
+                        logger.warning("[CB:%s] Circuit OPEN, rejecting", self.source)
+                        raise CircuitBreakerOpenError(
+                            self.source, f"Circuit breaker is OPEN for source {self.source!r}"
+                        )
         try:
             result = await self._call_with_retry(func, *args, **kwargs)
-            await self._on_success()
-            return result
         except Exception as e:
-            await self._on_failure(e)
+            self._record_failure(e)
             raise
+        self._record_success()
+        return result
 
     async def _call_with_retry(
         self, func: "Callable[..., Awaitable[T]]", *args: Any, **kwargs: Any
@@ -97,91 +132,99 @@ class CircuitBreaker:
             except Exception as e:
                 last_exception = e
                 self.stats.total_retries += 1
+                self._metrics = None
                 if attempt == self.config.retry_attempts - 1:
                     break
                 delay = self._calculate_retry_delay(attempt)
                 logger.info(
-                    f"[CB:{self.source}] Retry {attempt + 1}/{self.config.retry_attempts} after {delay:.2f}s"
+                    "[CB:%s] Retry %s/%s after %.2fs",
+                    self.source,
+                    attempt + 1,
+                    self.config.retry_attempts,
+                    delay,
                 )
                 await asyncio.sleep(delay)
         assert last_exception is not None
         raise last_exception
 
     def _calculate_retry_delay(self, attempt: int) -> float:
-        exponential_delay = self.config.retry_base_delay * (2**attempt)
-        jitter_range = exponential_delay * self.config.retry_jitter
         # nosec - Random used for jitter in retry delays, not for cryptographic purposes (B311)
-        jitter = random.uniform(-jitter_range, jitter_range)  # nosec
-        return float(max(0.1, min(exponential_delay + jitter, self.config.retry_max_delay)))
+        jitter = (random.random() - 0.5) * self._jitter_spans[attempt]  # nosec
+        return max(0.1, min(self._delay_table[attempt] + jitter, self.config.retry_max_delay))
 
     def _should_attempt_reset(self) -> bool:
         if self.stats.opened_at is None:
             return False
-        elapsed = (datetime.utcnow() - self.stats.opened_at).total_seconds()
-        return elapsed >= self.config.recovery_timeout
-
-    async def _on_success(self) -> None:
-        async with self._lock:
-            self.stats.total_calls += 1
-            self.stats.success_count += 1
-            self.stats.last_success_time = datetime.utcnow()
-            self.stats.failure_count = 0
-            if self.stats.state == CircuitBreakerState.HALF_OPEN:
-                self._half_open_calls += 1
-                if self._half_open_calls >= self.config.half_open_max_calls:
-                    logger.info(f"[CB:{self.source}] Recovery successful, closing circuit")
-                    self.stats.state = CircuitBreakerState.CLOSED
-                    self.stats.opened_at = None
-                    self._half_open_calls = 0
-
-    async def _on_failure(self, error: Exception) -> None:
-        async with self._lock:
-            self.stats.total_calls += 1
-            self.stats.total_failure_count += 1
-            self.stats.failure_count += 1
-            self.stats.last_failure_time = datetime.utcnow()
-            is_retriable = self._is_retriable_error(error)
-            if is_retriable:
-                if self.stats.state == CircuitBreakerState.HALF_OPEN:
-                    logger.warning(f"[CB:{self.source}] Failure in HALF_OPEN, reopening")
-                    self.stats.state = CircuitBreakerState.OPEN
-                    self.stats.opened_at = datetime.utcnow()
-                    self._half_open_calls = 0
-                elif self.stats.failure_count >= self.config.failure_threshold:
-                    logger.warning(f"[CB:{self.source}] Threshold reached, opening circuit")
-                    self.stats.state = CircuitBreakerState.OPEN
-                    self.stats.opened_at = datetime.utcnow()
+        elapsed = time.monotonic_ns() - self.stats.opened_at
+        return elapsed >= int(self.config.recovery_timeout * NS_PER_SECOND)
+
+    # Recording never awaits, so asyncio runs each of these atomically and the
+    # counters and transitions below need no lock
+
+    def _record_success(self) -> None:
+        self._metrics = None
+        self.stats.total_calls += 1
+        self.stats.success_count += 1
+        self.stats.last_success_time = time.monotonic_ns()
+        self.stats.failure_count = 0
+        if self.stats.state == CircuitBreakerState.HALF_OPEN:
+            self._half_open_calls += 1
+            if self._half_open_calls >= self.config.half_open_max_calls:
+                logger.info("[CB:%s] Recovery successful, closing circuit", self.source)
+                self.stats.state = CircuitBreakerState.CLOSED
+                self.stats.opened_at = None
+                self._half_open_calls = 0
+
+    def _record_failure(self, error: Exception) -> None:
+        self._metrics = None
+        self.stats.total_calls += 1
+        self.stats.total_failure_count += 1
+        self.stats.failure_count += 1
+        now = time.monotonic_ns()
+        self.stats.last_failure_time = now
+        if not self._is_retriable_error(error):
+            return
+        if self.stats.state == CircuitBreakerState.HALF_OPEN:
+            logger.warning("[CB:%s] Failure in HALF_OPEN, reopening", self.source)
+            self.stats.state = CircuitBreakerState.OPEN
+            self.stats.opened_at = now
+            self._half_open_calls = 0
+        elif self.stats.failure_count >= self.config.failure_threshold:
+            logger.warning("[CB:%s] Threshold reached, opening circuit", self.source)
+            self.stats.state = CircuitBreakerState.OPEN
+            self.stats.opened_at = now
 
     def _is_retriable_error(self, error: Exception) -> bool:
         if isinstance(error, httpx.HTTPStatusError):
             status = error.response.status_code
             return status >= 500 or status == 429
-        if isinstance(
-            error, (httpx.TimeoutException, httpx.NetworkError, ConnectionError, OSError)
-        ):
-            return True
-        return False
+        return isinstance(error, RETRIABLE_ERRORS)
 
     def reset(self) -> None:
-        logger.info(f"[CB:{self.source}] Manual reset to CLOSED")
+        logger.info("[CB:%s] Manual reset to CLOSED", self.source)
         self.stats = CircuitBreakerStats()
         self._half_open_calls = 0
+        self._metrics = None
 
     def get_metrics(self) -> dict[str, Any]:
-        return {
-            "circuit_breaker_state": 1 if self.is_closed() else 0,
-            f"circuit_breaker_state_{self.stats.state.value}": 1,
-            "circuit_breaker_failures_total": self.stats.total_failure_count,
-            "circuit_breaker_successes_total": self.stats.success_count,
-            "circuit_breaker_calls_total": self.stats.total_calls,
-            "circuit_breaker_retries_total": self.stats.total_retries,
-            "circuit_breaker_failure_count": self.stats.failure_count,
-            "circuit_breaker_open_seconds": (
-                (datetime.utcnow() - self.stats.opened_at).total_seconds()
-                if self.stats.opened_at
-                else 0
-            ),
-        }
+        # The counter fields are built once per breaker change; every call
+        # returns a fresh dict with the current open duration
+        metrics = self._metrics
+        if metrics is None:
+            metrics = self._metrics = {
+                "circuit_breaker_state": 1 if self.is_closed() else 0,
+                f"circuit_breaker_state_{self.stats.state.value}": 1,
+                "circuit_breaker_failures_total": self.stats.total_failure_count,
+                "circuit_breaker_successes_total": self.stats.success_count,
+                "circuit_breaker_calls_total": self.stats.total_calls,
+                "circuit_breaker_retries_total": self.stats.total_retries,
+                "circuit_breaker_failure_count": self.stats.failure_count,
+            }
+        opened_at = self.stats.opened_at
+        open_seconds = (
+            0.0 if opened_at is None else (time.monotonic_ns() - opened_at) / NS_PER_SECOND
+        )
+        return {**metrics, "circuit_breaker_open_seconds": open_seconds}
 
     def __repr__(self) -> str:
         return f"CircuitBreaker({self.source!r}, state={self.stats.state.value}, failures={self.stats.failure_count})"
@@ -193,10 +236,14 @@ class CircuitBreakerRegistry:
 
     def get(self, source: str, config: "CircuitBreakerConfig | None" = None) -> CircuitBreaker:
         if source not in self._circuit_breakers:
-            logger.info(f"Registry: Creating circuit breaker for {source}")
+            logger.info("Registry: Creating circuit breaker for %s", source)
             self._circuit_breakers[source] = CircuitBreaker(source, config)
         return self._circuit_breakers[source]
 
+    def register(self, source: str, circuit_breaker: CircuitBreaker) -> None:
+        # Several sources may share one breaker, e.g. all sources on a host
+        self._circuit_breakers[source] = circuit_breaker
+
     def get_all(self) -> dict[str, CircuitBreaker]:
         return self._circuit_breakers.copy()
 
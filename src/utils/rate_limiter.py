@@ -0,0 +1,164 @@
+"""
+Async rate limiting utilities.
+
+This module provides a small token bucket rate limiter for asyncio code.
+It is used to space out requests to the same host regardless of how many
+scraper instances or tasks are talking to it concurrently. It also provides
+a semaphore whose capacity can be changed at runtime, for adaptive
+concurrency limits.
+"""
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket rate limiter for asyncio tasks.
+
+    Tokens are refilled continuously at one token per interval, up to
+    burst tokens. Each acquire() reserves the next free slot synchronously
+    and then sleeps until that slot, so concurrent callers are spaced
+    out in arrival order without needing a lock. This also means the
+    limiter is not bound to an event loop and can be created at import time.
+
+    Uses time.monotonic(), so wall clock adjustments never shorten or
+    stretch the wait.
+
+    Attributes:
+        interval: Seconds between tokens (minimum spacing between requests)
+        burst: Maximum number of requests allowed back-to-back
+    """
+
+    def __init__(self, interval: float, burst: int = 1) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            interval: Seconds between tokens
+            burst: Bucket capacity (number of requests allowed without waiting)
+
+        Raises:
+            ValueError: If interval is negative or burst is less than 1
+        """
+        if interval < 0:
+            raise ValueError(f"interval must be >= 0, got {interval}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+
+        self.interval = interval
+        self.burst = burst
+        # Theoretical arrival time of the next request when the bucket is empty
+        self._next_slot: float = 0.0
+
+    def _reserve(self) -> float:
+        """
+        Reserve the next request slot.
+
+        Returns:
+            Seconds to wait before the reserved slot starts
+        """
+        now = time.monotonic()
+        next_slot = max(self._next_slot, now) + self.interval
+        self._next_slot = next_slot
+        return max(0.0, next_slot - self.burst * self.interval - now)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        delay = self._reserve()
+        if delay > 0:
+            logger.debug(f"Rate limiting: sleeping {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    def reset(self) -> None:
+        """Refill the bucket, forgetting all previous reservations."""
+        self._next_slot = 0.0
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        """Acquire a token on context entry."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        """Nothing to release on context exit."""
+
+    def __repr__(self) -> str:
+        """Developer-friendly representation."""
+        return f"AsyncRateLimiter(interval={self.interval!r}, burst={self.burst!r})"
+
+
+class ResizableSemaphore:
+    """
+    Concurrency limiter whose capacity can be changed while in use.
+
+    asyncio.Semaphore has no supported way to change its limit, so this
+    keeps an active count guarded by an asyncio.Condition. Lowering the
+    capacity never interrupts holders; new acquirers wait until the active
+    count drops below the new capacity.
+
+    Attributes:
+        capacity: Maximum number of concurrent holders
+        active: Current number of holders
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the semaphore.
+
+        Args:
+            capacity: Maximum number of concurrent holders
+
+        Raises:
+            ValueError: If capacity is less than 1
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+
+        self.capacity = capacity
+        self.active = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until fewer than capacity holders are active, then join them."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.capacity)
+            self.active += 1
+
+    async def release(self) -> None:
+        """Leave the active holders and wake one waiter."""
+        async with self._condition:
+            self.active -= 1
+            self._condition.notify(1)
+
+    async def set_capacity(self, capacity: int) -> None:
+        """
+        Change the capacity, waking waiters if it grew.
+
+        Args:
+            capacity: New maximum number of concurrent holders
+
+        Raises:
+            ValueError: If capacity is less than 1
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+
+        async with self._condition:
+            self.capacity = capacity
+            self._condition.notify_all()
+
+    async def __aenter__(self) -> "ResizableSemaphore":
+        """Acquire on context entry."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        """Release on context exit."""
+        await self.release()
+
+    def __repr__(self) -> str:
+        """Developer-friendly representation."""
+        return f"ResizableSemaphore(capacity={self.capacity!r}, active={self.active!r})"
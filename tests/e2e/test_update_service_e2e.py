@@ -6,6 +6,8 @@ LoL API and scrapers, saving to database, and verifying results.
 """
 
 import asyncio
+import logging
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -19,7 +21,9 @@ from src.services.update_service import (
     UpdateService,
     UpdateServiceV2,
     UpdateTask,
+    _save_articles,
 )
+from src.utils.circuit_breaker import CircuitBreakerRegistry, CircuitBreakerState
 
 
 @pytest.fixture
@@ -31,6 +35,13 @@ async def test_db(tmp_path: Path) -> ArticleRepository:
     return repo
 
 
+@pytest.fixture(autouse=True)
+def warmup_scrapers() -> Iterator[AsyncMock]:
+    """Stub out the host warm-up so no HEAD requests leave the test."""
+    with patch("src.services.update_service.warmup_scrapers", new_callable=AsyncMock) as mock:
+        yield mock
+
+
 @pytest.fixture
 def sample_articles() -> list[Article]:
     """Create sample articles for testing."""
@@ -327,6 +338,194 @@ class TestUpdateServiceV2E2E:
             db_count = await test_db.count()
             assert db_count >= 0  # Should have some articles
 
+    @pytest.mark.asyncio
+    async def test_execute_tasks_uses_bounded_worker_pool(self, test_db: ArticleRepository) -> None:
+        """Test that queued tasks all run, in order, at most max_concurrent at once."""
+        service = UpdateServiceV2(test_db, max_concurrent=3)
+        tasks = await service._create_tasks(locales=["en-us", "ko-kr"])
+        started: list[UpdateTask] = []
+        active = 0
+        peak = 0
+
+        async def update_source(task: UpdateTask, force_refresh: bool = False) -> int:
+            nonlocal active, peak
+            started.append(task)
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return 1
+
+        with patch.object(service, "_update_source", side_effect=update_source):
+            stats = await service._execute_tasks(tasks)
+
+        assert stats["success"] == stats["new_articles"] == len(tasks)
+        assert started == tasks
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_tasks_warms_up_scraper_hosts(
+        self, test_db: ArticleRepository, warmup_scrapers: AsyncMock
+    ) -> None:
+        """Test that scraper hosts are warmed up once before the fan-out."""
+        service = UpdateServiceV2(test_db)
+        tasks = [
+            UpdateTask(UpdatePriority.LOW, "reddit", "en-us", SourceCategory.SOCIAL),
+            UpdateTask(UpdatePriority.LOW, "reddit", "ko-kr", SourceCategory.SOCIAL),
+            UpdateTask(UpdatePriority.CRITICAL, "lol", "en-us", SourceCategory.OFFICIAL_RIOT),
+        ]
+        started: list[UpdateTask] = []
+
+        async def update_source(task: UpdateTask, force_refresh: bool = False) -> int:
+            assert warmup_scrapers.await_count == 1
+            started.append(task)
+            return 0
+
+        with patch.object(service, "_update_source", side_effect=update_source):
+            await service._execute_tasks(tasks)
+
+        (scrapers,) = warmup_scrapers.await_args.args
+        assert [scraper.config.source_id for scraper in scrapers] == ["reddit"]
+        assert len(started) == len(tasks)
+
+    @pytest.mark.asyncio
+    async def test_execute_tasks_survives_warmup_failure(
+        self, test_db: ArticleRepository, warmup_scrapers: AsyncMock
+    ) -> None:
+        """Test that a failing warm-up does not stop the fan-out."""
+        service = UpdateServiceV2(test_db)
+        warmup_scrapers.side_effect = RuntimeError("dns down")
+        tasks = [UpdateTask(UpdatePriority.LOW, "reddit", "en-us", SourceCategory.SOCIAL)]
+
+        with patch.object(service, "_update_source", AsyncMock(return_value=1)):
+            stats = await service._execute_tasks(tasks)
+
+        assert stats["success"] == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_tasks_runs_by_priority(self, test_db: ArticleRepository) -> None:
+        """Test that workers pick tasks by priority, FIFO within a priority."""
+        service = UpdateServiceV2(test_db, max_concurrent=1)
+        tasks = [
+            UpdateTask(UpdatePriority.LOW, "reddit", "en-us", SourceCategory.SOCIAL),
+            UpdateTask(UpdatePriority.CRITICAL, "lol", "en-us", SourceCategory.OFFICIAL_RIOT),
+            UpdateTask(UpdatePriority.LOW, "reddit", "ko-kr", SourceCategory.SOCIAL),
+            UpdateTask(UpdatePriority.CRITICAL, "lol", "ko-kr", SourceCategory.OFFICIAL_RIOT),
+        ]
+        started: list[UpdateTask] = []
+
+        async def update_source(task: UpdateTask, force_refresh: bool = False) -> int:
+            started.append(task)
+            return 0
+
+        with patch.object(service, "_update_source", side_effect=update_source):
+            await service._execute_tasks(tasks)
+
+        assert started == [tasks[1], tasks[3], tasks[0], tasks[2]]
+
+    @pytest.mark.asyncio
+    async def test_execute_tasks_counts_failures(self, test_db: ArticleRepository) -> None:
+        """Test that failed tasks, and tasks a crashed worker left behind, count as failed."""
+        service = UpdateServiceV2(test_db, max_concurrent=2)
+        tasks = await service._create_tasks(locales=["en-us"])
+
+        async def update_source(task: UpdateTask, force_refresh: bool = False) -> int:
+            if task is tasks[0]:
+                raise RuntimeError("boom")
+            await asyncio.sleep(0)
+            return 1
+
+        with (
+            patch.object(service, "_update_source", side_effect=update_source),
+            patch.object(service, "_adjust_concurrency", AsyncMock(side_effect=[None, KeyError])),
+        ):
+            stats = await service._execute_tasks(tasks)
+
+        assert stats["total"] == len(tasks)
+        assert stats["success"] == stats["new_articles"] == len(tasks) - 1
+        assert stats["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_save_articles_batches_and_falls_back(
+        self, test_db: ArticleRepository, sample_articles: list[Article]
+    ) -> None:
+        """Test that articles are saved in one batch, or singly if the batch fails."""
+        assert await _save_articles(test_db, sample_articles[:2]) == 2
+        assert await _save_articles(test_db, sample_articles[:2]) == 0
+
+        with patch.object(test_db, "save_many", AsyncMock(side_effect=RuntimeError("locked"))):
+            assert await _save_articles(test_db, sample_articles) == 1
+
+        assert await test_db.count() == 3
+
+    @pytest.mark.asyncio
+    async def test_overlapping_fetches_are_deduplicated(
+        self, test_db: ArticleRepository, sample_articles: list[Article]
+    ) -> None:
+        """Test that identical concurrent fetches share one request."""
+        service = UpdateServiceV2(test_db)
+        release = asyncio.Event()
+
+        async def fetch_news(locale: str) -> list[Article]:
+            await release.wait()
+            return sample_articles[:2]
+
+        service.lol_client.fetch_news = AsyncMock(side_effect=fetch_news)
+
+        with patch.object(service, "_respect_rate_limit", AsyncMock()):
+            first = asyncio.create_task(service._fetch_once("lol", "en-us"))
+            second = asyncio.create_task(service._fetch_once("lol", "en-us"))
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+            assert results == [sample_articles[:2]] * 2
+            assert service.lol_client.fetch_news.await_count == 1
+            assert not service._inflight_fetches
+
+            # A later fetch is not deduplicated against a finished one
+            await service._fetch_once("lol", "en-us", force_refresh=True)
+            assert service.lol_client.fetch_news.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_recent_fetches_are_reused(
+        self, test_db: ArticleRepository, sample_articles: list[Article]
+    ) -> None:
+        """Test the short-lived per source-locale article cache."""
+        service = UpdateServiceV2(test_db)
+        service.lol_client.fetch_news = AsyncMock(return_value=sample_articles[:2])
+
+        with (
+            patch.object(service, "_respect_rate_limit", AsyncMock()),
+            patch("src.services.update_service.time.monotonic", return_value=1000.0),
+        ):
+            first = await service.update_source("lol", locales=["en-us"])
+            second = await service.update_source("lol", locales=["en-us"])
+            assert service.lol_client.fetch_news.await_count == 1
+            assert (first["new_articles"], second["new_articles"]) == (2, 0)
+
+            await service.update_source("lol", locales=["en-us"], force_refresh=True)
+            assert service.lol_client.fetch_news.await_count == 2
+
+        with (
+            patch.object(service, "_respect_rate_limit", AsyncMock()),
+            patch("src.services.update_service.time.monotonic", return_value=1061.0),
+        ):
+            await service.update_source("lol", locales=["en-us"])
+            assert service.lol_client.fetch_news.await_count == 3
+
+    def test_article_cache_evicts_least_recently_used(self, test_db: ArticleRepository) -> None:
+        """Test that the article cache is capped in size."""
+        service = UpdateServiceV2(test_db)
+
+        with patch.object(UpdateServiceV2, "CONTENT_CACHE_MAX_ENTRIES", 2):
+            service._cache_articles(("a", "en-us"), [])
+            service._cache_articles(("b", "en-us"), [])
+            assert service._cached_articles(("a", "en-us")) == []
+            service._cache_articles(("c", "en-us"), [])
+
+        assert list(service._article_cache) == [("a", "en-us"), ("c", "en-us")]
+
     @pytest.mark.asyncio
     async def test_rate_limiting(self, test_db: ArticleRepository) -> None:
         """Test rate limiting for different domains."""
@@ -337,9 +536,40 @@ class TestUpdateServiceV2E2E:
         assert "riotgames.com" in service.DEFAULT_RATE_LIMITS
         assert service.DEFAULT_RATE_LIMITS["leagueoflegends.com"] == 2.0
 
-        # Check that semaphores were created
+        # Check that rate limiters were created
         assert "leagueoflegends.com" in service.domain_rate_limits
         assert "riotgames.com" in service.domain_rate_limits
+        assert service.domain_rate_limits["leagueoflegends.com"].interval == 2.0
+
+        # Every known source resolves to a prebuilt, shared limiter
+        assert set(service._rate_info) == set(ArticleSource.ALL_SOURCES)
+        for domain, limiter in service._rate_info.values():
+            assert service.domain_rate_limits[domain] is limiter
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_does_not_hold_domain(self, test_db: ArticleRepository) -> None:
+        """Test that burst requests to a domain start without waiting."""
+        service = UpdateServiceV2(test_db)
+
+        with patch("src.utils.rate_limiter.asyncio.sleep", AsyncMock()) as mock_sleep:
+            await asyncio.gather(
+                service._respect_rate_limit("lol"), service._respect_rate_limit("lol")
+            )
+            mock_sleep.assert_not_awaited()
+
+            await service._respect_rate_limit("lol")
+            mock_sleep.assert_awaited_once()
+
+            # Unknown sources get their own limiter at the base rate, created once
+            await asyncio.gather(
+                service._respect_rate_limit("unknown-source"),
+                service._respect_rate_limit("unknown-source"),
+            )
+
+        assert (
+            service._rate_info["unknown-source"][1] is service.domain_rate_limits["unknown-source"]
+        )
+        assert service.domain_rate_limits["unknown-source"].interval == service.BASE_RATE_LIMIT
 
     @pytest.mark.asyncio
     async def test_extract_domain(self, test_db: ArticleRepository) -> None:
@@ -442,6 +672,37 @@ class TestUpdateServiceV2E2E:
         assert stats["successful_tasks"] == 0
         assert stats["new_articles"] == 0
 
+    @pytest.mark.asyncio
+    async def test_create_tasks_skips_unknown_sources(
+        self, test_db: ArticleRepository, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that unknown sources are dropped with a single warning."""
+        service = UpdateServiceV2(test_db)
+
+        with caplog.at_level(logging.WARNING):
+            tasks = await service._create_tasks(
+                locales=["en-us"], source_ids=["bogus-1", "lol", "bogus-2", "dexerto"]
+            )
+
+        assert [task.source_id for task in tasks] == ["lol", "dexerto"]
+        warnings = [r for r in caplog.records if "not in ALL_SOURCES" in r.getMessage()]
+        assert len(warnings) == 1
+        assert "bogus-1" in warnings[0].getMessage()
+        assert "bogus-2" in warnings[0].getMessage()
+
+    @pytest.mark.asyncio
+    async def test_create_tasks_priority_override(self, test_db: ArticleRepository) -> None:
+        """Test that an explicit priority replaces each source's own priority."""
+        service = UpdateServiceV2(test_db)
+
+        tasks = await service._create_tasks(
+            locales=["en-us", "ko-kr"], source_ids=["lol", "dexerto"], priority=UpdatePriority.LOW
+        )
+
+        assert len(tasks) == 4
+        assert {task.priority for task in tasks} == {UpdatePriority.LOW}
+        assert [task.category for task in tasks[:2]] == [service._source_meta["lol"][0]] * 2
+
     @pytest.mark.asyncio
     async def test_get_status_v2(self, test_db: ArticleRepository) -> None:
         """Test getting service status for V2."""
@@ -457,6 +718,22 @@ class TestUpdateServiceV2E2E:
         assert status["configured_sources"] > 0
         assert status["configured_locales"] > 0
 
+    @pytest.mark.asyncio
+    async def test_get_status_circuit_breakers(self, test_db: ArticleRepository) -> None:
+        """Test that the status reports every circuit breaker's state."""
+        service = UpdateServiceV2(test_db)
+        service.cb_registry = CircuitBreakerRegistry()
+        service.cb_registry.get("lol")
+        service.cb_registry.get("dexerto").stats.state = CircuitBreakerState.OPEN
+        service.cb_registry.get("dexerto").stats.failure_count = 5
+
+        status = service.get_status()
+
+        assert status["circuit_breakers"] == {
+            "lol": {"state": "closed", "failure_count": 0, "is_open": False},
+            "dexerto": {"state": "open", "failure_count": 5, "is_open": True},
+        }
+
     @pytest.mark.asyncio
     async def test_concurrent_update_stress_test(
         self, test_db: ArticleRepository, sample_articles: list[Article]
@@ -588,6 +865,10 @@ class TestUpdateServiceV2E2E:
         assert task1 == task2
         assert task1 != task3
 
+        # The cached hash is an implementation detail
+        assert hash(task1) == hash(("lol", "en-us"))
+        assert "_hash" not in repr(task1)
+
 
 # =============================================================================
 # Performance Tests
@@ -541,3 +541,49 @@ class TestCacheIntegration:
 
                 # Cache should have been invalidated
                 # Note: get_build_id is mocked, so actual cache won't be populated
+
+
+class TestSharedHttpClient:
+    """Tests for reusing an injected HTTP client."""
+
+    @staticmethod
+    def make_transport(requests: list[httpx.Request]) -> httpx.MockTransport:
+        """Serve the news page and JSON API, recording every request."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path.endswith("news.json"):
+                return httpx.Response(200, json=MOCK_API_RESPONSE)
+            return httpx.Response(200, text=MOCK_HTML)
+
+        return httpx.MockTransport(handler)
+
+    @pytest.mark.asyncio
+    async def test_requests_go_through_injected_client(self, mock_cache: TTLCache) -> None:
+        requests: list[httpx.Request] = []
+        async with httpx.AsyncClient(transport=self.make_transport(requests)) as http_client:
+            client = LoLNewsAPIClient(
+                base_url="https://www.leagueoflegends.com",
+                cache=mock_cache,
+                http_client=http_client,
+            )
+
+            articles = await client.fetch_news("en-us")
+
+            assert len(articles) == 2
+            assert [r.url.path for r in requests] == [
+                "/en-us/news/",
+                "/_next/data/test-build-id-123/en-us/news.json",
+            ]
+            assert not http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_closed_client_falls_back_to_one_off_client(self, mock_cache: TTLCache) -> None:
+        http_client = httpx.AsyncClient()
+        await http_client.aclose()
+        client = LoLNewsAPIClient(cache=mock_cache, http_client=http_client)
+
+        async with client._client() as used:
+            assert used is not http_client
+            assert not used.is_closed
+        assert used.is_closed
@@ -6,17 +6,32 @@ with comprehensive coverage of cache operations, error handling, and
 fallback behavior.
 """
 
+import json
+import sys
 from time import sleep
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
+from redis import BlockingConnectionPool
 from redis.exceptions import ConnectionError, TimeoutError
 
 from src.utils.cache import (
+    DEFAULT_MAX_ENTRIES,
+    HEAP_COMPACT_SLACK,
+    REDIS_INDEX_KEY,
+    REDIS_KEEPALIVE_OPTIONS,
+    REDIS_LOCAL_MISS_TTL_SECONDS,
+    REDIS_LOCAL_TTL_SECONDS,
+    REDIS_SCAN_COUNT,
+    REDIS_UNLINK_BATCH,
+    AsyncCacheBackend,
+    AsyncTTLCacheBackend,
     CacheBackend,
+    RedisAsyncCacheBackend,
     RedisCacheBackend,
     TTLCache,
     TTLCacheBackend,
+    create_async_cache_backend,
     create_cache_backend,
 )
 
@@ -92,6 +107,34 @@ class TestTTLCacheBackend:
         assert cache.get("key1") is None
         assert cache.get("key2") == "value2"
 
+    def test_cache_cleanup_skips_overwritten_and_deleted_keys(self):
+        """Test that stale heap entries never remove live items."""
+        cache = TTLCacheBackend()
+
+        with patch("src.utils.cache.time.monotonic", return_value=1000.0) as monotonic:
+            cache.set("key1", "old", ttl_seconds=1)
+            cache.set("key1", "new", ttl_seconds=100)
+            cache.set("key2", "value2", ttl_seconds=1)
+            cache.delete("key2")
+            cache.set("key2", "value2", ttl_seconds=100)
+            cache.set("key3", "value3", ttl_seconds=1)
+
+            monotonic.return_value = 1002.0
+            assert cache.cleanup_expired() == 1
+            assert cache.get("key1") == "new"
+            assert cache.get("key2") == "value2"
+            assert cache.get("key3") is None
+
+    def test_cache_expiry_heap_is_compacted(self):
+        """Test that repeated overwrites do not grow the expiry heap forever."""
+        cache = TTLCacheBackend()
+
+        for i in range(1000):
+            cache.set("key", i)
+
+        assert len(cache._heap) <= 2 + HEAP_COMPACT_SLACK
+        assert cache.get("key") == 999
+
     def test_cache_different_types(self):
         """Test caching different data types."""
         cache = TTLCacheBackend()
@@ -140,6 +183,103 @@ class TestTTLCacheBackend:
         assert stats["ttl_seconds"] == 60
         assert stats["total_requests"] == 3
 
+    def test_cache_size_estimate_tracks_writes_and_removals(self):
+        """Test that the running size estimate matches a full recount."""
+        cache = TTLCacheBackend(max_entries=3)
+
+        def recount() -> int:
+            return sum(
+                sys.getsizeof(key) + sys.getsizeof(value)
+                for key, (value, *_) in cache._cache.items()
+            )
+
+        with patch("src.utils.cache.time.monotonic", return_value=1000.0) as monotonic:
+            cache.set("key1", "v")
+            cache.set("key2", "value" * 100, ttl_seconds=5)
+            cache.set("key1", ["a", "b", "c"])  # overwrite
+            cache.set("key3", 42)
+            cache.set("key4", {"x": 1})  # evicts key2
+            cache.delete("key3")
+            assert cache.get_stats()["size_bytes_estimate"] == recount()
+
+            cache.set("key5", "short", ttl_seconds=1)
+            monotonic.return_value = 1002.0
+            assert cache.get("key5") is None  # expired on read
+            cache.set("key6", "gone", ttl_seconds=1)
+            monotonic.return_value = 1004.0
+            assert cache.cleanup_expired() == 1
+            assert cache.get_stats()["size_bytes_estimate"] == recount() > 0
+
+        cache.clear()
+        assert cache.get_stats()["size_bytes_estimate"] == 0
+
+    def test_cache_expiry_uses_monotonic_clock(self):
+        """Test that expiry follows time.monotonic(), not the wall clock."""
+        cache = TTLCacheBackend()
+
+        with patch("src.utils.cache.time.monotonic", return_value=1000.0) as monotonic:
+            cache.set("key1", "value1", ttl_seconds=10)
+
+            monotonic.return_value = 1010.0
+            assert cache.get("key1") == "value1"
+
+            monotonic.return_value = 1010.5
+            assert cache.get("key1") is None
+
+    def test_cache_keeps_lru_order(self):
+        """Test that set() and get() hits move keys to the most recent end."""
+        cache = TTLCacheBackend()
+
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.set("key3", "value3")
+        cache.get("key1")
+        cache.set("key2", "updated")
+
+        assert list(cache._cache) == ["key3", "key1", "key2"]
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that a full cache evicts the least recently used entry."""
+        cache = TTLCacheBackend(max_entries=2)
+
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.get("key1")
+        cache.set("key3", "value3")
+
+        assert cache.get("key2") is None
+        assert cache.get("key1") == "value1"
+        assert cache.get("key3") == "value3"
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["max_entries"] == 2
+        assert stats["evictions"] == 1
+
+    def test_cache_unbounded(self):
+        """Test that max_entries=None disables eviction."""
+        cache = TTLCacheBackend(max_entries=None)
+
+        for i in range(DEFAULT_MAX_ENTRIES + 1):
+            cache.set(f"key{i}", i)
+
+        assert cache.get_stats()["evictions"] == 0
+        assert cache.get("key0") == 0
+
+    def test_cache_invalid_max_entries(self):
+        """Test that max_entries must be positive."""
+        with pytest.raises(ValueError, match="max_entries"):
+            TTLCacheBackend(max_entries=0)
+
+    def test_cache_get_many_and_set_many(self):
+        """Test the batch interface inherited from CacheBackend."""
+        cache = TTLCacheBackend()
+
+        cache.set_many({"key1": "value1", "key2": "value2"}, ttl_seconds=60)
+
+        assert cache.get_many(["key1", "key2", "key3"]) == {"key1": "value1", "key2": "value2"}
+        assert cache.get_stats()["misses"] == 1
+
     def test_cache_is_healthy(self):
         """Test in-memory cache is always healthy."""
         cache = TTLCacheBackend()
@@ -159,12 +299,12 @@ class TestTTLCacheBackend:
 class TestRedisCacheBackend:
     """Tests for RedisCacheBackend."""
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_init_success(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_init_success(self, mock_redis):
         """Test successful Redis initialization."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
 
         cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
 
@@ -172,30 +312,31 @@ class TestRedisCacheBackend:
         assert cache._client is not None
         mock_client.ping.assert_called_once()
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_init_connection_error(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_init_connection_error(self, mock_redis):
         """Test Redis initialization with connection error."""
-        mock_from_url.side_effect = ConnectionError("Connection refused")
+        mock_redis.side_effect = ConnectionError("Connection refused")
 
         cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
 
         assert cache._connected is False
         assert cache._client is None
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_set_and_get(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_set_and_get(self, mock_redis):
         """Test Redis set and get operations."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
 
-        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
+        # Bypass the process-local cache: Redis contents change under it below
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0", local_ttl_seconds=0)
 
-        # Mock the setex/get to return None initially (miss)
+        # Mock the get to return None initially (miss)
         mock_client.get.return_value = None
 
         cache.set("key1", "value1")
-        mock_client.setex.assert_called_once()
+        mock_client.pipeline.return_value.setex.assert_called_once()
 
         # Test get miss
         result = cache.get("key1")
@@ -206,12 +347,152 @@ class TestRedisCacheBackend:
         result = cache.get("key1")
         assert result == "value1"
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_set_custom_ttl(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_values_are_raw_json_bytes(self, mock_redis):
+        """Test that values are written as JSON bytes and read without decoding."""
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_redis.return_value = mock_client
+
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
+        cache.set("key1", {"etag": "abc", "count": 2})
+
+        serialized = mock_client.pipeline.return_value.setex.call_args.args[2]
+        assert isinstance(serialized, bytes)
+        assert not cache._pool.connection_kwargs.get("decode_responses")
+
+        mock_client.get.return_value = serialized
+        assert cache.get("key1") == {"etag": "abc", "count": 2}
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_msgpack_serializer(self, mock_redis):
+        """Test that serializer='msgpack' stores MessagePack bytes."""
+        msgpack = pytest.importorskip("msgpack")
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_redis.return_value = mock_client
+
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0", serializer="msgpack")
+        cache.set("key1", {"etag": "abc", "count": 2})
+
+        serialized = mock_client.pipeline.return_value.setex.call_args.args[2]
+        assert msgpack.unpackb(serialized) == {"etag": "abc", "count": 2}
+
+        mock_client.get.return_value = serialized
+        assert cache.get("key1") == {"etag": "abc", "count": 2}
+        mock_client.pipeline.return_value.execute.return_value = [0, 0, {}]
+        assert cache.get_stats()["serializer"] == "msgpack"
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_invalid_serializer(self, mock_redis):
+        """Test that unknown or uninstalled serializers are rejected."""
+        with pytest.raises(ValueError, match="serializer"):
+            RedisCacheBackend(serializer="pickle")
+
+        with patch("src.utils.cache.MSGPACK_AVAILABLE", False):
+            with pytest.raises(ValueError, match="msgpack"):
+                RedisCacheBackend(serializer="msgpack")
+
+        mock_redis.assert_not_called()
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_uses_bounded_blocking_pool(self, mock_redis):
+        """Test that the client runs on a capped BlockingConnectionPool with keepalive."""
+        mock_redis.return_value.ping.return_value = True
+
+        cache = RedisCacheBackend(max_connections=7, pool_timeout=2.5)
+
+        pool = mock_redis.call_args.kwargs["connection_pool"]
+        assert isinstance(pool, BlockingConnectionPool)
+        assert pool.max_connections == 7
+        assert pool.timeout == 2.5
+        assert pool.connection_kwargs["socket_keepalive"] is True
+        assert pool.connection_kwargs["socket_keepalive_options"] == REDIS_KEEPALIVE_OPTIONS
+
+        with patch.object(pool, "disconnect") as disconnect:
+            cache.close()
+
+        mock_redis.return_value.close.assert_called_once()
+        disconnect.assert_called_once()
+        assert cache.is_healthy() is False
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_local_cache_serves_repeated_gets(self, mock_redis):
+        """Test that recent hits and misses are served without a round trip."""
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_redis.return_value = mock_client
+        mock_client.get.side_effect = lambda key: b'"value1"' if key.endswith("key1") else None
+
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
+
+        assert cache.get("key1") == "value1"
+        assert cache.get("key1") == "value1"
+        assert cache.get("missing") is None
+        assert cache.get("missing") is None
+
+        assert mock_client.get.call_count == 2
+        mock_client.pipeline.return_value.execute.return_value = [0, 0, {}]
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (2, 2)
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_local_cache_invalidated_by_writes(self, mock_redis):
+        """Test that set/delete/set_many/clear drop the local copy."""
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_client.scan_iter.return_value = []
+        mock_redis.return_value = mock_client
+        mock_client.pipeline.return_value.execute.return_value = [1, 1]
+        mock_client.get.return_value = None
+
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
+
+        for write in (
+            lambda: cache.set("key1", "value1"),
+            lambda: cache.delete("key1"),
+            lambda: cache.set_many({"key1": "value1"}),
+            cache.clear,
+        ):
+            cache.get("key1")
+            mock_client.get.reset_mock()
+            cache.get("key1")
+            assert mock_client.get.call_count == 0
+
+            write()
+            cache.get("key1")
+            assert mock_client.get.call_count == 1
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_local_cache_expires(self, mock_redis):
+        """Test that local copies expire so other instances' writes show up."""
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_redis.return_value = mock_client
+        mock_client.get.return_value = None
+
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
+
+        with patch("src.utils.cache.time.monotonic", return_value=1000.0) as monotonic:
+            assert cache.get("key1") is None
+            mock_client.get.return_value = b'"value1"'
+            assert cache.get("key1") is None
+
+            monotonic.return_value = 1000.0 + REDIS_LOCAL_MISS_TTL_SECONDS + 0.5
+            assert cache.get("key1") == "value1"
+
+            mock_client.get.return_value = b'"value2"'
+            assert cache.get("key1") == "value1"
+
+            monotonic.return_value += REDIS_LOCAL_TTL_SECONDS + 0.5
+            assert cache.get("key1") == "value2"
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_set_custom_ttl(self, mock_redis):
         """Test Redis set with custom TTL."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
 
         cache = RedisCacheBackend(
             redis_url="redis://localhost:6379/0",
@@ -221,49 +502,142 @@ class TestRedisCacheBackend:
         cache.set("key1", "value1", ttl_seconds=7200)
 
         # Check that setex was called with custom TTL
-        mock_client.setex.assert_called_once()
-        call_args = mock_client.setex.call_args
+        pipe = mock_client.pipeline.return_value
+        pipe.setex.assert_called_once()
+        call_args = pipe.setex.call_args
         # call_args[0] contains positional args: (key, ttl, value)
         assert call_args[0][1] == 7200  # TTL is the second argument
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_delete(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_get_many_uses_one_pipeline(self, mock_redis):
+        """Test that get_many batches all lookups in one pipeline."""
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_redis.return_value = mock_client
+        pipe = mock_client.pipeline.return_value
+        pipe.execute.return_value = ['"value1"', None, "not json"]
+
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0", key_prefix="test:")
+        result = cache.get_many(["key1", "key2", "key3"])
+
+        assert result == {"key1": "value1"}
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert [c.args for c in pipe.get.call_args_list] == [
+            ("test:key1",),
+            ("test:key2",),
+            ("test:key3",),
+        ]
+        pipe.execute.assert_called_once()
+        mock_client.get.assert_not_called()
+
+        pipe.execute.return_value = [0, 0, {}]
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_set_many_uses_one_pipeline(self, mock_redis):
+        """Test that set_many batches all writes in one pipeline."""
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_redis.return_value = mock_client
+        pipe = mock_client.pipeline.return_value
+
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0", key_prefix="test:")
+        cache.set_many({"key1": "value1", "key2": [1, 2]}, ttl_seconds=60)
+
+        assert [c.args[:2] for c in pipe.setex.call_args_list] == [
+            ("test:key1", 60),
+            ("test:key2", 60),
+        ]
+        assert [json.loads(c.args[2]) for c in pipe.setex.call_args_list] == ["value1", [1, 2]]
+        pipe.execute.assert_called_once()
+        mock_client.setex.assert_not_called()
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_get_many_connection_error(self, mock_redis):
+        """Test that a pipeline failure returns no hits and disconnects."""
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_redis.return_value = mock_client
+        mock_client.pipeline.return_value.execute.side_effect = ConnectionError("Lost")
+
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
+
+        assert cache.get_many(["key1", "key2"]) == {}
+        assert cache._connected is False
+        assert cache.get_stats()["misses"] == 2
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_delete(self, mock_redis):
         """Test Redis delete operation."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_client.delete.return_value = 1
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
+        pipe = mock_client.pipeline.return_value
+        pipe.execute.return_value = [1, 1]
 
         cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
 
         result = cache.delete("key1")
         assert result is True
-        mock_client.delete.assert_called_once()
+        pipe.delete.assert_called_once_with("lolstonks:key1")
+        pipe.zrem.assert_called_once_with("lolstonks:__index__", "lolstonks:key1")
+
+        pipe.execute.return_value = [0, 0]
+        assert cache.delete("key1") is False
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_clear(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_clear(self, mock_redis):
         """Test Redis clear operation."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_client.keys.return_value = ["lolstonks:key1", "lolstonks:key2"]
-        mock_from_url.return_value = mock_client
+        mock_client.scan_iter.return_value = ["lolstonks:key1", "lolstonks:key2"]
+        mock_redis.return_value = mock_client
 
         cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
 
         cache.clear()
 
-        mock_client.keys.assert_called_once_with("lolstonks:*")
-        mock_client.delete.assert_called_once_with("lolstonks:key1", "lolstonks:key2")
+        mock_client.scan_iter.assert_called_once_with(match="lolstonks:*", count=REDIS_SCAN_COUNT)
+        mock_client.unlink.assert_called_once_with("lolstonks:key1", "lolstonks:key2")
+        mock_client.keys.assert_not_called()
+        mock_client.delete.assert_not_called()
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_stats(self, mock_from_url):
-        """Test Redis statistics."""
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_clear_unlinks_in_batches(self, mock_redis):
+        """Test that clear() sends one UNLINK per batch as soon as it fills."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_client.keys.return_value = ["lolstonks:key1", "lolstonks:key2"]
-        mock_from_url.return_value = mock_client
+        keys = [f"lolstonks:key{i}" for i in range(REDIS_UNLINK_BATCH + 1)]
+
+        def scan_iter(**_kwargs):
+            yield from keys[:REDIS_UNLINK_BATCH]
+            # The full first batch is sent before scanning goes on
+            assert mock_client.unlink.call_count == 1
+            yield from keys[REDIS_UNLINK_BATCH:]
+
+        mock_client.scan_iter.side_effect = scan_iter
+        mock_redis.return_value = mock_client
 
         cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
+        cache.clear()
+
+        assert [c.args for c in mock_client.unlink.call_args_list] == [
+            tuple(keys[:REDIS_UNLINK_BATCH]),
+            tuple(keys[REDIS_UNLINK_BATCH:]),
+        ]
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_stats(self, mock_redis):
+        """Test Redis statistics."""
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_redis.return_value = mock_client
+        pipe = mock_client.pipeline.return_value
+
+        # Bypass the process-local cache: Redis contents change under it below
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0", local_ttl_seconds=0)
 
         # Simulate some hits and misses
         mock_client.get.return_value = None  # miss first
@@ -271,7 +645,9 @@ class TestRedisCacheBackend:
         mock_client.get.return_value = '"value"'  # then hit
         cache.get("key1")
 
-        stats = cache.get_stats()
+        pipe.execute.return_value = [1, 2, {"used_memory": 1048576, "used_memory_peak": 2097152}]
+        with patch("src.utils.cache.time.time", return_value=1000.0):
+            stats = cache.get_stats()
 
         assert stats["total_entries"] == 2
         assert stats["hits"] == 1
@@ -279,13 +655,60 @@ class TestRedisCacheBackend:
         assert stats["hit_rate"] == 0.5
         assert stats["redis_connected"] is True
         assert stats["redis_url"] == "redis://localhost:6379/0"
+        assert stats["size_bytes_estimate"] == 1048576
+        pipe.zremrangebyscore.assert_called_once_with("lolstonks:__index__", "-inf", 1000.0)
+        pipe.zcard.assert_called_once_with("lolstonks:__index__")
+        pipe.info.assert_called_once_with("memory")
+        mock_client.scan_iter.assert_not_called()
+        mock_client.keys.assert_not_called()
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_writes_index_keys_by_expiry(self, mock_redis):
+        """Test that set/set_many record keys in the expiry index in the same pipeline."""
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_redis.return_value = mock_client
+        pipe = mock_client.pipeline.return_value
+
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0", default_ttl_seconds=60)
+        index_key = f"lolstonks:{REDIS_INDEX_KEY}"
+
+        with patch("src.utils.cache.time.time", return_value=1000.0):
+            cache.set("key1", "value1", ttl_seconds=10)
+            cache.set_many({"key2": 1, "key3": 2})
+
+        assert [c.args for c in pipe.zadd.call_args_list] == [
+            (index_key, {"lolstonks:key1": 1010.0}),
+            (index_key, {"lolstonks:key2": 1060.0, "lolstonks:key3": 1060.0}),
+        ]
+        assert pipe.zremrangebyscore.call_args_list == [
+            call(index_key, "-inf", 1000.0),
+            call(index_key, "-inf", 1000.0),
+        ]
+        assert pipe.execute.call_count == 2
+        mock_client.zadd.assert_not_called()
+
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_stats_connection_error(self, mock_redis):
+        """Test that a failed stats pipeline reports no entries and disconnects."""
+        mock_client = MagicMock()
+        mock_client.ping.return_value = True
+        mock_redis.return_value = mock_client
+        mock_client.pipeline.return_value.execute.side_effect = ConnectionError("Lost")
+
+        cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
+        stats = cache.get_stats()
+
+        assert stats["total_entries"] == 0
+        assert stats["size_bytes_estimate"] == 0
+        assert stats["redis_connected"] is False
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_is_healthy(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_is_healthy(self, mock_redis):
         """Test Redis health check."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
 
         cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
         assert cache.is_healthy() is True
@@ -295,13 +718,13 @@ class TestRedisCacheBackend:
         assert cache.is_healthy() is False
         assert cache._connected is False
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_connection_error_during_get(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_connection_error_during_get(self, mock_redis):
         """Test Redis handles connection errors during get."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
         mock_client.get.side_effect = ConnectionError("Connection lost")
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
 
         cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
 
@@ -309,13 +732,13 @@ class TestRedisCacheBackend:
         assert result is None
         assert cache._connected is False
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_connection_error_during_set(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_connection_error_during_set(self, mock_redis):
         """Test Redis handles connection errors during set."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_client.setex.side_effect = TimeoutError("Timeout")
-        mock_from_url.return_value = mock_client
+        mock_client.pipeline.return_value.execute.side_effect = TimeoutError("Timeout")
+        mock_redis.return_value = mock_client
 
         cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
 
@@ -323,10 +746,10 @@ class TestRedisCacheBackend:
         cache.set("key1", "value1")
         assert cache._connected is False
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_not_connected_skips_operations(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_not_connected_skips_operations(self, mock_redis):
         """Test Redis skips operations when not connected."""
-        mock_from_url.side_effect = ConnectionError("Connection refused")
+        mock_redis.side_effect = ConnectionError("Connection refused")
 
         cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
 
@@ -339,26 +762,27 @@ class TestRedisCacheBackend:
         assert result is None
         assert deleted is False
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_cleanup_expired_noop(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_cleanup_expired_noop(self, mock_redis):
         """Test Redis cleanup_expired returns 0 (no-op)."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
 
         cache = RedisCacheBackend(redis_url="redis://localhost:6379/0")
 
         removed = cache.cleanup_expired()
         assert removed == 0
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_key_prefix(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_key_prefix(self, mock_redis):
         """Test Redis keys are prefixed correctly."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
         mock_client.get.return_value = None
-        mock_client.delete.return_value = 1
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
+        pipe = mock_client.pipeline.return_value
+        pipe.execute.return_value = [1, 1]
 
         cache = RedisCacheBackend(
             redis_url="redis://localhost:6379/0",
@@ -370,16 +794,198 @@ class TestRedisCacheBackend:
         cache.delete("mykey")
 
         # Check that prefix was added
-        setex_call = mock_client.setex.call_args
+        setex_call = pipe.setex.call_args
         assert setex_call[0][0] == "test:mykey"
+        assert "test:mykey" in pipe.zadd.call_args[0][1]
 
         get_call = mock_client.get.call_args
         assert get_call[0][0] == "test:mykey"
 
-        delete_call = mock_client.delete.call_args
+        delete_call = pipe.delete.call_args
         assert delete_call[0][0] == "test:mykey"
 
 
+def make_async_redis(*results: object) -> tuple[MagicMock, MagicMock]:
+    """Create a mock redis.asyncio client whose pipelines return results in turn."""
+    client = MagicMock()
+    client.ping = AsyncMock(return_value=True)
+    client.get = AsyncMock(return_value=None)
+    client.aclose = AsyncMock()
+    pipe = MagicMock()
+    pipe.__aenter__.return_value = pipe
+    pipe.execute = AsyncMock(side_effect=list(results))
+    client.pipeline.return_value = pipe
+    return client, pipe
+
+
+class TestAsyncTTLCacheBackend:
+    """Tests for the in-memory AsyncTTLCacheBackend."""
+
+    async def test_async_cache_operations(self):
+        """Test that the async facade delegates to a TTLCacheBackend."""
+        cache = AsyncTTLCacheBackend(default_ttl_seconds=60)
+
+        await cache.set("key1", "value1")
+        await cache.set_many({"key2": 2, "key3": 3})
+
+        assert await cache.get("key1") == "value1"
+        assert await cache.get_many(["key2", "key3", "missing"]) == {"key2": 2, "key3": 3}
+        assert await cache.delete("key1") is True
+        assert await cache.get("key1") is None
+        assert await cache.is_healthy() is True
+
+        stats = await cache.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["ttl_seconds"] == 60
+
+        await cache.clear()
+        assert (await cache.get_stats())["total_entries"] == 0
+
+
+@patch("src.utils.cache.aioredis.Redis")
+class TestRedisAsyncCacheBackend:
+    """Tests for RedisAsyncCacheBackend with a mocked redis.asyncio client."""
+
+    async def test_no_io_until_connect(self, mock_redis):
+        """Test that operations are skipped until connect() succeeds."""
+        cache = RedisAsyncCacheBackend()
+
+        assert await cache.get("key1") is None
+        await cache.set("key1", "value1")
+        assert await cache.is_healthy() is False
+        mock_redis.assert_not_called()
+
+    async def test_connect_uses_bounded_blocking_pool(self, mock_redis):
+        """Test that connect() builds a blocking pool and pings Redis."""
+        client, _ = make_async_redis()
+        mock_redis.return_value = client
+
+        cache = RedisAsyncCacheBackend(max_connections=7, pool_timeout=2.5)
+
+        assert await cache.connect() is True
+        client.ping.assert_awaited_once()
+        assert cache._pool.max_connections == 7
+        assert cache._pool.timeout == 2.5
+        assert mock_redis.call_args.kwargs["connection_pool"] is cache._pool
+
+    async def test_connect_failure(self, mock_redis):
+        """Test that a failed PING leaves the backend disconnected."""
+        client, _ = make_async_redis()
+        client.ping.side_effect = ConnectionError("Connection refused")
+        mock_redis.return_value = client
+
+        cache = RedisAsyncCacheBackend()
+
+        assert await cache.connect() is False
+        assert await cache.get("key1") is None
+        assert (await cache.get_stats())["redis_connected"] is False
+
+    async def test_set_and_get(self, mock_redis):
+        """Test that set pipelines SETEX with the index update and get decodes."""
+        client, pipe = make_async_redis([True, 1, 0])
+        mock_redis.return_value = client
+        cache = RedisAsyncCacheBackend(default_ttl_seconds=60)
+        await cache.connect()
+
+        with patch("src.utils.cache.time.time", return_value=1000.0):
+            await cache.set("key1", {"etag": "abc"})
+
+        key, ttl, serialized = pipe.setex.call_args.args
+        assert (key, ttl) == ("lolstonks:key1", 60)
+        pipe.zadd.assert_called_once_with(
+            f"lolstonks:{REDIS_INDEX_KEY}", {"lolstonks:key1": 1060.0}
+        )
+        client.pipeline.assert_called_with(transaction=False)
+
+        client.get.return_value = serialized
+        assert await cache.get("key1") == {"etag": "abc"}
+        client.get.assert_awaited_with("lolstonks:key1")
+
+    async def test_get_many_uses_one_pipeline(self, mock_redis):
+        """Test that get_many batches all lookups in one pipeline."""
+        client, pipe = make_async_redis(['"value1"', None, "not json"])
+        mock_redis.return_value = client
+        cache = RedisAsyncCacheBackend(key_prefix="test:")
+        await cache.connect()
+
+        assert await cache.get_many(["key1", "key2", "key3"]) == {"key1": "value1"}
+        assert [c.args for c in pipe.get.call_args_list] == [
+            ("test:key1",),
+            ("test:key2",),
+            ("test:key3",),
+        ]
+        pipe.execute.assert_awaited_once()
+        client.get.assert_not_called()
+
+    async def test_delete_and_stats(self, mock_redis):
+        """Test delete and the pipelined index-based stats."""
+        client, pipe = make_async_redis([1, 1], [0, 3, {"used_memory": 4096}])
+        mock_redis.return_value = client
+        cache = RedisAsyncCacheBackend()
+        await cache.connect()
+
+        assert await cache.delete("key1") is True
+        pipe.zrem.assert_called_once_with(f"lolstonks:{REDIS_INDEX_KEY}", "lolstonks:key1")
+
+        stats = await cache.get_stats()
+        assert stats["total_entries"] == 3
+        assert stats["size_bytes_estimate"] == 4096
+        assert stats["redis_connected"] is True
+
+    async def test_clear_unlinks_scanned_keys(self, mock_redis):
+        """Test that clear() walks the prefix with SCAN and unlinks each full batch."""
+        client, _ = make_async_redis()
+        client.unlink = AsyncMock()
+        keys = [f"lolstonks:key{i}".encode() for i in range(REDIS_UNLINK_BATCH + 1)]
+
+        async def scan_iter(**_kwargs):
+            for key in keys[:REDIS_UNLINK_BATCH]:
+                yield key
+            # The full first batch is sent before scanning goes on
+            assert client.unlink.await_count == 1
+            yield keys[-1]
+
+        client.scan_iter = MagicMock(side_effect=scan_iter)
+        mock_redis.return_value = client
+        cache = RedisAsyncCacheBackend()
+        await cache.connect()
+
+        await cache.clear()
+
+        client.scan_iter.assert_called_once_with(match="lolstonks:*", count=REDIS_SCAN_COUNT)
+        assert [c.args for c in client.unlink.await_args_list] == [
+            tuple(keys[:REDIS_UNLINK_BATCH]),
+            (keys[-1],),
+        ]
+
+    async def test_pipeline_error_disconnects(self, mock_redis):
+        """Test that a Redis error marks the backend disconnected."""
+        client, _ = make_async_redis(TimeoutError("Timeout"))
+        mock_redis.return_value = client
+        cache = RedisAsyncCacheBackend()
+        await cache.connect()
+
+        await cache.set_many({"key1": 1})
+
+        assert cache._connected is False
+        assert await cache.get_many(["key1"]) == {}
+
+    async def test_close_releases_client_and_pool(self, mock_redis):
+        """Test that close() closes the client and disconnects the pool."""
+        client, _ = make_async_redis()
+        mock_redis.return_value = client
+        cache = RedisAsyncCacheBackend()
+        await cache.connect()
+        pool = cache._pool
+
+        with patch.object(pool, "disconnect", AsyncMock()) as disconnect:
+            await cache.close()
+
+        client.aclose.assert_awaited_once()
+        disconnect.assert_awaited_once()
+        assert await cache.is_healthy() is False
+
+
 class TestCreateCacheBackend:
     """Tests for cache backend factory function."""
 
@@ -389,6 +995,9 @@ class TestCreateCacheBackend:
         mock_settings.return_value = MagicMock(
             cache_backend="auto",
             redis_url="redis://localhost:6379/0",
+            redis_serializer="json",
+            redis_max_connections=20,
+            redis_pool_timeout=5.0,
         )
 
         backend = create_cache_backend(backend_type="memory")
@@ -396,109 +1005,131 @@ class TestCreateCacheBackend:
         assert isinstance(backend, TTLCacheBackend)
         assert not isinstance(backend, RedisCacheBackend)
 
-    @patch("src.utils.cache.redis_lib.from_url")
+    @patch("src.utils.cache.redis_lib.Redis")
     @patch("src.utils.cache.get_settings")
-    def test_create_redis_backend_connected(self, mock_settings, mock_from_url):
+    def test_create_redis_backend_connected(self, mock_settings, mock_redis):
         """Test creating Redis backend when connected."""
         mock_settings.return_value = MagicMock(
             cache_backend="auto",
             redis_url="redis://localhost:6379/0",
+            redis_serializer="json",
+            redis_max_connections=20,
+            redis_pool_timeout=5.0,
         )
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
 
         backend = create_cache_backend(backend_type="redis")
 
         assert isinstance(backend, RedisCacheBackend)
 
-    @patch("src.utils.cache.redis_lib.from_url")
+    @patch("src.utils.cache.redis_lib.Redis")
     @patch("src.utils.cache.get_settings")
-    def test_create_auto_backend_with_redis_available(self, mock_settings, mock_from_url):
+    def test_create_auto_backend_with_redis_available(self, mock_settings, mock_redis):
         """Test auto mode uses Redis when available."""
         mock_settings.return_value = MagicMock(
             cache_backend="auto",
             redis_url="redis://localhost:6379/0",
+            redis_serializer="json",
+            redis_max_connections=20,
+            redis_pool_timeout=5.0,
         )
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
 
         backend = create_cache_backend(backend_type="auto")
 
         assert isinstance(backend, RedisCacheBackend)
 
-    @patch("src.utils.cache.redis_lib.from_url")
+    @patch("src.utils.cache.redis_lib.Redis")
     @patch("src.utils.cache.get_settings")
-    def test_create_auto_backend_falls_back_to_memory(self, mock_settings, mock_from_url):
+    def test_create_auto_backend_falls_back_to_memory(self, mock_settings, mock_redis):
         """Test auto mode falls back to memory when Redis unavailable."""
         mock_settings.return_value = MagicMock(
             cache_backend="auto",
             redis_url="redis://localhost:6379/0",
+            redis_serializer="json",
+            redis_max_connections=20,
+            redis_pool_timeout=5.0,
         )
-        mock_from_url.side_effect = ConnectionError("Connection refused")
+        mock_redis.side_effect = ConnectionError("Connection refused")
 
         backend = create_cache_backend(backend_type="auto")
 
         assert isinstance(backend, TTLCacheBackend)
 
-    @patch("src.utils.cache.redis_lib.from_url")
+    @patch("src.utils.cache.redis_lib.Redis")
     @patch("src.utils.cache.get_settings")
-    def test_create_redis_backend_unconnected(self, mock_settings, mock_from_url):
+    def test_create_redis_backend_unconnected(self, mock_settings, mock_redis):
         """Test explicit Redis mode returns backend even if disconnected."""
         mock_settings.return_value = MagicMock(
             cache_backend="auto",
             redis_url="redis://localhost:6379/0",
+            redis_serializer="json",
+            redis_max_connections=20,
+            redis_pool_timeout=5.0,
         )
-        mock_from_url.side_effect = ConnectionError("Connection refused")
+        mock_redis.side_effect = ConnectionError("Connection refused")
 
         backend = create_cache_backend(backend_type="redis")
 
         # Still returns Redis backend (it will handle errors gracefully)
         assert isinstance(backend, RedisCacheBackend)
 
-    @patch("src.utils.cache.redis_lib.from_url")
+    @patch("src.utils.cache.redis_lib.Redis")
     @patch("src.utils.cache.get_settings")
-    def test_uses_settings_when_params_not_provided(self, mock_settings, mock_from_url):
+    def test_uses_settings_when_params_not_provided(self, mock_settings, mock_redis):
         """Test factory uses settings when parameters not provided."""
         mock_settings.return_value = MagicMock(
             cache_backend="memory",
             redis_url="redis://custom:6380/1",
+            redis_serializer="json",
+            redis_max_connections=20,
+            redis_pool_timeout=5.0,
         )
 
         backend = create_cache_backend()
 
         assert isinstance(backend, TTLCacheBackend)
 
-    @patch("src.utils.cache.redis_lib.from_url")
+    @patch("src.utils.cache.redis_lib.Redis")
     @patch("src.utils.cache.get_settings")
-    def test_custom_redis_url(self, mock_settings, mock_from_url):
+    def test_custom_redis_url(self, mock_settings, mock_redis):
         """Test factory with custom Redis URL."""
         mock_settings.return_value = MagicMock(
             cache_backend="auto",
             redis_url="redis://localhost:6379/0",
+            redis_serializer="json",
+            redis_max_connections=20,
+            redis_pool_timeout=5.0,
         )
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
 
-        create_cache_backend(
+        backend = create_cache_backend(
             backend_type="redis",
             redis_url="redis://custom:6380/1",
         )
 
         # Check that the custom URL was used
-        mock_from_url.assert_called_once()
-        call_args = mock_from_url.call_args
-        assert "redis://custom:6380/1" in str(call_args)
+        mock_redis.assert_called_once()
+        connection_kwargs = backend._pool.connection_kwargs
+        assert (connection_kwargs["host"], connection_kwargs["port"]) == ("custom", 6380)
+        assert connection_kwargs["db"] == 1
 
-    @patch("src.utils.cache.redis_lib.from_url")
+    @patch("src.utils.cache.redis_lib.Redis")
     @patch("src.utils.cache.get_settings")
-    def test_custom_ttl(self, mock_settings, mock_from_url):
+    def test_custom_ttl(self, mock_settings, mock_redis):
         """Test factory with custom TTL."""
         mock_settings.return_value = MagicMock(
             cache_backend="memory",
             redis_url="redis://localhost:6379/0",
+            redis_serializer="json",
+            redis_max_connections=20,
+            redis_pool_timeout=5.0,
         )
 
         backend = create_cache_backend(default_ttl_seconds=7200)
@@ -535,12 +1166,12 @@ class TestCacheBackendInterface:
         assert callable(cache.get_stats)
         assert callable(cache.is_healthy)
 
-    @patch("src.utils.cache.redis_lib.from_url")
-    def test_redis_cache_backend_implements_interface(self, mock_from_url):
+    @patch("src.utils.cache.redis_lib.Redis")
+    def test_redis_cache_backend_implements_interface(self, mock_redis):
         """Test that RedisCacheBackend implements all required methods."""
         mock_client = MagicMock()
         mock_client.ping.return_value = True
-        mock_from_url.return_value = mock_client
+        mock_redis.return_value = mock_client
 
         cache = RedisCacheBackend()
 
@@ -560,3 +1191,60 @@ class TestCacheBackendInterface:
         assert callable(cache.cleanup_expired)
         assert callable(cache.get_stats)
         assert callable(cache.is_healthy)
+
+
+class TestCreateAsyncCacheBackend:
+    """Tests for the async cache backend factory."""
+
+    @pytest.fixture(autouse=True)
+    def settings(self):
+        with patch("src.utils.cache.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(
+                cache_backend="auto",
+                redis_url="redis://localhost:6379/0",
+                redis_serializer="json",
+                redis_max_connections=20,
+                redis_pool_timeout=5.0,
+            )
+            yield mock_settings
+
+    async def test_memory_backend(self):
+        backend = await create_async_cache_backend(backend_type="memory")
+
+        assert isinstance(backend, AsyncTTLCacheBackend)
+
+    @patch("src.utils.cache.aioredis.Redis")
+    async def test_redis_backend_connected(self, mock_redis):
+        client, _ = make_async_redis()
+        mock_redis.return_value = client
+
+        backend = await create_async_cache_backend()
+
+        assert isinstance(backend, RedisAsyncCacheBackend)
+        assert backend._pool.max_connections == 20
+
+    @patch("src.utils.cache.aioredis.Redis")
+    async def test_auto_falls_back_to_memory(self, mock_redis):
+        client, _ = make_async_redis()
+        client.ping.side_effect = ConnectionError("Connection refused")
+        mock_redis.return_value = client
+
+        backend = await create_async_cache_backend()
+
+        assert isinstance(backend, AsyncTTLCacheBackend)
+        client.aclose.assert_awaited_once()
+
+    @patch("src.utils.cache.aioredis.Redis")
+    async def test_explicit_redis_kept_when_disconnected(self, mock_redis):
+        client, _ = make_async_redis()
+        client.ping.side_effect = ConnectionError("Connection refused")
+        mock_redis.return_value = client
+
+        backend = await create_async_cache_backend(backend_type="redis")
+
+        assert isinstance(backend, RedisAsyncCacheBackend)
+        assert await backend.is_healthy() is False
+
+    def test_async_cache_backend_is_abstract(self):
+        with pytest.raises(TypeError):
+            AsyncCacheBackend()
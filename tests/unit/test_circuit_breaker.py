@@ -6,12 +6,13 @@ retry logic, error classification, and metrics reporting.
 """
 
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
 from src.utils.circuit_breaker import (
+    NS_PER_SECOND,
     CircuitBreaker,
     CircuitBreakerConfig,
     CircuitBreakerOpenError,
@@ -247,6 +248,25 @@ class TestErrorClassification:
             await cb.call(failing_func)
         assert cb.is_open()
 
+    def test_error_classification(self):
+        cb = CircuitBreaker("test-source")
+
+        assert cb._is_retriable_error(ConnectionResetError("reset"))
+        assert cb._is_retriable_error(OSError("unreachable"))
+        assert cb._is_retriable_error(httpx.ConnectTimeout("timeout"))
+        assert not cb._is_retriable_error(ValueError("bad"))
+        assert not cb._is_retriable_error(CircuitBreakerOpenError("x", "open"))
+
+
+class TestSlots:
+    """Test breakers and their state carry no per-instance __dict__."""
+
+    def test_no_instance_dict(self):
+        cb = CircuitBreaker("test-source")
+
+        for obj in (cb, cb.config, cb.stats):
+            assert not hasattr(obj, "__dict__")
+
 
 class TestCircuitBreakerOpenError:
     """Test CircuitBreakerOpenError is raised when circuit is open."""
@@ -275,9 +295,69 @@ class TestCircuitBreakerOpenError:
         assert "OPEN" in str(exc_info.value)
 
 
+class TestRetryDelay:
+    """Test retry backoff delays."""
+
+    def test_delays_double_within_jitter_and_cap(self):
+        config = CircuitBreakerConfig(
+            retry_attempts=5, retry_base_delay=1.0, retry_max_delay=6.0, retry_jitter=0.1
+        )
+        cb = CircuitBreaker("test-source", config)
+
+        with patch("src.utils.circuit_breaker.random.random", return_value=0.0):
+            low = [cb._calculate_retry_delay(attempt) for attempt in range(5)]
+        with patch("src.utils.circuit_breaker.random.random", return_value=1.0):
+            high = [cb._calculate_retry_delay(attempt) for attempt in range(5)]
+
+        assert low == pytest.approx([0.9, 1.8, 3.6, 6.0, 6.0])
+        assert high == pytest.approx([1.1, 2.2, 4.4, 6.0, 6.0])
+
+    def test_delay_has_floor(self):
+        cb = CircuitBreaker("test-source", CircuitBreakerConfig(retry_base_delay=0.01))
+
+        assert cb._calculate_retry_delay(0) == 0.1
+
+
 class TestMetrics:
     """Test metrics reporting."""
 
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_count_exactly(self):
+        cb = CircuitBreaker("test-source", CircuitBreakerConfig(retry_attempts=1))
+
+        async def success_func():
+            await asyncio.sleep(0)
+            return "ok"
+
+        results = await asyncio.gather(*(cb.call(success_func) for _ in range(500)))
+
+        assert results == ["ok"] * 500
+        assert cb.stats.total_calls == 500
+        assert cb.stats.success_count == 500
+        assert cb.is_closed()
+
+    @pytest.mark.asyncio
+    async def test_metrics_open_seconds_from_monotonic_clock(self):
+        config = CircuitBreakerConfig(failure_threshold=1, recovery_timeout=60, retry_attempts=1)
+        cb = CircuitBreaker("test-source", config)
+
+        async def failing_func():
+            raise httpx.TimeoutException("Timeout")
+
+        with patch("src.utils.circuit_breaker.time.monotonic_ns", return_value=5 * NS_PER_SECOND):
+            with pytest.raises(httpx.TimeoutException):
+                await cb.call(failing_func)
+
+        assert cb.stats.opened_at == 5 * NS_PER_SECOND
+        assert cb.stats.last_failure_time == 5 * NS_PER_SECOND
+
+        with patch(
+            "src.utils.circuit_breaker.time.monotonic_ns",
+            return_value=17 * NS_PER_SECOND + NS_PER_SECOND // 2,
+        ):
+            assert cb.get_metrics()["circuit_breaker_open_seconds"] == 12.5
+            assert not cb._should_attempt_reset()
+
     @pytest.mark.asyncio
     async def test_metrics_include_state(self):
         cb = CircuitBreaker("test-source")
@@ -286,6 +366,26 @@ class TestMetrics:
         assert "circuit_breaker_state" in metrics
         assert metrics["circuit_breaker_state"] == 1  # CLOSED = 1 (healthy)
 
+    @pytest.mark.asyncio
+    async def test_metrics_dict_is_fresh_on_every_call(self):
+        cb = CircuitBreaker("test-source", CircuitBreakerConfig(retry_attempts=1))
+
+        async def success_func():
+            return "ok"
+
+        first = cb.get_metrics()
+        first["circuit_breaker_calls_total"] = 99
+        second = cb.get_metrics()
+        assert second is not first
+        assert second["circuit_breaker_calls_total"] == 0
+        assert second["circuit_breaker_open_seconds"] == 0.0
+
+        await cb.call(success_func)
+        assert cb.get_metrics()["circuit_breaker_calls_total"] == 1
+
+        cb.reset()
+        assert cb.get_metrics()["circuit_breaker_calls_total"] == 0
+
     @pytest.mark.asyncio
     async def test_metrics_track_failures(self):
         config = CircuitBreakerConfig(failure_threshold=3, retry_attempts=1)
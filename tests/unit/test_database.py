@@ -475,3 +475,68 @@ async def test_get_by_canonical_url(temp_db):
     assert retrieved is not None
     assert retrieved.guid == "test-123"
     assert retrieved.canonical_url == "https://canonical.com/test"
+
+
+@pytest.mark.asyncio
+async def test_save_many_skips_duplicate_urls_in_one_batch(temp_db):
+    """Test that save_many skips url conflicts, including within the same batch."""
+    source = ArticleSource.create("lol", "en-us")
+    articles = [
+        Article(
+            title=f"Article {i}",
+            url="https://example.com/same",
+            pub_date=datetime(2025, 12, 28),
+            guid=f"test-{i}",
+            source=source,
+        )
+        for i in range(3)
+    ]
+
+    assert await temp_db.save_many(articles) == 1
+    assert await temp_db.save_many([]) == 0
+    assert (await temp_db.get_by_guid("test-0")) is not None
+    assert await temp_db.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_save_many_splits_large_batches(temp_db, monkeypatch):
+    """Test that save_many saves every article when split across statements."""
+    monkeypatch.setattr(ArticleRepository, "SAVE_BATCH_SIZE", 2)
+    source = ArticleSource.create("lol", "en-us")
+    articles = [
+        Article(
+            title=f"Article {i}",
+            url=f"https://example.com/batch-{i}",
+            pub_date=datetime(2025, 12, 28),
+            guid=f"batch-{i}",
+            source=source,
+        )
+        for i in range(5)
+    ]
+
+    assert await temp_db.save_many(articles) == 5
+    assert await temp_db.count() == 5
+
+
+@pytest.mark.asyncio
+async def test_filter_existing(temp_db):
+    """Test that filter_existing returns only stored GUIDs."""
+    source = ArticleSource.create("lol", "en-us")
+    await temp_db.save_many(
+        [
+            Article(
+                title=f"Article {i}",
+                url=f"https://example.com/existing-{i}",
+                pub_date=datetime(2025, 12, 28),
+                guid=f"existing-{i}",
+                source=source,
+            )
+            for i in range(3)
+        ]
+    )
+
+    assert await temp_db.filter_existing({"existing-0", "existing-2", "missing"}) == {
+        "existing-0",
+        "existing-2",
+    }
+    assert await temp_db.filter_existing([]) == set()
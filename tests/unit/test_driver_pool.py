@@ -0,0 +1,196 @@
+"""
+Unit tests for the Chrome WebDriver pool.
+
+Drivers are replaced with mocks through the pool's factory hook, so no
+browser is started.
+"""
+
+import asyncio
+import logging
+import subprocess
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from src.scrapers.driver_pool import (
+    BACKGROUND_SERVICE_FLAGS,
+    ChromeDriverPool,
+    build_chrome_options,
+)
+
+
+def make_factory() -> tuple[MagicMock, list[MagicMock]]:
+    """Create a factory that records every fake driver it builds."""
+    created: list[MagicMock] = []
+
+    def build() -> MagicMock:
+        driver = MagicMock(name=f"driver-{len(created)}")
+        driver.session_id = f"session-{len(created)}"
+        driver.service.process = None
+        created.append(driver)
+        return driver
+
+    return MagicMock(side_effect=build), created
+
+
+@pytest.fixture
+def fake_chromedriver() -> Iterator[subprocess.Popen[bytes]]:
+    """Start a stand-in chromedriver process with one child process."""
+    process = subprocess.Popen(["sh", "-c", "sleep 30 & wait"])
+    yield process
+    process.kill()
+    process.wait()
+
+
+class TestChromeDriverPool:
+    """Tests for ChromeDriverPool."""
+
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError):
+            ChromeDriverPool(size=0)
+        with pytest.raises(ValueError):
+            ChromeDriverPool(max_uses=0)
+
+    @pytest.mark.asyncio
+    async def test_released_driver_is_reused(self):
+        factory, created = make_factory()
+        pool = ChromeDriverPool(size=2, factory=factory)
+
+        first = await pool.acquire()
+        await pool.release(first)
+        second = await pool.acquire()
+
+        assert second is first
+        assert factory.call_count == 1
+        first.delete_all_cookies.assert_called_once()
+        first.quit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_driver_recycled_after_max_uses(self):
+        factory, created = make_factory()
+        pool = ChromeDriverPool(size=1, max_uses=2, factory=factory)
+
+        for _ in range(3):
+            await pool.release(await pool.acquire())
+
+        assert len(created) == 2
+        created[0].quit.assert_called_once()
+        created[1].quit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_broken_driver_is_recycled(self):
+        factory, created = make_factory()
+        pool = ChromeDriverPool(size=1, factory=factory)
+
+        driver = await pool.acquire()
+        await pool.release(driver, broken=True)
+        replacement = await pool.acquire()
+
+        driver.quit.assert_called_once()
+        assert replacement is not driver
+
+    @pytest.mark.asyncio
+    async def test_failed_reset_recycles_driver(self):
+        factory, created = make_factory()
+        pool = ChromeDriverPool(size=1, factory=factory)
+
+        driver = await pool.acquire()
+        driver.delete_all_cookies.side_effect = WebDriverException("session gone")
+        await pool.release(driver)
+
+        driver.quit.assert_called_once()
+        assert await pool.acquire() is not driver
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_all_drivers_are_lent(self):
+        factory, created = make_factory()
+        pool = ChromeDriverPool(size=1, factory=factory)
+
+        driver = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await pool.release(driver)
+        assert await asyncio.wait_for(waiter, 1) is driver
+        assert len(created) == 1
+
+    @pytest.mark.asyncio
+    async def test_factory_failure_frees_slot(self):
+        factory = MagicMock(side_effect=WebDriverException("no chrome"))
+        pool = ChromeDriverPool(size=1, factory=factory)
+
+        with pytest.raises(WebDriverException):
+            await pool.acquire()
+        with pytest.raises(WebDriverException):
+            await asyncio.wait_for(pool.acquire(), 1)
+
+    @pytest.mark.asyncio
+    async def test_close_quits_idle_and_returned_drivers(self):
+        factory, created = make_factory()
+        pool = ChromeDriverPool(size=2, factory=factory)
+
+        idle = await pool.acquire()
+        lent = await pool.acquire()
+        await pool.release(idle)
+        await pool.close()
+        idle.quit.assert_called_once()
+        lent.quit.assert_not_called()
+
+        await pool.release(lent)
+        lent.quit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_broken_driver_processes_are_killed(self, fake_chromedriver):
+        driver = MagicMock(session_id="session-0")
+        driver.service.process = fake_chromedriver
+        pool = ChromeDriverPool(size=1, factory=lambda: driver)
+
+        await pool.acquire()
+        await pool.release(driver, broken=True)
+
+        driver.quit.assert_called_once()
+        assert fake_chromedriver.wait(timeout=5) is not None
+
+    @pytest.mark.asyncio
+    async def test_healthy_driver_processes_are_left_to_quit(self, fake_chromedriver):
+        driver = MagicMock(session_id="session-0")
+        driver.service.process = fake_chromedriver
+        pool = ChromeDriverPool(size=1, max_uses=1, factory=lambda: driver)
+
+        await pool.acquire()
+        await pool.release(driver)
+
+        driver.quit.assert_called_once()
+        assert fake_chromedriver.poll() is None
+
+    def test_warns_once_without_psutil(self, caplog):
+        with (
+            patch("src.scrapers.driver_pool.PSUTIL_AVAILABLE", False),
+            patch("src.scrapers.driver_pool._psutil_warning_logged", False),
+            caplog.at_level(logging.WARNING, logger="src.scrapers.driver_pool"),
+        ):
+            ChromeDriverPool()
+            ChromeDriverPool()
+
+        warnings = [r for r in caplog.records if "psutil is not installed" in r.getMessage()]
+        assert len(warnings) == 1
+
+
+class TestChromeOptions:
+    """Tests for the shared Chrome launch options."""
+
+    def test_blocks_images_through_prefs(self):
+        options = build_chrome_options()
+
+        prefs = options.experimental_options["prefs"]
+        assert prefs["profile.managed_default_content_settings.images"] == 2
+        assert "--headless=new" in options.arguments
+
+    def test_disables_background_services(self):
+        arguments = build_chrome_options().arguments
+
+        assert set(BACKGROUND_SERVICE_FLAGS) <= set(arguments)
+        assert "--disable-images" not in arguments
@@ -0,0 +1,682 @@
+"""
+Unit tests for the HTML scraper.
+
+Tests article extraction from structured HTML listing pages using
+the per-source CSS selectors, with HTTP fetching mocked out.
+"""
+
+import asyncio
+import gzip
+import pickle
+import time
+from importlib.util import find_spec
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import soupsieve
+from bs4 import BeautifulSoup
+
+from src.scrapers.base import (
+    ACCEPT_ENCODING,
+    ScrapingConfig,
+    ScrapingDifficulty,
+    close_http_cache,
+    close_shared_client,
+    get_http_cache,
+    get_shared_client,
+    join_url,
+)
+from src.scrapers.html import (
+    HTMLScraper,
+    _parse_html_worker,
+    _worker_parser,
+    get_parse_pool,
+    shutdown_parse_pool,
+)
+from src.scrapers.registry import warmup_scrapers
+from src.utils.cache import AsyncTTLCacheBackend
+from src.utils.circuit_breaker import (
+    CircuitBreakerOpenError,
+    CircuitBreakerState,
+    get_circuit_breaker_registry,
+)
+
+LISTING_HTML = """
+<html>
+  <body>
+    <article class="post">
+      <h2><a href="/news/patch-14-1">Patch 14.1 Notes</a></h2>
+      <p class="excerpt">Everything new in patch 14.1</p>
+      <img src="/images/patch.jpg">
+      <time datetime="2024-01-10T12:00:00Z">Jan 10</time>
+    </article>
+    <article class="post">
+      <h2><a href="https://www.dexerto.com/lol/worlds">Worlds Recap</a></h2>
+      <p class="excerpt">Recap of the finals</p>
+      <img data-src="https://cdn.example.com/worlds.jpg">
+    </article>
+    <article class="post">
+      <p class="excerpt">Missing a title link</p>
+    </article>
+  </body>
+</html>
+"""
+
+
+@pytest.fixture
+def config() -> ScrapingConfig:
+    """Create a scraping config for a source with known selectors."""
+    return ScrapingConfig(
+        source_id="dexerto",
+        base_url="https://www.dexerto.com",
+        difficulty=ScrapingDifficulty.MEDIUM,
+    )
+
+
+@pytest.fixture
+def scraper(config: ScrapingConfig) -> HTMLScraper:
+    """Create an HTML scraper for the test source."""
+    return HTMLScraper(config, "en-us")
+
+
+class TestHTMLScraperFetch:
+    """Tests for HTMLScraper.fetch_articles."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_articles_parses_listing(self, scraper: HTMLScraper) -> None:
+        with patch.object(
+            scraper, "_fetch_bytes", AsyncMock(return_value=(LISTING_HTML.encode(), None))
+        ):
+            articles = await scraper.fetch_articles()
+
+        assert len(articles) == 2
+        assert articles[0].title == "Patch 14.1 Notes"
+        assert articles[0].url == "https://www.dexerto.com/news/patch-14-1"
+        assert articles[0].description == "Everything new in patch 14.1"
+        assert articles[0].image_url == "https://www.dexerto.com/images/patch.jpg"
+        assert articles[0].pub_date.year == 2024
+        assert articles[1].url == "https://www.dexerto.com/lol/worlds"
+        assert articles[1].image_url is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_articles_no_matches(self, scraper: HTMLScraper) -> None:
+        html = "<html><body><div>Nothing here</div></body></html>"
+        with patch.object(scraper, "_fetch_bytes", AsyncMock(return_value=(html.encode(), None))):
+            articles = await scraper.fetch_articles()
+
+        assert articles == []
+
+    @pytest.mark.asyncio
+    async def test_fetch_articles_respects_max_articles(self, scraper: HTMLScraper) -> None:
+        items = "".join(
+            f'<article class="post"><h2><a href="/news/{i}">Article {i}</a></h2></article>'
+            for i in range(HTMLScraper.MAX_ARTICLES + 10)
+        )
+        html = f"<html><body>{items}</body></html>"
+        with patch.object(scraper, "_fetch_bytes", AsyncMock(return_value=(html.encode(), None))):
+            articles = await scraper.fetch_articles()
+
+        assert len(articles) == HTMLScraper.MAX_ARTICLES
+        assert articles[-1].title == f"Article {HTMLScraper.MAX_ARTICLES - 1}"
+
+    @pytest.mark.asyncio
+    async def test_fetch_articles_honors_base_href(self, scraper: HTMLScraper) -> None:
+        html = LISTING_HTML.replace(
+            "<html>", '<html><head><base href="https://cdn.dexerto.com/en/"></head>'
+        )
+        with patch.object(scraper, "_fetch_bytes", AsyncMock(return_value=(html.encode(), None))):
+            articles = await scraper.fetch_articles()
+
+        assert articles[0].url == "https://cdn.dexerto.com/news/patch-14-1"
+        assert articles[0].image_url == "https://cdn.dexerto.com/images/patch.jpg"
+        assert articles[1].url == "https://www.dexerto.com/lol/worlds"
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://other.example/a", "https://other.example/a"),
+            ("/news/a", "https://www.dexerto.com/news/a"),
+            ("news/a", "https://www.dexerto.com/news/a"),
+            ("//cdn.example/img.png", "https://cdn.example/img.png"),
+            ("", ""),
+        ],
+    )
+    def test_make_absolute(self, scraper: HTMLScraper, url: str, expected: str) -> None:
+        assert scraper._make_absolute(url) == expected
+
+    @pytest.mark.asyncio
+    async def test_undated_articles_share_batch_timestamp(self, scraper: HTMLScraper) -> None:
+        items = "".join(
+            f'<article class="post"><h2><a href="/news/{i}">Article {i}</a></h2></article>'
+            for i in range(3)
+        )
+        html = f"<html><body>{items}</body></html>"
+        with patch.object(scraper, "_fetch_bytes", AsyncMock(return_value=(html.encode(), None))):
+            articles = await scraper.fetch_articles()
+
+        assert len({article.pub_date for article in articles}) == 1
+        assert articles[0].pub_date == scraper._batch_now
+        assert articles[0].pub_date.tzinfo is not None
+
+    @pytest.mark.asyncio
+    async def test_fetch_articles_sets_locale_metadata(self, scraper: HTMLScraper) -> None:
+        with patch.object(
+            scraper, "_fetch_bytes", AsyncMock(return_value=(LISTING_HTML.encode(), None))
+        ):
+            articles = await scraper.fetch_articles()
+
+        for article in articles:
+            assert article.locale == "en-us"
+            assert article.canonical_url == article.url
+            assert str(article.source) == "dexerto:en-us"
+        assert articles[0].source is articles[1].source is scraper._article_source
+
+
+class TestEncoding:
+    """Tests for decoding raw HTML bodies."""
+
+    LATIN1_HTML = (
+        '<html><body><article class="post"><h2><a href="/n">Café Patch</a></h2>'
+        "</article></body></html>"
+    )
+
+    def test_declared_charset_is_used(self, scraper: HTMLScraper) -> None:
+        raw = scraper._parse_html(self.LATIN1_HTML.encode("latin-1"), "iso-8859-1")
+        assert raw[0]["title"] == "Café Patch"
+
+    def test_meta_charset_is_sniffed(self, scraper: HTMLScraper) -> None:
+        html = self.LATIN1_HTML.replace("<html>", '<html><head><meta charset="iso-8859-1"></head>')
+        raw = scraper._parse_html(html.encode("latin-1"))
+        assert raw[0]["title"] == "Café Patch"
+
+    @pytest.mark.asyncio
+    async def test_fetch_bytes_returns_body_and_charset(self, scraper: HTMLScraper) -> None:
+        body = self.LATIN1_HTML.encode("latin-1")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, content=body, headers={"Content-Type": "text/html; charset=ISO-8859-1"}
+            )
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper._robots_parser.can_fetch = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+        with (
+            patch("src.scrapers.base._http_cache", AsyncTTLCacheBackend()),
+            patch.object(scraper, "_respect_rate_limit", AsyncMock()),
+        ):
+            content, encoding = await scraper._fetch_bytes(scraper.config.base_url)
+        await scraper.close()
+
+        assert content == body
+        assert encoding == "iso-8859-1"
+
+
+class TestConditionalGet:
+    """Tests for ETag/Last-Modified conditional fetching."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_cached_articles(self, scraper: HTMLScraper) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                text=LISTING_HTML,
+                headers={"ETag": '"v1"', "Last-Modified": "Wed, 10 Jan 2024 12:00:00 GMT"},
+            )
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper._robots_parser.can_fetch = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+        with (
+            patch("src.scrapers.base._http_cache", AsyncTTLCacheBackend()),
+            patch.object(scraper, "_respect_rate_limit", AsyncMock()),
+        ):
+            first = await scraper.fetch_articles()
+            second = await scraper.fetch_articles()
+
+        await scraper.close()
+
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+        assert requests[1].headers["If-Modified-Since"] == "Wed, 10 Jan 2024 12:00:00 GMT"
+        assert [a.guid for a in second] == [a.guid for a in first]
+        assert [a.title for a in second] == [a.title for a in first]
+
+    @pytest.mark.asyncio
+    async def test_not_modified_without_cached_articles_refetches(
+        self, scraper: HTMLScraper
+    ) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if "If-None-Match" in request.headers:
+                return httpx.Response(304)
+            return httpx.Response(200, text=LISTING_HTML)
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper._robots_parser.can_fetch = AsyncMock(return_value=True)  # type: ignore[method-assign]
+        cache = AsyncTTLCacheBackend()
+        await cache.set(
+            f"http:validators:en-us:{scraper.config.get_feed_url()}",
+            {"etag": '"stale"', "last_modified": None},
+        )
+
+        with (
+            patch("src.scrapers.base._http_cache", cache),
+            patch.object(scraper, "_respect_rate_limit", AsyncMock()),
+        ):
+            articles = await scraper.fetch_articles()
+
+        await scraper.close()
+
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[1].headers
+        assert len(articles) == 2
+
+    @pytest.mark.asyncio
+    async def test_http_cache_is_created_once_and_closed(self) -> None:
+        backend = AsyncTTLCacheBackend()
+        backend.close = AsyncMock()  # type: ignore[method-assign]
+        create = AsyncMock(return_value=backend)
+
+        with (
+            patch("src.scrapers.base._http_cache", None),
+            patch("src.scrapers.base.create_async_cache_backend", create),
+        ):
+            caches = await asyncio.gather(*(get_http_cache() for _ in range(3)))
+            await close_http_cache()
+
+        assert all(cache is backend for cache in caches)
+        create.assert_awaited_once()
+        backend.close.assert_awaited_once()
+
+
+class TestClientHeaders:
+    """Tests for the scraper HTTP client configuration."""
+
+    def test_default_headers_are_shared_and_read_only(self, config: ScrapingConfig) -> None:
+        headers = config.default_headers
+
+        assert headers is config.default_headers
+        assert headers["User-Agent"] == config.get_user_agent()
+        assert "Accept-Language" not in headers
+        with pytest.raises(TypeError):
+            headers["User-Agent"] = "other"  # type: ignore[index]
+
+    def test_config_uses_slots_and_pickles(self, config: ScrapingConfig) -> None:
+        assert not hasattr(config, "__dict__")
+        assert pickle.loads(pickle.dumps(config)) == config
+
+    def test_request_headers_add_locale_to_default_headers(self, scraper: HTMLScraper) -> None:
+        headers = scraper._request_headers
+
+        assert headers["User-Agent"] == scraper.config.get_user_agent()
+        assert headers["Accept-Language"].startswith("en-us,")
+
+    def test_accept_encoding_matches_installed_decoders(self, scraper: HTMLScraper) -> None:
+        header = scraper._request_headers["Accept-Encoding"]
+        encodings = header.split(", ")
+
+        assert header == ACCEPT_ENCODING
+        assert {"gzip", "deflate"} <= set(encodings)
+        assert ("br" in encodings) == bool(find_spec("brotli") or find_spec("brotlicffi"))
+        assert ("zstd" in encodings) == bool(find_spec("zstandard"))
+
+    @pytest.mark.asyncio
+    async def test_scrapers_share_client(self, config: ScrapingConfig) -> None:
+        first = HTMLScraper(config, "en-us")
+        second = HTMLScraper(config, "ko-kr")
+
+        try:
+            assert first.client is second.client is get_shared_client()
+            await first.close()
+            assert not second.client.is_closed
+        finally:
+            await close_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_requests_carry_scraper_headers(self, scraper: HTMLScraper) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(scraper, "_respect_rate_limit", AsyncMock()):
+            await scraper._get(scraper.config.base_url, {"If-None-Match": '"v1"'})
+        await scraper.close()
+
+        assert requests[0].headers["User-Agent"] == scraper.config.get_user_agent()
+        assert requests[0].headers["Accept-Language"].startswith("en-us,")
+        assert requests[0].headers["If-None-Match"] == '"v1"'
+
+
+class TestResponseBody:
+    """Tests for streamed, size-capped response bodies."""
+
+    @pytest.mark.asyncio
+    async def test_compressed_body_is_decoded(self, scraper: HTMLScraper) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"Content-Encoding": "gzip", "Content-Type": "text/html; charset=utf-8"},
+                content=gzip.compress(LISTING_HTML.encode()),
+            )
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(scraper, "_respect_rate_limit", AsyncMock()):
+            response = await scraper._get(scraper.config.base_url)
+        await scraper.close()
+
+        assert response.content == LISTING_HTML.encode()
+        assert "Content-Encoding" not in response.headers
+        assert response.charset_encoding == "utf-8"
+
+    @pytest.mark.asyncio
+    async def test_oversized_body_is_truncated(self, scraper: HTMLScraper) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"x" * 1000)
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with (
+            patch.object(scraper, "_respect_rate_limit", AsyncMock()),
+            patch("src.scrapers.base.MAX_RESPONSE_BYTES", 100),
+        ):
+            response = await scraper._get(scraper.config.base_url)
+        await scraper.close()
+
+        assert response.content == b"x" * 100
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, scraper: HTMLScraper) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, content=b"missing")
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(scraper, "_respect_rate_limit", AsyncMock()):
+            with pytest.raises(httpx.HTTPStatusError):
+                await scraper._get(scraper.config.base_url)
+        await scraper.close()
+
+
+class TestWarmup:
+    """Tests for DNS/TLS warm-up preflights."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_sends_one_head_per_host(self, config: ScrapingConfig) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        other = ScrapingConfig(
+            source_id="other",
+            base_url="https://other.example",
+            difficulty=ScrapingDifficulty.MEDIUM,
+        )
+        scrapers = [HTMLScraper(config, "en-us"), HTMLScraper(config, "ko-kr"), HTMLScraper(other)]
+        for s in scrapers:
+            s._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            s._robots_parser.can_fetch = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+        await warmup_scrapers(scrapers)
+        for s in scrapers:
+            await s.close()
+
+        assert sorted((r.method, r.url.host) for r in requests) == [
+            ("HEAD", "other.example"),
+            ("HEAD", "www.dexerto.com"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_warmup_ignores_errors(self, scraper: HTMLScraper) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("unreachable", request=request)
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper._robots_parser.can_fetch = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+        await scraper.warmup()
+        await scraper.close()
+
+
+class TestCircuitBreakerHandle:
+    """Tests for the cached per-host circuit breaker."""
+
+    def test_scrapers_share_registry_breaker(self, config: ScrapingConfig) -> None:
+        first = HTMLScraper(config, "en-us")
+        second = HTMLScraper(config, "ko-kr")
+
+        assert first._circuit_breaker is second._circuit_breaker
+        assert first._circuit_breaker is get_circuit_breaker_registry().get("dexerto")
+        assert first._circuit_breaker.source == "www.dexerto.com"
+
+    def test_same_host_sources_share_breaker(self, config: ScrapingConfig) -> None:
+        esports = ScrapingConfig(
+            source_id="dexerto-esports",
+            base_url="https://WWW.DEXERTO.COM/esports",
+            difficulty=ScrapingDifficulty.MEDIUM,
+        )
+        other_host = ScrapingConfig(
+            source_id="dotesports",
+            base_url="https://dotesports.com",
+            difficulty=ScrapingDifficulty.MEDIUM,
+        )
+
+        breaker = HTMLScraper(config, "en-us")._circuit_breaker
+
+        assert HTMLScraper(esports, "en-us")._circuit_breaker is breaker
+        assert HTMLScraper(other_host, "en-us")._circuit_breaker is not breaker
+
+        # Status and metrics stay labelled by source ID
+        breakers = get_circuit_breaker_registry().get_all()
+        assert breakers["dexerto"] is breakers["dexerto-esports"] is breaker
+        assert "www.dexerto.com" not in breakers
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_request(self, scraper: HTMLScraper) -> None:
+        handler = AsyncMock()
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper._robots_parser.can_fetch = AsyncMock(return_value=True)  # type: ignore[method-assign]
+        breaker = scraper._circuit_breaker
+        breaker.stats.state = CircuitBreakerState.OPEN
+        breaker.stats.opened_at = time.monotonic_ns()
+
+        try:
+            with pytest.raises(CircuitBreakerOpenError):
+                await scraper._fetch_bytes(scraper.config.base_url)
+        finally:
+            breaker.reset()
+            await scraper.close()
+
+        handler.assert_not_called()
+
+
+class TestGuidGeneration:
+    """Tests for URL-based GUID generation."""
+
+    def test_guid_is_stable_128_bit_hex(self) -> None:
+        guid = HTMLScraper._generate_guid("https://www.dexerto.com/news/patch-14-1")
+
+        assert len(guid) == 32
+        int(guid, 16)
+        assert guid == HTMLScraper._generate_guid("https://www.dexerto.com/news/patch-14-1")
+
+    def test_guid_differs_per_url(self) -> None:
+        assert HTMLScraper._generate_guid("https://a.example/1") != HTMLScraper._generate_guid(
+            "https://a.example/2"
+        )
+
+
+class TestDateParsing:
+    """Tests for BaseScraper._parse_date."""
+
+    @pytest.mark.parametrize(
+        "date_str",
+        [
+            "2024-01-10T12:00:00Z",
+            "2024-01-10T12:00:00+00:00",
+            "Wed, 10 Jan 2024 12:00:00 GMT",
+        ],
+    )
+    def test_parse_timezone_aware_formats(self, scraper: HTMLScraper, date_str: str) -> None:
+        parsed = scraper._parse_date(date_str)
+
+        assert parsed is not None
+        assert (parsed.year, parsed.month, parsed.day, parsed.hour) == (2024, 1, 10, 12)
+        assert parsed.utcoffset() is not None
+
+    def test_parse_fallback_format(self, scraper: HTMLScraper) -> None:
+        parsed = scraper._parse_date("10/01/2024 12:00")
+
+        assert parsed is not None
+        assert (parsed.year, parsed.month, parsed.day) == (2024, 1, 10)
+
+    def test_parse_invalid_returns_none(self, scraper: HTMLScraper) -> None:
+        assert scraper._parse_date("not a date") is None
+        assert scraper._parse_date(None) is None
+
+    def test_repeated_strings_are_parsed_once(self, scraper: HTMLScraper) -> None:
+        first = scraper._parse_date("2031-05-06T07:08:09Z")
+
+        assert scraper._parse_date("2031-05-06T07:08:09Z") is first
+
+
+class TestMakeAbsolute:
+    """Tests for resolving article and image URLs."""
+
+    def test_absolute_url_unchanged(self, scraper: HTMLScraper) -> None:
+        assert scraper._make_absolute("https://cdn.example.com/a.png") == (
+            "https://cdn.example.com/a.png"
+        )
+
+    def test_relative_url_joined_and_cached(self, scraper: HTMLScraper) -> None:
+        join_url.cache_clear()
+
+        assert scraper._make_absolute("/news/a") == "https://www.dexerto.com/news/a"
+        assert scraper._make_absolute("/news/a") == "https://www.dexerto.com/news/a"
+        assert join_url.cache_info().hits == 1
+        assert scraper._make_absolute("b", "https://cdn.dexerto.com/en/") == (
+            "https://cdn.dexerto.com/en/b"
+        )
+
+
+class TestHTMLScraperSelectors:
+    """Tests for compiled per-source CSS selectors."""
+
+    def test_all_sources_compiled(self) -> None:
+        assert set(HTMLScraper._COMPILED_SELECTORS) == set(HTMLScraper.SELECTORS)
+        for source_id, fields in HTMLScraper.SELECTORS.items():
+            compiled = HTMLScraper._COMPILED_SELECTORS[source_id]
+            assert {field: sel.pattern for field, sel in compiled.items()} == fields
+
+    def test_compiled_selectors_are_read_only(self, scraper: HTMLScraper) -> None:
+        assert scraper._selectors is HTMLScraper._COMPILED_SELECTORS["dexerto"]
+        with pytest.raises(TypeError):
+            scraper._selectors["title"] = soupsieve.compile("h1")  # type: ignore[index]
+        with pytest.raises(TypeError):
+            HTMLScraper._COMPILED_SELECTORS["new"] = {}  # type: ignore[index]
+
+    def test_unknown_source_uses_defaults(self) -> None:
+        config = ScrapingConfig(
+            source_id="unknown-source",
+            base_url="https://example.com",
+            difficulty=ScrapingDifficulty.MEDIUM,
+        )
+        selectors = HTMLScraper(config)._selectors
+
+        assert selectors is HTMLScraper._COMPILED_DEFAULT_SELECTORS
+        assert selectors["article"].pattern == HTMLScraper.DEFAULT_SELECTORS["article"]
+
+
+class TestFieldExtraction:
+    """Tests for single-walk field extraction."""
+
+    @pytest.mark.parametrize("source_id", sorted(HTMLScraper.SELECTORS))
+    def test_matches_select_one(self, source_id: str) -> None:
+        scraper = HTMLScraper(
+            ScrapingConfig(
+                source_id=source_id,
+                base_url="https://example.com",
+                difficulty=ScrapingDifficulty.MEDIUM,
+            )
+        )
+        selectors = scraper._selectors
+        soup = BeautifulSoup(LISTING_HTML, "lxml")
+
+        for element in soup.find_all("article"):
+            fields = scraper._extract_all(element, selectors)
+            title_elem = selectors["title"].select_one(element)
+            desc_elem = selectors["description"].select_one(element)
+
+            assert fields["title"] == (title_elem.get_text(strip=True) if title_elem else "")
+            assert fields["description"] == (desc_elem.get_text(strip=True) if desc_elem else "")
+
+    def test_url_falls_back_to_first_link(self, scraper: HTMLScraper) -> None:
+        html = '<div><h3 class="t">Title</h3><span><a href="/x">more</a></span></div>'
+        selectors = {**scraper._selectors, "url": soupsieve.compile("a.permalink")}
+        element = BeautifulSoup(html, "lxml").div
+
+        assert scraper._extract_all(element, selectors)["url"] == "/x"
+
+    @pytest.mark.parametrize(
+        "style",
+        [
+            "background-image: url('/bg.png')",
+            'background-image: url("/bg.png")',
+            "background-image:url(/bg.png); color: red",
+        ],
+    )
+    def test_background_image(self, scraper: HTMLScraper, style: str) -> None:
+        html = (
+            f"<div><img style='{style}'></div>"
+            if '"' in style
+            else f'<div><img style="{style}"></div>'
+        )
+        selectors = {**scraper._selectors, "image": soupsieve.compile("img")}
+        element = BeautifulSoup(html, "lxml").div
+
+        assert scraper._extract_all(element, selectors)["image_url"] == "/bg.png"
+
+
+class TestParsePool:
+    """Tests for the HTML parse process pool."""
+
+    def test_parse_worker_returns_plain_fields(self, config: ScrapingConfig) -> None:
+        raw_articles = _parse_html_worker(LISTING_HTML, config, "en-us")
+
+        assert len(raw_articles) == 2
+        assert raw_articles[0]["title"] == "Patch 14.1 Notes"
+        assert raw_articles[0]["url"] == "https://www.dexerto.com/news/patch-14-1"
+        assert set(raw_articles[0]) == {"title", "url", "pub_date", "description", "image_url"}
+
+    def test_parse_worker_reuses_parser_per_source_and_locale(self, config: ScrapingConfig) -> None:
+        _worker_parser.cache_clear()
+        # Each task pickles its own copy of the config
+        copy = pickle.loads(pickle.dumps(config))
+
+        with patch("src.scrapers.html.HTMLScraper", wraps=HTMLScraper) as scraper_class:
+            _parse_html_worker(LISTING_HTML, config, "en-us")
+            _parse_html_worker(LISTING_HTML, copy, "en-us")
+            _parse_html_worker(LISTING_HTML, config, "ko-kr")
+
+        assert scraper_class.call_count == 2
+        _worker_parser.cache_clear()
+
+    def test_get_parse_pool_returns_singleton(self) -> None:
+        pool = get_parse_pool()
+        assert get_parse_pool() is pool
+
+        shutdown_parse_pool()
+        assert get_parse_pool() is not pool
+        shutdown_parse_pool()
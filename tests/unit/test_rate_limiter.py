@@ -0,0 +1,182 @@
+"""
+Unit tests for the async token bucket rate limiter.
+
+Tests slot reservation, burst capacity, and the per-host limiters
+shared by scraper instances.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.scrapers.base import ScrapingConfig, ScrapingDifficulty, get_host_rate_limiter
+from src.scrapers.html import HTMLScraper
+from src.utils.rate_limiter import AsyncRateLimiter, ResizableSemaphore
+
+
+class TestAsyncRateLimiter:
+    """Test token bucket behaviour."""
+
+    def test_first_request_is_immediate(self):
+        limiter = AsyncRateLimiter(2.0)
+        assert limiter._reserve() == 0.0
+
+    def test_requests_are_spaced_by_interval(self):
+        limiter = AsyncRateLimiter(2.0)
+        with patch("src.utils.rate_limiter.time.monotonic", return_value=100.0):
+            delays = [limiter._reserve() for _ in range(3)]
+
+        assert delays == [0.0, 2.0, 4.0]
+
+    def test_burst_allows_back_to_back_requests(self):
+        limiter = AsyncRateLimiter(1.0, burst=2)
+        with patch("src.utils.rate_limiter.time.monotonic", return_value=100.0):
+            delays = [limiter._reserve() for _ in range(3)]
+
+        assert delays == [0.0, 0.0, 1.0]
+
+    def test_tokens_refill_over_time(self):
+        limiter = AsyncRateLimiter(1.0)
+        with patch("src.utils.rate_limiter.time.monotonic", side_effect=[100.0, 105.0]):
+            assert limiter._reserve() == 0.0
+            assert limiter._reserve() == 0.0
+
+    def test_reset_refills_bucket(self):
+        limiter = AsyncRateLimiter(5.0)
+        limiter._reserve()
+        limiter.reset()
+        assert limiter._reserve() == 0.0
+
+    @pytest.mark.parametrize("interval,burst", [(-1.0, 1), (1.0, 0)])
+    def test_invalid_arguments(self, interval, burst):
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(interval, burst=burst)
+
+    @pytest.mark.asyncio
+    async def test_acquire_sleeps_for_reserved_slot(self):
+        limiter = AsyncRateLimiter(3.0)
+        with patch("src.utils.rate_limiter.asyncio.sleep", AsyncMock()) as mock_sleep:
+            async with limiter:
+                pass
+            await limiter.acquire()
+
+        assert mock_sleep.await_count == 1
+        assert mock_sleep.await_args.args[0] == pytest.approx(3.0, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_are_serialized(self):
+        limiter = AsyncRateLimiter(0.05)
+        loop = asyncio.get_running_loop()
+        times: list[float] = []
+
+        async def worker():
+            await limiter.acquire()
+            times.append(loop.time())
+
+        await asyncio.gather(*(worker() for _ in range(3)))
+
+        assert times[2] - times[0] >= 0.09
+
+
+class TestResizableSemaphore:
+    """Test the resizable concurrency limiter."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_holders(self):
+        semaphore = ResizableSemaphore(2)
+        active = 0
+        peak = 0
+
+        async def worker():
+            nonlocal active, peak
+            async with semaphore:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+        assert peak == 2
+        assert semaphore.active == 0
+
+    @pytest.mark.asyncio
+    async def test_growing_capacity_wakes_waiters(self):
+        semaphore = ResizableSemaphore(1)
+        await semaphore.acquire()
+        waiter = asyncio.create_task(semaphore.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await semaphore.set_capacity(2)
+        await asyncio.wait_for(waiter, 1)
+
+        assert semaphore.active == 2
+
+    @pytest.mark.asyncio
+    async def test_shrinking_capacity_waits_for_holders(self):
+        semaphore = ResizableSemaphore(2)
+        await semaphore.acquire()
+        await semaphore.acquire()
+        await semaphore.set_capacity(1)
+
+        waiter = asyncio.create_task(semaphore.acquire())
+        await semaphore.release()
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await semaphore.release()
+        await asyncio.wait_for(waiter, 1)
+        assert semaphore.active == 1
+
+    @pytest.mark.parametrize("capacity", [0, -1])
+    def test_invalid_capacity(self, capacity):
+        with pytest.raises(ValueError):
+            ResizableSemaphore(capacity)
+
+
+class TestHostRateLimiters:
+    """Test per-host limiters shared between scrapers."""
+
+    def test_same_host_shares_limiter(self):
+        first = get_host_rate_limiter("https://limiter-test.example/news", 1.0)
+        second = get_host_rate_limiter("https://LIMITER-TEST.example/other", 1.0)
+        assert first is second
+
+    def test_most_conservative_interval_wins(self):
+        limiter = get_host_rate_limiter("https://limiter-interval.example", 1.0)
+        get_host_rate_limiter("https://limiter-interval.example/feed", 3.0)
+        get_host_rate_limiter("https://limiter-interval.example/feed", 0.5)
+        assert limiter.interval == 3.0
+
+    def test_scrapers_for_all_locales_share_limiter(self):
+        config = ScrapingConfig(
+            source_id="limiter-source",
+            base_url="https://limiter-source.example",
+            difficulty=ScrapingDifficulty.MEDIUM,
+        )
+        en = HTMLScraper(config, "en-us")
+        ko = HTMLScraper(config, "ko-kr")
+        assert en._rate_limiter is ko._rate_limiter
+
+    @pytest.mark.asyncio
+    async def test_request_host_selects_limiter(self):
+        config = ScrapingConfig(
+            source_id="limiter-feed",
+            base_url="https://limiter-feed.example",
+            difficulty=ScrapingDifficulty.EASY,
+        )
+        scraper = HTMLScraper(config, "en-us")
+        feed_limiter = get_host_rate_limiter("https://feeds.limiter-feed.example", 1.0)
+
+        with (
+            patch.object(scraper._rate_limiter, "acquire", AsyncMock()) as base_acquire,
+            patch.object(feed_limiter, "acquire", AsyncMock()) as feed_acquire,
+        ):
+            await scraper._respect_rate_limit("https://LIMITER-FEED.example/news")
+            await scraper._respect_rate_limit("https://feeds.limiter-feed.example/rss")
+            await scraper._respect_rate_limit()
+
+        assert base_acquire.await_count == 2
+        assert feed_acquire.await_count == 1
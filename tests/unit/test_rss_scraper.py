@@ -0,0 +1,413 @@
+"""
+Unit tests for the RSS scraper.
+
+Tests lxml-based parsing of RSS 2.0, RSS 1.0 and Atom feeds into
+feedparser-shaped entries, and article extraction with HTTP mocked out.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.scrapers.base import ScrapingConfig, ScrapingDifficulty
+from src.scrapers.rss import RSSScraper, _parse_feed_lxml, _sanitize_html
+from src.utils.cache import AsyncTTLCacheBackend
+
+RSS2_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:media="http://search.yahoo.com/mrss/">
+  <channel>
+    <title>Esports News</title>
+    <link>https://rss-test.example</link>
+    <item>
+      <title>Patch 14.1 &amp; More</title>
+      <link>https://rss-test.example/news/patch-14-1</link>
+      <guid>https://rss-test.example/?p=1</guid>
+      <description><![CDATA[<p onclick="steal()">Everything new</p><script>bad()</script>]]></description>
+      <content:encoded><![CDATA[<p>Full <b>content</b></p>]]></content:encoded>
+      <pubDate>Wed, 10 Jan 2024 12:00:00 GMT</pubDate>
+      <dc:creator>Jane Doe</dc:creator>
+      <category>League of Legends</category>
+      <category>Patch Notes</category>
+      <media:content url="https://cdn.example/patch.jpg" medium="image"/>
+    </item>
+    <item>
+      <title>Worlds Recap</title>
+      <link>https://rss-test.example/news/worlds</link>
+      <enclosure url="https://cdn.example/worlds.jpg" type="image/jpeg" length="0"/>
+    </item>
+    <item>
+      <description>No title or link</description>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Dev Blog</title>
+  <entry>
+    <title>Atom Entry</title>
+    <link rel="alternate" type="text/html" href="https://rss-test.example/atom/1"/>
+    <link rel="enclosure" type="image/png" href="https://cdn.example/atom.png"/>
+    <id>tag:rss-test.example,2024:1</id>
+    <updated>2024-02-01T08:30:00Z</updated>
+    <author><name>Riot Dev</name></author>
+    <category term="Dev"/>
+    <summary>Short summary</summary>
+    <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">Hello <b>world</b></div></content>
+  </entry>
+</feed>
+"""
+
+RSS1_FEED = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <item rdf:about="https://rss-test.example/rdf/1">
+    <title>RDF Item</title>
+    <link>https://rss-test.example/rdf/1</link>
+    <dc:date>2024-03-05T10:00:00+00:00</dc:date>
+  </item>
+</rdf:RDF>
+"""
+
+
+@pytest.fixture
+def scraper() -> RSSScraper:
+    """Create an RSS scraper for a test source."""
+    config = ScrapingConfig(
+        source_id="dexerto",
+        base_url="https://rss-test.example",
+        rss_feed_url="https://rss-test.example/feed",
+        difficulty=ScrapingDifficulty.EASY,
+        rate_limit_seconds=0.0,
+    )
+    return RSSScraper(config, "en-us")
+
+
+class TestParseFeedLxml:
+    """Tests for _parse_feed_lxml entry dicts."""
+
+    def test_rss2_entries(self) -> None:
+        entries = _parse_feed_lxml(RSS2_FEED)
+
+        assert len(entries) == 3
+        first = entries[0]
+        assert first["title"] == "Patch 14.1 & More"
+        assert first["link"] == "https://rss-test.example/news/patch-14-1"
+        assert first["id"] == "https://rss-test.example/?p=1"
+        assert first["published"] == "Wed, 10 Jan 2024 12:00:00 GMT"
+        assert first["author"] == "Jane Doe"
+        assert first["tags"] == [{"term": "League of Legends"}, {"term": "Patch Notes"}]
+        assert first["media_content"] == [
+            {"url": "https://cdn.example/patch.jpg", "medium": "image"}
+        ]
+        assert first["content"] == [{"value": "<p>Full <b>content</b></p>"}]
+        assert entries[1]["enclosures"] == [
+            {"href": "https://cdn.example/worlds.jpg", "type": "image/jpeg"}
+        ]
+
+    def test_description_is_sanitized(self) -> None:
+        description = _parse_feed_lxml(RSS2_FEED)[0]["description"]
+
+        assert description == "<p>Everything new</p>"
+
+    def test_atom_entries(self) -> None:
+        (entry,) = _parse_feed_lxml(ATOM_FEED)
+
+        assert entry["title"] == "Atom Entry"
+        assert entry["link"] == "https://rss-test.example/atom/1"
+        assert entry["id"] == "tag:rss-test.example,2024:1"
+        assert entry["updated"] == "2024-02-01T08:30:00Z"
+        assert entry["author"] == "Riot Dev"
+        assert entry["tags"] == [{"term": "Dev"}]
+        assert entry["summary"] == "Short summary"
+        assert entry["enclosures"] == [
+            {"href": "https://cdn.example/atom.png", "type": "image/png"}
+        ]
+        assert "Hello <b>world</b>" in entry["content"][0]["value"]
+
+    def test_rss1_entries(self) -> None:
+        (entry,) = _parse_feed_lxml(RSS1_FEED)
+
+        assert entry["title"] == "RDF Item"
+        assert entry["link"] == "https://rss-test.example/rdf/1"
+        assert entry["published"] == "2024-03-05T10:00:00+00:00"
+
+    def test_malformed_feed_is_recovered(self) -> None:
+        feed = b"<rss><channel><item><title>Broken & unclosed</title><link>https://x/a</link>"
+
+        entries = _parse_feed_lxml(feed)
+
+        assert entries[0]["link"] == "https://x/a"
+
+    def test_external_entities_are_not_resolved(self) -> None:
+        feed = (
+            b'<?xml version="1.0"?><!DOCTYPE rss [<!ENTITY xxe SYSTEM "file:///etc/passwd">]>'
+            b"<rss><channel><item><title>&xxe;</title></item></channel></rss>"
+        )
+
+        entries = _parse_feed_lxml(feed)
+
+        assert "root:" not in entries[0].get("title", "")
+
+    @pytest.mark.parametrize(
+        "html,expected",
+        [
+            ("plain text", "plain text"),
+            ('<a href="javascript:alert(1)">x</a>', "<a>x</a>"),
+            ("<p>a</p><style>p{}</style><p>b</p>", "<p>a</p><p>b</p>"),
+            ('<img src="/a.png" onerror="x()">', '<img src="/a.png">'),
+            ('<a href="data:text/html;base64,PHNjcmlwdD4=">x</a>', "<a>x</a>"),
+            ('<img src="data:image/svg+xml,&lt;svg/&gt;" alt="a">', '<img alt="a">'),
+            ('<a href=" JaVa\tScript:alert(1)">x</a>', "<a>x</a>"),
+            ('<p style="background:url(javascript:x)">t</p>', "<p>t</p>"),
+            ('<a href="mailto:a@b.example" class="c">m</a>', '<a href="mailto:a@b.example">m</a>'),
+            ("<p>a<marquee>b</marquee>c<!-- x --></p>", "<p>abc</p>"),
+        ],
+    )
+    def test_sanitize_html(self, html: str, expected: str) -> None:
+        assert _sanitize_html(html) == expected
+
+
+class TestRSSScraperFetch:
+    """Tests for RSSScraper.fetch_articles."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_articles_parses_feed(self, scraper: RSSScraper) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=RSS2_FEED)
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        articles = await scraper.fetch_articles()
+        await scraper.close()
+
+        assert len(articles) == 2
+        first = articles[0]
+        assert first.title == "Patch 14.1 & More"
+        assert first.url == "https://rss-test.example/news/patch-14-1"
+        assert first.description == "Everything new"
+        assert first.content == "<p>Full <b>content</b></p>"
+        assert first.author == "Jane Doe"
+        assert first.categories == ["League of Legends", "Patch Notes"]
+        assert first.image_url == "https://cdn.example/patch.jpg"
+        assert first.pub_date.year == 2024
+        assert articles[1].image_url == "https://cdn.example/worlds.jpg"
+        assert articles[1].pub_date == scraper._batch_now
+
+    @pytest.mark.asyncio
+    async def test_fetch_articles_atom_feed(self, scraper: RSSScraper) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=ATOM_FEED)
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        articles = await scraper.fetch_articles()
+        await scraper.close()
+
+        assert len(articles) == 1
+        assert articles[0].url == "https://rss-test.example/atom/1"
+        assert articles[0].pub_date.month == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_articles_empty_body(self, scraper: RSSScraper) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"")
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        articles = await scraper.fetch_articles()
+        await scraper.close()
+
+        assert articles == []
+
+
+class TestRSSConditionalGet:
+    """Tests for ETag/Last-Modified conditional feed fetching."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_cached_articles(self, scraper: RSSScraper) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                content=RSS2_FEED,
+                headers={"ETag": '"v1"', "Last-Modified": "Wed, 10 Jan 2024 12:00:00 GMT"},
+            )
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with patch("src.scrapers.base._http_cache", AsyncTTLCacheBackend()):
+            first = await scraper.fetch_articles()
+            with patch("src.scrapers.rss._parse_feed_lxml") as mock_parse:
+                second = await scraper.fetch_articles()
+
+        await scraper.close()
+
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+        assert requests[1].headers["If-Modified-Since"] == "Wed, 10 Jan 2024 12:00:00 GMT"
+        mock_parse.assert_not_called()
+        assert [a.guid for a in second] == [a.guid for a in first]
+
+    @pytest.mark.asyncio
+    async def test_not_modified_without_cached_articles_refetches(
+        self, scraper: RSSScraper
+    ) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if "If-None-Match" in request.headers:
+                return httpx.Response(304)
+            return httpx.Response(200, content=RSS2_FEED)
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        cache = AsyncTTLCacheBackend()
+        await cache.set(
+            f"http:validators:en-us:{scraper.config.get_feed_url()}",
+            {"etag": '"stale"', "last_modified": None},
+        )
+
+        with patch("src.scrapers.base._http_cache", cache):
+            articles = await scraper.fetch_articles()
+
+        await scraper.close()
+
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[1].headers
+        assert len(articles) == 2
+
+
+class TestFieldHelpers:
+    """Tests for the regex fast paths in the _extract_* helpers."""
+
+    @pytest.mark.parametrize(
+        "html,expected",
+        [
+            ("", ""),
+            ("plain", "plain"),
+            ("<p>Hello <b>world</b>!</p>", "Hello world !"),
+            ("Fish &amp; chips&nbsp;today", "Fish & chips today"),
+            ("<p>\n  spaced\n\n  out </p>", "spaced out"),
+            ("&lt;b&gt;escaped&lt;/b&gt;", "<b>escaped</b>"),
+        ],
+    )
+    def test_clean_html(self, html: str, expected: str) -> None:
+        assert RSSScraper._clean_html(html).replace("\xa0", " ") == expected
+
+    def test_image_from_description_html(self, scraper: RSSScraper) -> None:
+        entry = {
+            "description": '<p>Text</p><IMG class="x" src="https://cdn.example/a.png?w=1&amp;h=2">'
+        }
+
+        assert scraper._extract_image(entry) == "https://cdn.example/a.png?w=1&h=2"
+
+    def test_image_from_content_html(self, scraper: RSSScraper) -> None:
+        entry = {"summary": "No image", "content": [{"value": "<img src='/b.jpg'>"}]}
+
+        assert scraper._extract_image(entry) == "/b.jpg"
+
+    def test_no_image(self, scraper: RSSScraper) -> None:
+        assert scraper._extract_image({"description": "<p>Text</p>"}) is None
+
+    @pytest.mark.parametrize(
+        "entry,expected",
+        [
+            (
+                {"published": "Wed, 10 Jan 2024 12:00:00 GMT"},
+                datetime(2024, 1, 10, 12, tzinfo=timezone.utc),
+            ),
+            (
+                {"updated": "2024-02-01T08:30:00Z"},
+                datetime(2024, 2, 1, 8, 30, tzinfo=timezone.utc),
+            ),
+            (
+                {"published": "not a date", "updated": "2024-02-01T08:30:00+00:00"},
+                datetime(2024, 2, 1, 8, 30, tzinfo=timezone.utc),
+            ),
+            ({}, None),
+        ],
+    )
+    def test_pub_date(self, scraper: RSSScraper, entry: dict, expected: datetime | None) -> None:
+        assert scraper._extract_pub_date(entry) == expected
+
+    def test_parse_article_is_synchronous(self, scraper: RSSScraper) -> None:
+        article = scraper.parse_article(_parse_feed_lxml(RSS2_FEED)[0])
+
+        assert article is not None
+        assert article.title == "Patch 14.1 & More"
+        assert scraper.parse_article({"description": "No title or link"}) is None
+
+    def test_parse_article_image_from_description(self, scraper: RSSScraper) -> None:
+        entry = {
+            "title": "Inline image",
+            "link": "https://rss-test.example/a",
+            "summary": '<p>Text</p><img src="https://cdn.example/inline.png">',
+        }
+
+        article = scraper.parse_article(entry)
+
+        assert article is not None
+        assert article.description == "Text"
+        assert article.image_url == "https://cdn.example/inline.png"
+
+    def test_failing_entry_is_skipped(self, scraper: RSSScraper) -> None:
+        with patch.object(scraper, "parse_article", side_effect=ValueError("bad entry")):
+            assert scraper._parse_entry({"title": "x"}) is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_articles_respects_max_entries(self, scraper: RSSScraper) -> None:
+        items = "".join(
+            f"<item><title>Entry {i}</title><link>https://rss-test.example/{i}</link></item>"
+            for i in range(RSSScraper.MAX_ENTRIES + 10)
+        )
+        feed = f"<rss><channel>{items}</channel></rss>".encode()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=feed)
+
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("src.scrapers.base._http_cache", AsyncTTLCacheBackend()):
+            articles = await scraper.fetch_articles()
+        await scraper.close()
+
+        assert len(articles) == RSSScraper.MAX_ENTRIES
+        assert articles[-1].title == f"Entry {RSSScraper.MAX_ENTRIES - 1}"
+
+    @pytest.mark.parametrize(
+        "entry,expected",
+        [
+            ({"link": "https://x/a", "id": "https://x/id"}, "https://x/a"),
+            ({"id": "https://x/id"}, "https://x/id"),
+            (
+                {"id": "tag:x,2024:1", "links": [{"rel": "alternate", "href": "https://x/b"}]},
+                "https://x/b",
+            ),
+            ({"id": "tag:x,2024:1"}, ""),
+        ],
+    )
+    def test_extract_url_fallbacks(self, scraper: RSSScraper, entry: dict, expected: str) -> None:
+        assert scraper._extract_url(entry) == expected
+
+    def test_categories_and_author_are_normalized(self, scraper: RSSScraper) -> None:
+        first = {"tags": [{"term": " League of Legends "}, {"label": "TFT"}], "author": " Jane "}
+        second = {"category": ["League of Legends"], "author_detail": {"name": "Jane"}}
+
+        first_categories = scraper._extract_categories(first)
+        second_categories = scraper._extract_categories(second)
+
+        assert first_categories == ["League of Legends", "TFT"]
+        assert first_categories[0] is second_categories[0]
+        assert scraper._extract_author(first) is scraper._extract_author(second)
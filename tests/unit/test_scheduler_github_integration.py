@@ -5,6 +5,7 @@ This module tests the scheduler's ability to trigger GitHub Pages
 updates when new articles are found.
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -97,6 +98,7 @@ async def test_github_pages_sync_enabled_with_new_articles(
                 mock_dispatcher_class.return_value = mock_dispatcher
 
                 _stats = await scheduler._update_job()
+                await asyncio.gather(*scheduler._pending_dispatches)
 
                 # Verify dispatcher was instantiated
                 mock_dispatcher_class.assert_called_once_with(
@@ -188,6 +190,7 @@ async def test_github_pages_sync_error_doesnt_crash_scheduler(
 
                 # Should not raise exception
                 stats = await scheduler._update_job()
+                await asyncio.gather(*scheduler._pending_dispatches)
 
                 # Verify error logged
                 assert "Failed to trigger GitHub Pages update" in caplog.text
@@ -219,6 +222,60 @@ async def test_github_pages_sync_workflow_trigger_failure(
                 mock_dispatcher_class.return_value = mock_dispatcher
 
                 await scheduler._update_job()
+                await asyncio.gather(*scheduler._pending_dispatches)
 
                 # Should not log success message
                 assert "GitHub Pages update triggered" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_github_pages_sync_does_not_block_update_job(
+    scheduler: NewsScheduler, mock_repository: AsyncMock
+) -> None:
+    """Test that the update job returns before the workflow dispatch finishes."""
+    with patch("src.services.scheduler.settings") as mock_settings:
+        mock_settings.enable_github_pages_sync = True
+        mock_settings.github_token = "ghp_test_token"
+        mock_settings.github_repository = "owner/repo"
+
+        with patch.object(scheduler.update_service, "update_all", new=AsyncMock()) as mock_update:
+            mock_update.return_value = {"new_articles": 1, "total_fetched": 1}
+            release = asyncio.Event()
+
+            async def slow_trigger(**_kwargs: object) -> bool:
+                await release.wait()
+                return True
+
+            with patch("src.services.scheduler.GitHubWorkflowDispatcher") as mock_dispatcher_class:
+                mock_dispatcher_class.return_value.trigger_workflow = slow_trigger
+
+                stats = await asyncio.wait_for(scheduler._update_job(), 1)
+
+                assert stats["new_articles"] == 1
+                assert len(scheduler._pending_dispatches) == 1
+
+                release.set()
+                await asyncio.gather(*scheduler._pending_dispatches)
+                assert not scheduler._pending_dispatches
+
+
+@pytest.mark.asyncio
+async def test_github_dispatcher_init_failure_keeps_stats(scheduler: NewsScheduler) -> None:
+    """Test that a dispatcher that fails to build is logged and the stats are returned."""
+    with patch("src.services.scheduler.settings") as mock_settings:
+        mock_settings.enable_github_pages_sync = True
+        mock_settings.github_token = "ghp_test_token"
+        mock_settings.github_repository = "not-a-repo"
+
+        with patch.object(scheduler.update_service, "update_all", new=AsyncMock()) as mock_update:
+            mock_update.return_value = {"new_articles": 2, "total_fetched": 2}
+
+            with patch(
+                "src.services.scheduler.GitHubWorkflowDispatcher",
+                side_effect=ValueError("invalid repository"),
+            ):
+                stats = await scheduler._update_job()
+                await asyncio.gather(*scheduler._pending_dispatches)
+
+    assert stats == {"new_articles": 2, "total_fetched": 2}
+    assert not scheduler._pending_dispatches
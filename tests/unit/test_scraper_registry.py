@@ -0,0 +1,188 @@
+"""
+Unit tests for the scraper registry.
+
+Tests source lookups and the concurrent multi-source fetch helper,
+with scrapers mocked out.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.models import SourceCategory
+from src.scrapers import registry
+from src.scrapers.base import ScrapingDifficulty
+from src.scrapers.registry import MAX_CONCURRENT_FETCHES, fetch_all, fetch_matrix
+
+
+def make_scraper(source_id: str, result: object = None, delay: float = 0.0) -> MagicMock:
+    """Create a mock scraper whose fetch_articles returns or raises result."""
+    scraper = MagicMock()
+    scraper.config.source_id = source_id
+    scraper.config.base_url = f"https://{source_id}.example"
+    scraper.close = AsyncMock()
+    scraper.warmup = AsyncMock()
+
+    async def fetch_articles() -> list:
+        await asyncio.sleep(delay)
+        if isinstance(result, BaseException):
+            raise result
+        return result or []
+
+    scraper.fetch_articles = fetch_articles
+    return scraper
+
+
+class TestFetchAll:
+    """Tests for fetch_all."""
+
+    @pytest.mark.asyncio
+    async def test_collects_results_and_errors_per_source(self):
+        error = RuntimeError("boom")
+        scrapers = {
+            "a": make_scraper("a", ["article-a"]),
+            "b": make_scraper("b", error),
+            "c": make_scraper("c", ["article-c"]),
+        }
+
+        with patch.object(registry, "get_scraper", side_effect=lambda s, _l: scrapers[s]):
+            results = await fetch_all(["a", "b", "c"], "ko-kr")
+
+        assert results == {"a": ["article-a"], "b": error, "c": ["article-c"]}
+        for scraper in scrapers.values():
+            scraper.warmup.assert_awaited_once()
+            scraper.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_fetches_run_concurrently(self):
+        scrapers = {s: make_scraper(s, delay=0.1) for s in ("a", "b", "c", "d")}
+        loop = asyncio.get_running_loop()
+
+        with patch.object(registry, "get_scraper", side_effect=lambda s, _l: scrapers[s]):
+            start = loop.time()
+            await fetch_all(list(scrapers))
+            elapsed = loop.time() - start
+
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        active = 0
+        peak = 0
+
+        def build(source_id: str, _locale: str) -> MagicMock:
+            scraper = make_scraper(source_id)
+
+            async def fetch_articles() -> list:
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return []
+
+            scraper.fetch_articles = fetch_articles
+            return scraper
+
+        source_ids = [f"s{i}" for i in range(MAX_CONCURRENT_FETCHES * 2)]
+        with patch.object(registry, "get_scraper", side_effect=build):
+            await fetch_all(source_ids)
+
+        assert peak == MAX_CONCURRENT_FETCHES
+
+    @pytest.mark.asyncio
+    async def test_unknown_source_raises(self):
+        with pytest.raises(ValueError):
+            await fetch_all(["not-a-source"])
+
+
+class TestFetchMatrix:
+    """Tests for fetch_matrix."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_every_source_locale_pair(self):
+        error = RuntimeError("boom")
+        built: dict[tuple[str, str], MagicMock] = {}
+
+        def build(source_id: str, locale: str) -> MagicMock:
+            result = error if (source_id, locale) == ("b", "ko-kr") else [f"{source_id}-{locale}"]
+            built[(source_id, locale)] = make_scraper(source_id, result, delay=0.05)
+            return built[(source_id, locale)]
+
+        loop = asyncio.get_running_loop()
+        with patch.object(registry, "get_scraper", side_effect=build):
+            start = loop.time()
+            results = await fetch_matrix(["a", "b"], iter(["en-us", "ko-kr"]))
+            elapsed = loop.time() - start
+
+        assert results == {
+            ("a", "en-us"): ["a-en-us"],
+            ("a", "ko-kr"): ["a-ko-kr"],
+            ("b", "en-us"): ["b-en-us"],
+            ("b", "ko-kr"): error,
+        }
+        assert elapsed < 0.15
+        for scraper in built.values():
+            scraper.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancellation_cancels_fetches_and_closes(self):
+        scrapers = {s: make_scraper(s, delay=10) for s in ("a", "b")}
+
+        with patch.object(registry, "get_scraper", side_effect=lambda s, _l: scrapers[s]):
+            task = asyncio.create_task(fetch_matrix(list(scrapers), ["en-us"]))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        for scraper in scrapers.values():
+            scraper.close.assert_awaited_once()
+
+
+class TestRegistryMappings:
+    """Tests for the read-only registry mappings."""
+
+    def test_scraper_configs_is_read_only(self):
+        with pytest.raises(TypeError):
+            registry.SCRAPER_CONFIGS["new-source"] = registry.SCRAPER_CONFIGS["dexerto"]  # type: ignore[index]
+
+    def test_source_category_map_is_read_only(self):
+        with pytest.raises(TypeError):
+            del registry.SOURCE_CATEGORY_MAP["dexerto"]  # type: ignore[attr-defined]
+
+    def test_all_sources_matches_configs(self):
+        assert isinstance(registry.ALL_SCRAPER_SOURCES, tuple)
+        assert registry.ALL_SCRAPER_SOURCES == tuple(registry.SCRAPER_CONFIGS)
+        assert set(registry.SOURCE_CATEGORY_MAP) == set(registry.ALL_SCRAPER_SOURCES)
+
+    def test_sources_by_category_is_precomputed(self):
+        sources = registry.get_sources_by_category(SourceCategory.ANALYTICS)
+
+        assert sources == ("mobalytics", "u-gg", "blitz-gg", "porofessor")
+        assert registry.get_sources_by_category(SourceCategory.ANALYTICS) is sources
+
+    def test_sources_by_difficulty_matches_configs(self):
+        for difficulty in ScrapingDifficulty:
+            expected = tuple(
+                source_id
+                for source_id, config in registry.SCRAPER_CONFIGS.items()
+                if config.difficulty == difficulty
+            )
+            assert registry.get_sources_by_difficulty(difficulty) == expected
+
+
+class TestGetScraper:
+    """Tests for the scraper factory."""
+
+    def test_class_matches_difficulty(self):
+        for source_id, config in registry.SCRAPER_CONFIGS.items():
+            scraper = registry.get_scraper(source_id, "ko-kr")
+            assert type(scraper) is registry.SCRAPER_CLASSES[config.difficulty]
+            assert scraper.config is config
+            assert scraper.locale == "ko-kr"
+
+    def test_unknown_source(self):
+        with pytest.raises(ValueError, match="Unknown scraper source"):
+            registry.get_scraper("not-a-source")
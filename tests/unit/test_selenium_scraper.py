@@ -0,0 +1,388 @@
+"""
+Unit tests for the Selenium scraper.
+
+Tests the plain-HTTP probe that lets server-rendered sources skip Chrome,
+with HTTP fetching and the WebDriver mocked out.
+"""
+
+import asyncio
+import time
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+import soupsieve
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import WebDriverException
+from soupsieve import SoupSieve
+
+from src.scrapers.base import ScrapingConfig, ScrapingDifficulty
+from src.scrapers.selenium import SeleniumScraper, _css_to_strainer, _ParsedFields
+
+LISTING_HTML = """
+<html>
+  <body>
+    <article>
+      <h2><a href="/news/patch-14-1">Patch 14.1 Tier List</a></h2>
+      <p class="excerpt">Best champions this patch</p>
+      <time datetime="2024-01-10T12:00:00Z">Jan 10</time>
+    </article>
+  </body>
+</html>
+"""
+
+SHELL_HTML = "<html><body><div id='root'></div></body></html>"
+
+# Server-rendered skeleton: article nodes whose title and link JS fills in
+PLACEHOLDER_HTML = """
+<html>
+  <body>
+    <article class="skeleton"><div class="shimmer"></div></article>
+    <article class="skeleton"><div class="shimmer"></div></article>
+  </body>
+</html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def reset_requires_js() -> Iterator[None]:
+    """Forget which sources were learned to need JavaScript."""
+    SeleniumScraper._requires_js.clear()
+    yield
+    SeleniumScraper._requires_js.clear()
+
+
+@pytest.fixture
+def scraper() -> SeleniumScraper:
+    """Create a Selenium scraper for a source with known selectors."""
+    config = ScrapingConfig(
+        source_id="u-gg",
+        base_url="https://u.gg/news",
+        difficulty=ScrapingDifficulty.HARD,
+        requires_selenium=True,
+    )
+    return SeleniumScraper(config, "en-us")
+
+
+def fake_driver(scraper: SeleniumScraper, page_source: str) -> AsyncMock:
+    """Patchable _init_driver that installs a driver serving page_source."""
+
+    async def init_driver() -> None:
+        scraper._driver = MagicMock(page_source=page_source)
+
+    return AsyncMock(side_effect=init_driver)
+
+
+class TestStaticProbe:
+    """Tests for fetching server-rendered pages without Selenium."""
+
+    @pytest.mark.asyncio
+    async def test_static_html_skips_selenium(self, scraper: SeleniumScraper) -> None:
+        init_driver = AsyncMock()
+        with (
+            patch.object(
+                scraper, "_fetch_bytes", AsyncMock(return_value=(LISTING_HTML.encode(), None))
+            ),
+            patch.object(scraper, "_init_driver", init_driver),
+        ):
+            articles = await scraper.fetch_articles()
+
+        assert [a.title for a in articles] == ["Patch 14.1 Tier List"]
+        assert articles[0].url == "https://u.gg/news/patch-14-1"
+        init_driver.assert_not_awaited()
+        assert "u-gg" not in SeleniumScraper._requires_js
+
+    @pytest.mark.asyncio
+    async def test_js_shell_falls_back_and_is_remembered(self, scraper: SeleniumScraper) -> None:
+        fetch_bytes = AsyncMock(return_value=(SHELL_HTML.encode(), None))
+        with (
+            patch.object(scraper, "_fetch_bytes", fetch_bytes),
+            patch.object(scraper, "_init_driver", fake_driver(scraper, LISTING_HTML)),
+            patch.object(scraper, "_wait_for_page_load", AsyncMock()),
+            patch.object(scraper, "_cleanup_driver", AsyncMock()),
+        ):
+            first = await scraper.fetch_articles()
+            second = await scraper.fetch_articles()
+
+        assert [a.title for a in first] == ["Patch 14.1 Tier List"]
+        assert [a.title for a in second] == ["Patch 14.1 Tier List"]
+        assert "u-gg" in SeleniumScraper._requires_js
+        fetch_bytes.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_placeholder_articles_fall_back_and_are_remembered(
+        self, scraper: SeleniumScraper
+    ) -> None:
+        fetch_bytes = AsyncMock(return_value=(PLACEHOLDER_HTML.encode(), None))
+        with (
+            patch.object(scraper, "_fetch_bytes", fetch_bytes),
+            patch.object(scraper, "_init_driver", fake_driver(scraper, LISTING_HTML)),
+            patch.object(scraper, "_wait_for_page_load", AsyncMock()),
+            patch.object(scraper, "_cleanup_driver", AsyncMock()),
+        ):
+            first = await scraper.fetch_articles()
+            second = await scraper.fetch_articles()
+
+        assert [a.title for a in first] == ["Patch 14.1 Tier List"]
+        assert [a.title for a in second] == ["Patch 14.1 Tier List"]
+        assert "u-gg" in SeleniumScraper._requires_js
+        fetch_bytes.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_already_stored_static_articles_skip_selenium(
+        self, scraper: SeleniumScraper
+    ) -> None:
+        init_driver = AsyncMock()
+        with (
+            patch.object(
+                scraper, "_fetch_bytes", AsyncMock(return_value=(LISTING_HTML.encode(), None))
+            ),
+            patch.object(scraper, "_init_driver", init_driver),
+            patch.object(
+                scraper,
+                "_lookup_existing_guids",
+                AsyncMock(side_effect=lambda guids: set(guids)),
+            ),
+        ):
+            articles = await scraper.fetch_articles()
+
+        assert [a.title for a in articles] == ["Patch 14.1 Tier List"]
+        init_driver.assert_not_awaited()
+        assert "u-gg" not in SeleniumScraper._requires_js
+
+    @pytest.mark.asyncio
+    async def test_http_error_falls_back_without_learning(self, scraper: SeleniumScraper) -> None:
+        with (
+            patch.object(
+                scraper, "_fetch_bytes", AsyncMock(side_effect=httpx.ConnectError("refused"))
+            ),
+            patch.object(scraper, "_init_driver", fake_driver(scraper, LISTING_HTML)),
+            patch.object(scraper, "_wait_for_page_load", AsyncMock()),
+            patch.object(scraper, "_cleanup_driver", AsyncMock()),
+        ):
+            articles = await scraper.fetch_articles()
+
+        assert len(articles) == 1
+        assert "u-gg" not in SeleniumScraper._requires_js
+
+
+class TestDriverCalls:
+    """Tests for running blocking WebDriver calls off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_do_not_share_the_session(
+        self, scraper: SeleniumScraper
+    ) -> None:
+        SeleniumScraper._requires_js.add("u-gg")
+        active = 0
+        peak = 0
+
+        def get(url: str) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            time.sleep(0.05)
+            active -= 1
+
+        async def init_driver() -> None:
+            scraper._driver = MagicMock(page_source=LISTING_HTML)
+            scraper._driver.get.side_effect = get
+
+        with (
+            patch.object(scraper, "_init_driver", AsyncMock(side_effect=init_driver)),
+            patch.object(scraper, "_wait_for_page_load", AsyncMock()),
+            patch.object(scraper, "_cleanup_driver", AsyncMock()),
+        ):
+            results = await asyncio.gather(scraper.fetch_articles(), scraper.fetch_articles())
+
+        assert [len(articles) for articles in results] == [1, 1]
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_waits_until_article_count_is_stable(self, scraper: SeleniumScraper) -> None:
+        driver = MagicMock()
+        driver.find_elements.side_effect = [[], ["a"], ["a", "b"], ["a", "b"], ["a", "b", "c"]]
+
+        with patch.object(SeleniumScraper, "STABILIZE_POLL", 0.01):
+            await scraper._wait_for_stable_articles(driver, "article")
+
+        assert driver.find_elements.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_stabilization_gives_up_after_timeout(self, scraper: SeleniumScraper) -> None:
+        driver = MagicMock()
+        driver.find_elements.side_effect = lambda *_: [object()] * driver.find_elements.call_count
+
+        with (
+            patch.object(SeleniumScraper, "STABILIZE_POLL", 0.01),
+            patch.object(SeleniumScraper, "STABILIZE_TIMEOUT", 0.05),
+        ):
+            await scraper._wait_for_stable_articles(driver, "article")
+
+        assert driver.find_elements.call_count > 1
+
+    @pytest.mark.asyncio
+    async def test_driver_lost_during_init_fails_fetch(self, scraper: SeleniumScraper) -> None:
+        SeleniumScraper._requires_js.add("u-gg")
+
+        with (
+            patch.object(scraper, "_init_driver", AsyncMock()),
+            patch.object(scraper, "_cleanup_driver", AsyncMock()),
+            pytest.raises(WebDriverException, match="Driver not initialized"),
+        ):
+            await scraper.fetch_articles()
+
+
+class TestCompiledSelectors:
+    """Tests for the precompiled per-source selectors."""
+
+    def test_known_source_uses_compiled_selectors(self, scraper: SeleniumScraper) -> None:
+        assert scraper._selectors is SeleniumScraper._COMPILED_SELECTORS["u-gg"]
+        assert all(isinstance(sel, SoupSieve) for sel in scraper._selectors.values())
+        assert scraper._selectors["article"].pattern == SeleniumScraper.SELECTORS["u-gg"]["article"]
+
+    def test_unknown_source_uses_compiled_defaults(self) -> None:
+        config = ScrapingConfig(
+            source_id="dexerto",
+            base_url="https://www.dexerto.com",
+            difficulty=ScrapingDifficulty.HARD,
+        )
+        scraper = SeleniumScraper(config)
+
+        assert scraper._selectors is SeleniumScraper._COMPILED_DEFAULT_SELECTORS
+        assert scraper._get_selectors() is SeleniumScraper.DEFAULT_SELECTORS
+
+
+class TestParseArticle:
+    """Tests for extracting article fields from an element."""
+
+    def test_single_walk_matches_select_one(self, scraper: SeleniumScraper) -> None:
+        html = """
+        <article>
+          <a class="thumb" href="/thumb"><img data-src="/img/cover.jpg"></a>
+          <h3><a class="title-link" href="/news/worlds">Worlds Recap</a></h3>
+          <span class="date">2024-11-02</span>
+          <p>First paragraph</p>
+          <p>Second paragraph</p>
+        </article>
+        """
+        element = BeautifulSoup(html, "lxml").article
+        assert element is not None
+
+        matches, first_link = scraper._match_fields(element, scraper._selectors)
+
+        for field, selector in scraper._selectors.items():
+            if field in SeleniumScraper._FIELD_SELECTORS:
+                assert matches.get(field) is selector.select_one(element)
+        assert first_link is element.find("a")
+
+        article = scraper.parse_article(element)
+        assert article is not None
+        assert article.title == "Worlds Recap"
+        assert article.url == "https://u.gg/thumb"
+        assert article.description == "First paragraph"
+        assert article.image_url == "https://u.gg/img/cover.jpg"
+        assert article.pub_date.date().isoformat() == "2024-11-02"
+
+    @pytest.mark.asyncio
+    async def test_known_articles_are_not_enriched(self, scraper: SeleniumScraper) -> None:
+        html = """
+        <article><h2><a href="/news/old">Old</a></h2><p>Old text</p><img src="/old.png"></article>
+        <article><h2><a href="/news/new">New</a></h2><p>New text</p><img src="/new.png"></article>
+        """
+        elements = BeautifulSoup(html, "lxml").find_all("article")
+        old_guid = scraper._generate_guid("https://u.gg/news/old")
+        lookup = AsyncMock(return_value={old_guid})
+        scraper.existing_guids = lookup
+
+        old, new = await scraper._parse_elements(elements)
+
+        assert lookup.await_args.args[0] == {old_guid, scraper._generate_guid(new.url)}
+        assert (old.title, old.description, old.image_url) == ("Old", "", None)
+        assert (new.description, new.image_url) == ("New text", "https://u.gg/new.png")
+
+    @pytest.mark.asyncio
+    async def test_failed_guid_lookup_enriches_everything(self, scraper: SeleniumScraper) -> None:
+        html = '<article><h2><a href="/news/a">A</a></h2><p>Text</p></article>'
+        scraper.existing_guids = AsyncMock(side_effect=RuntimeError("db locked"))
+
+        (article,) = await scraper._parse_elements(BeautifulSoup(html, "lxml").find_all("article"))
+
+        assert article.description == "Text"
+
+    @pytest.mark.parametrize(
+        "style",
+        [
+            "background-image: url('/bg.png')",
+            "background-image: url(/bg.png); color: red",
+        ],
+    )
+    def test_background_image(self, style: str) -> None:
+        img = BeautifulSoup(f'<div style="{style}"></div>', "lxml").div
+
+        assert SeleniumScraper._extract_image(img) == "/bg.png"
+
+    def test_missing_title_is_skipped(self, scraper: SeleniumScraper) -> None:
+        element = BeautifulSoup('<article><a href="/x">Link</a></article>', "lxml").article
+
+        assert scraper.parse_article(element) is None
+
+    def test_core_fields_are_slotted_and_unenriched(self, scraper: SeleniumScraper) -> None:
+        html = '<article><h2><a href="/news/a">A</a></h2><p>Text</p></article>'
+
+        fields = scraper._parse_core(BeautifulSoup(html, "lxml").article)
+
+        assert isinstance(fields, _ParsedFields)
+        assert not hasattr(fields, "__dict__")
+        assert (fields.title, fields.url) == ("A", "https://u.gg/news/a")
+        assert (fields.description, fields.image_url) == ("", None)
+
+
+class TestArticleStrainer:
+    """Tests for limiting page parsing to article subtrees."""
+
+    PAGE = """
+    <html><head><script>var x = 1;</script></head>
+    <body>
+      <nav><a href="/">Home</a></nav>
+      <article data-testid="tweet"><div lang="en">Tweet</div></article>
+      <article data-testid="ad">Ad</article>
+      <div class="container"><div class="message other">Hi</div></div>
+      <div class="messages">Not a message</div>
+      <div data-testid="post-container"><h3>Post</h3></div>
+      <ytd-video-renderer><a id="video-title" href="/v">Video</a></ytd-video-renderer>
+      <section><article>Plain</article><div class="news-item">Item</div></section>
+    </body></html>
+    """
+
+    @pytest.mark.parametrize(
+        "selector",
+        [
+            'article[data-testid="tweet"]',
+            "div[data-testid='post-container']",
+            "ytd-grid-video-renderer, ytd-video-renderer",
+            ".message, .container",
+            "div.message",
+        ],
+    )
+    def test_strained_parse_matches_full_parse(self, selector: str) -> None:
+        strainer = _css_to_strainer(selector)
+        assert strainer is not None
+
+        full = soupsieve.select(selector, BeautifulSoup(self.PAGE, "lxml"))
+        strained = soupsieve.select(selector, BeautifulSoup(self.PAGE, "lxml", parse_only=strainer))
+
+        assert [str(e) for e in strained] == [str(e) for e in full]
+        assert full
+
+    @pytest.mark.parametrize(
+        "selector",
+        ["section > article", "article, .news-item", "a:not(.x)", "[datetime]"],
+    )
+    def test_complex_selectors_parse_the_full_page(self, selector: str) -> None:
+        assert _css_to_strainer(selector) is None
+
+    def test_configured_sources_use_strainers(self) -> None:
+        assert SeleniumScraper._ARTICLE_STRAINERS["twitter"] is not None
+        assert SeleniumScraper._ARTICLE_STRAINERS["u-gg"] is None
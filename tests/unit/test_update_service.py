@@ -5,6 +5,7 @@ This module tests the update service functionality including
 fetching news from multiple sources and saving to database.
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock
 
@@ -19,6 +20,7 @@ def mock_repository() -> AsyncMock:
     """Create a mock repository for testing."""
     repo = AsyncMock()
     repo.save = AsyncMock(return_value=True)
+    repo.save_many = AsyncMock(side_effect=lambda articles: len(articles))
     return repo
 
 
@@ -113,8 +115,8 @@ async def test_update_all_sources_with_duplicates(
         )
     ]
 
-    # Mock repository to return False (duplicate) for some saves
-    mock_repository.save = AsyncMock(side_effect=[True, False])
+    # Mock repository to report the article as a duplicate on the second save
+    mock_repository.save_many = AsyncMock(side_effect=[1, 0])
 
     # Mock API client
     mock_client = AsyncMock()
@@ -132,6 +134,33 @@ async def test_update_all_sources_with_duplicates(
     assert stats["total_duplicates"] == 1
 
 
+@pytest.mark.asyncio
+async def test_update_source_saves_singly_when_batch_save_fails(
+    update_service: UpdateService, mock_repository: AsyncMock
+) -> None:
+    """Test that a failed batch save falls back to saving articles one by one."""
+    mock_articles = [
+        Article(
+            title=f"Test {i}",
+            url=f"http://test.com/{i}",
+            pub_date=datetime.utcnow(),
+            guid=f"test-{i}",
+            source=ArticleSource.create("lol", "en-us"),
+        )
+        for i in range(3)
+    ]
+    mock_repository.save_many = AsyncMock(side_effect=RuntimeError("batch failed"))
+    mock_repository.save = AsyncMock(side_effect=[True, RuntimeError("bad row"), False])
+
+    mock_client = AsyncMock()
+    mock_client.fetch_news = AsyncMock(return_value=mock_articles)
+
+    stats = await update_service._update_source("en-us", mock_client)
+
+    assert stats == {"fetched": 3, "new": 1, "duplicates": 2}
+    assert mock_repository.save.await_count == 3
+
+
 @pytest.mark.asyncio
 async def test_update_all_sources_with_errors(
     update_service: UpdateService, mock_repository: AsyncMock
@@ -170,6 +199,31 @@ async def test_update_all_sources_with_errors(
     assert update_service.error_count == 1
 
 
+@pytest.mark.asyncio
+async def test_update_all_sources_runs_locales_concurrently(
+    update_service: UpdateService,
+) -> None:
+    """Test that locales are fetched concurrently rather than one after another."""
+
+    async def slow_fetch(locale: str) -> list[Article]:
+        await asyncio.sleep(0.1)
+        return []
+
+    for locale in update_service.clients:
+        client = AsyncMock()
+        client.fetch_news = AsyncMock(side_effect=slow_fetch)
+        update_service.clients[locale] = client
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    stats = await update_service.update_all_sources()
+    elapsed = loop.time() - start
+
+    assert elapsed < 0.18
+    assert set(stats["sources"]) == {"en-us", "it-it"}
+    assert stats["errors"] == []
+
+
 @pytest.mark.asyncio
 async def test_get_status(update_service: UpdateService) -> None:
     """Test getting service status."""